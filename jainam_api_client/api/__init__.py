@@ -1,20 +1,46 @@
 """
 API Module Exports for Jainam Lite API SDK
+
+Handler classes are imported on first access (PEP 562), so importing one
+handler does not load the others - in particular ContractMasterAPI, which
+pulls in pandas.
 """
 
-from jainam_api_client.api.auth_api import AuthAPI
-from jainam_api_client.api.order_api import OrderAPI
-from jainam_api_client.api.modify_order_api import ModifyOrderAPI
-from jainam_api_client.api.cancel_order_api import CancelOrderAPI
-from jainam_api_client.api.order_report_api import OrderReportAPI
-from jainam_api_client.api.order_history_api import OrderHistoryAPI
-from jainam_api_client.api.trade_report_api import TradeReportAPI
-from jainam_api_client.api.positions_api import PositionsAPI
-from jainam_api_client.api.holdings_api import HoldingsAPI
-from jainam_api_client.api.funds_api import FundsAPI
-from jainam_api_client.api.margin_api import MarginAPI
-from jainam_api_client.api.profile_api import ProfileAPI
-from jainam_api_client.api.contract_master_api import ContractMasterAPI
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jainam_api_client.api.auth_api import AuthAPI
+    from jainam_api_client.api.order_api import OrderAPI
+    from jainam_api_client.api.modify_order_api import ModifyOrderAPI
+    from jainam_api_client.api.cancel_order_api import CancelOrderAPI
+    from jainam_api_client.api.order_report_api import OrderReportAPI
+    from jainam_api_client.api.order_history_api import OrderHistoryAPI
+    from jainam_api_client.api.trade_report_api import TradeReportAPI
+    from jainam_api_client.api.positions_api import PositionsAPI
+    from jainam_api_client.api.holdings_api import HoldingsAPI
+    from jainam_api_client.api.funds_api import FundsAPI
+    from jainam_api_client.api.margin_api import MarginAPI
+    from jainam_api_client.api.profile_api import ProfileAPI
+    from jainam_api_client.api.contract_master_api import ContractMasterAPI
+    from jainam_api_client.api.batching_order_api import BatchingOrderAPI
+
+_LAZY = {
+    "AuthAPI": "jainam_api_client.api.auth_api",
+    "OrderAPI": "jainam_api_client.api.order_api",
+    "ModifyOrderAPI": "jainam_api_client.api.modify_order_api",
+    "CancelOrderAPI": "jainam_api_client.api.cancel_order_api",
+    "OrderReportAPI": "jainam_api_client.api.order_report_api",
+    "OrderHistoryAPI": "jainam_api_client.api.order_history_api",
+    "TradeReportAPI": "jainam_api_client.api.trade_report_api",
+    "PositionsAPI": "jainam_api_client.api.positions_api",
+    "HoldingsAPI": "jainam_api_client.api.holdings_api",
+    "FundsAPI": "jainam_api_client.api.funds_api",
+    "MarginAPI": "jainam_api_client.api.margin_api",
+    "ProfileAPI": "jainam_api_client.api.profile_api",
+    "ContractMasterAPI": "jainam_api_client.api.contract_master_api",
+    "BatchingOrderAPI": "jainam_api_client.api.batching_order_api",
+}
 
 __all__ = [
     "AuthAPI",
@@ -30,4 +56,20 @@ __all__ = [
     "MarginAPI",
     "ProfileAPI",
     "ContractMasterAPI",
+    "BatchingOrderAPI",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
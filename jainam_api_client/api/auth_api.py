@@ -5,13 +5,16 @@ Handles SSO vendor authentication flow.
 """
 
 import hashlib
-from typing import Dict, Any, Optional
-from urllib.parse import urlparse, parse_qs
+from typing import Dict, Any, Optional, Union
+from urllib.parse import unquote_plus
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
 
 
+_sha256 = hashlib.sha256
+
+
 class AuthAPI:
     """
     Authentication API handler.
@@ -23,6 +26,8 @@ class AuthAPI:
     4. Vendor exchanges checksum for userSession
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize AuthAPI.
@@ -32,20 +37,32 @@ class AuthAPI:
         """
         self.client = client
     
-    def create_checksum(self, user_id: str, auth_code: str, api_secret: str) -> str:
+    def create_checksum(
+        self,
+        user_id: str,
+        auth_code: str,
+        api_secret: Union[str, bytes]
+    ) -> str:
         """
         Create SHA-256 checksum for SSO authentication.
         
         Args:
             user_id: User ID from redirect
             auth_code: Authorization code from redirect
-            api_secret: Your API secret from Jainam developer portal
+            api_secret: Your API secret from Jainam developer portal,
+                optionally pre-encoded as UTF-8 bytes
             
         Returns:
             SHA-256 hex digest of concatenated values
         """
-        data = f"{user_id}{auth_code}{api_secret}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        if isinstance(api_secret, str):
+            api_secret = api_secret.encode()
+        
+        h = _sha256()
+        h.update(user_id.encode())
+        h.update(auth_code.encode())
+        h.update(api_secret)
+        return h.hexdigest()
     
     @staticmethod
     def parse_redirect_url(url: str) -> Dict[str, str]:
@@ -68,28 +85,30 @@ class AuthAPI:
             >>> print(result)
             {'auth_code': 'VBF4V37IN3ON8XMX5IKW', 'user_id': 'AVM04'}
         """
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
+        query = url.partition('?')[2].partition('#')[0]
+        auth_code = user_id = ''
         
-        # Handle both single and comma-separated values (take first)
-        auth_code = params.get('authCode', [''])[0]
-        if ',' in auth_code:
-            auth_code = auth_code.split(',')[0]
-            
-        user_id = params.get('userId', [''])[0]
-        if ',' in user_id:
-            user_id = user_id.split(',')[0]
+        # Single pass over the query; only the two needed values are decoded
+        for part in query.split('&'):
+            key, _, value = part.partition('=')
+            if not value:
+                continue
+            if key == 'authCode' and not auth_code:
+                auth_code = unquote_plus(value)
+            elif key == 'userId' and not user_id:
+                user_id = unquote_plus(value)
         
+        # Handle both single and comma-separated values (take first)
         return {
-            'auth_code': auth_code,
-            'user_id': user_id
+            'auth_code': auth_code.split(',', 1)[0],
+            'user_id': user_id.split(',', 1)[0]
         }
     
     def get_user_session(
         self,
         user_id: str,
         auth_code: str,
-        api_secret: str,
+        api_secret: Union[str, bytes],
         app_code: str
     ) -> Dict[str, Any]:
         """
@@ -101,6 +120,7 @@ class AuthAPI:
             user_id: User ID from redirect callback
             auth_code: Authorization code from redirect callback  
             api_secret: Your API secret from developer portal
+                (str or pre-encoded UTF-8 bytes)
             app_code: Your App Code from developer portal
             
         Returns:
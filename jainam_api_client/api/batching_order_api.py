@@ -0,0 +1,339 @@
+"""
+Batching Order API for Jainam Lite API
+
+Coalesces concurrent order placements into batched requests.
+"""
+
+import asyncio
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from jainam_api_client.async_rest import AsyncRestClient
+from jainam_api_client.api.order_api import OrderAPI
+from jainam_api_client import urls
+from jainam_api_client.exceptions import JainamApiException
+from jainam_api_client.settings import (
+    ORDER_TYPE_LIMIT,
+    ORDER_TYPE_MARKET,
+    ORDER_TYPE_SL,
+    PRODUCT_LONGTERM,
+)
+
+
+# Flush a batch once it holds this many orders...
+DEFAULT_MAX_BATCH = 50
+# ...or this many seconds after its first order arrived
+DEFAULT_MAX_DELAY = 0.005
+
+
+class BatchingOrderAPI:
+    """
+    Order placement handler that batches concurrent orders.
+    
+    The place order endpoint accepts a list of orders. Orders submitted
+    within max_delay seconds of each other (up to max_batch) are sent in
+    one POST over the async client's connection pool, and each caller
+    receives its own entry of the response "result" list, wrapped like a
+    single place_order response.
+    
+    If the batched request fails as a whole, every order in the batch
+    gets the same exception.
+    
+    Use either the async methods from a single event loop, or the sync
+    methods (which run the batcher on a background event loop thread) -
+    not both on one instance.
+    
+    Usage:
+        >>> # From async code
+        >>> batcher = BatchingOrderAPI(async_rest_client)
+        >>> responses = await asyncio.gather(*[
+        ...     batcher.place_order_async("NSE", iid, "BUY", 1, order_type="MARKET")
+        ...     for iid in ("22", "14366", "2885")
+        ... ])
+        >>>
+        >>> # From threads
+        >>> batcher = BatchingOrderAPI(AsyncRestClient())
+        >>> batcher.set_access_token("your_token")
+        >>> batcher.place_limit_order("NSE", "14366", "BUY", 10, "6.3")
+        >>> batcher.close()
+    """
+    
+    __slots__ = (
+        "client",
+        "max_batch",
+        "max_delay",
+        "_queue",
+        "_worker",
+        "_sends",
+        "_loop",
+        "_loop_thread",
+        "_lock",
+    )
+    
+    def __init__(
+        self,
+        client: AsyncRestClient,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Initialize BatchingOrderAPI.
+        
+        Args:
+            client: Async REST client instance
+            max_batch: Maximum number of orders per request
+            max_delay: Seconds to wait for more orders after the first
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        
+        # Created inside the event loop on first order
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Future] = None
+        self._sends: Set[asyncio.Future] = set()
+        
+        # Background loop for the sync methods
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def set_access_token(self, token: str):
+        """
+        Set access token for API authentication.
+        
+        Args:
+            token: JWT access token
+        """
+        self.client.set_access_token(token)
+    
+    # ==================== Async ====================
+    
+    async def place_order_async(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Place an order as part of the next batch.
+        
+        Args:
+            exchange: Exchange code (NSE, BSE, NFO, BFO, MCX, CDS, etc.)
+            instrument_id: Unique instrument identifier from contract master
+            transaction_type: BUY or SELL
+            quantity: Order quantity
+            **options: Other OrderAPI.place_order arguments (product,
+                order_type, price, validity, sl_trigger_price, ...)
+                
+        Returns:
+            Response with this order's brokerOrderId
+        """
+        order = OrderAPI.build_order(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            **options
+        )
+        return await self._submit(order)
+    
+    async def _submit(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue an order and wait for its batch to complete."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.ensure_future(self._flush_loop())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((future, order))
+        return await future
+    
+    async def _flush_loop(self):
+        """Collect queued orders into batches and send them."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Send without blocking collection of the next batch; also
+                # runs when aclose() cancels the worker mid-collection
+                send = asyncio.ensure_future(self._send(batch))
+                self._sends.add(send)
+                send.add_done_callback(self._sends.discard)
+    
+    async def _send(self, batch: List[Tuple[asyncio.Future, Dict[str, Any]]]):
+        """Send one batch and resolve each order's future."""
+        futures = [future for future, _ in batch]
+        orders = [order for _, order in batch]
+        
+        try:
+            response = await self.client.post(
+                urls.PLACE_ORDER,
+                orders,
+                invalidate=urls.BOOK_ENDPOINTS
+            )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # Results are positional, one per submitted order
+        results = response.get("result") or []
+        for i, future in enumerate(futures):
+            if future.done():
+                continue
+            if i < len(results):
+                future.set_result({**response, "result": [results[i]]})
+            else:
+                future.set_exception(JainamApiException(
+                    "No result returned for batched order",
+                    response=response
+                ))
+    
+    async def aclose(self):
+        """Stop the batcher after sending any queued orders."""
+        if self._worker is None:
+            return
+        
+        # Let the worker pick up orders that are already queued
+        while not self._queue.empty():
+            await asyncio.sleep(self.max_delay)
+        
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+        
+        self._queue = None
+        self._worker = None
+    
+    # ==================== Sync ====================
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="jainam-order-batcher",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+        return self._loop
+    
+    def place_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Place an order as part of the next batch, blocking until done.
+        
+        Safe to call from many threads; concurrent calls share batches.
+        Arguments are the same as OrderAPI.place_order.
+        
+        Returns:
+            Response with this order's brokerOrderId
+        """
+        coro = self.place_order_async(
+            exchange, instrument_id, transaction_type, quantity, **options
+        )
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+    
+    def place_market_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str = PRODUCT_LONGTERM,
+    ) -> Dict[str, Any]:
+        """Place a batched market order."""
+        return self.place_order(
+            exchange, instrument_id, transaction_type, quantity,
+            product=product,
+            order_type=ORDER_TYPE_MARKET,
+        )
+    
+    def place_limit_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        price: str,
+        product: str = PRODUCT_LONGTERM,
+    ) -> Dict[str, Any]:
+        """Place a batched limit order."""
+        return self.place_order(
+            exchange, instrument_id, transaction_type, quantity,
+            price=price,
+            product=product,
+            order_type=ORDER_TYPE_LIMIT,
+        )
+    
+    def place_sl_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        price: str,
+        trigger_price: str,
+        product: str = PRODUCT_LONGTERM,
+    ) -> Dict[str, Any]:
+        """Place a batched stop loss order."""
+        return self.place_order(
+            exchange, instrument_id, transaction_type, quantity,
+            price=price,
+            sl_trigger_price=trigger_price,
+            product=product,
+            order_type=ORDER_TYPE_SL,
+        )
+    
+    def close(self):
+        """
+        Flush queued orders and stop the background loop.
+        
+        Also closes the async client's session, which was opened on the
+        background loop.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        
+        if loop is None:
+            return
+        
+        async def shutdown():
+            await self.aclose()
+            await self.client.close()
+        
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
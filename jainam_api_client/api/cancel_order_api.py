@@ -17,6 +17,8 @@ class CancelOrderAPI:
     Only open/pending orders can be cancelled.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize CancelOrderAPI.
@@ -50,4 +52,8 @@ class CancelOrderAPI:
         payload = {
             "brokerOrderId": broker_order_id,
         }
-        return self.client.post(urls.CANCEL_ORDER, payload)
+        return self.client.post(
+            urls.CANCEL_ORDER,
+            payload,
+            invalidate=urls.BOOK_ENDPOINTS
+        )
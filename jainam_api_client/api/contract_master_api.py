@@ -5,14 +5,88 @@ Handles downloading contract/scrip master files.
 """
 
 import io
-import json
+import os
+import shutil
+import tempfile
 import zipfile
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Any, Optional, IO, Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.serialization import loads
+
+
+# Zip archives larger than this are spooled to disk while being read
+ZIP_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Supported exchange codes, with the error hint rendered once
+_VALID_EXCHANGES = frozenset(urls.CONTRACT_URLS)
+_VALID_EXCHANGES_STR = ", ".join(sorted(_VALID_EXCHANGES))
+
+# Upper bound on concurrent contract master downloads
+MAX_DOWNLOAD_WORKERS = 8
+
+# On-disk DataFrame cache (Feather format, requires pyarrow)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "jainam_api"
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+# Characters that make a search_symbol pattern a regular expression
+_REGEX_CHARS = frozenset(".^$*+?{}[]()|\\")
+
+# Bytes inspected to tell newline-delimited records from one JSON document
+JSON_HEAD_SIZE = 64 * 1024
+
+# Incremental JSON parsing for low_memory DataFrame builds
+HAS_IJSON = find_spec("ijson") is not None
+
+# Contract masters are refreshed daily at 08:00 AM IST
+IST = timezone(timedelta(hours=5, minutes=30))
+MASTER_REFRESH_HOUR = 8
+
+
+def _is_ndjson(head: bytes) -> bool:
+    """
+    Check whether a JSON payload is newline-delimited records.
+    
+    True only if the first line is a complete JSON object and another
+    object follows it, so a pretty-printed or single-line document that
+    starts with "{" is not mistaken for records.
+    
+    Args:
+        head: The first bytes of the payload (at least its first line)
+    """
+    first, newline, rest = head.lstrip().partition(b"\n")
+    if not newline or first[:1] != b"{" or rest.lstrip()[:1] != b"{":
+        return False
+    try:
+        return isinstance(loads(first), dict)
+    except ValueError:
+        return False
+
+
+def last_refresh_time(now: Optional[datetime] = None) -> datetime:
+    """
+    Get the most recent contract master refresh time (08:00 AM IST).
+    
+    Args:
+        now: Reference time (default: current time)
+        
+    Returns:
+        Timezone-aware datetime of the last refresh
+    """
+    now = (now or datetime.now(IST)).astimezone(IST)
+    refresh = now.replace(hour=MASTER_REFRESH_HOUR, minute=0, second=0, microsecond=0)
+    if now < refresh:
+        refresh -= timedelta(days=1)
+    return refresh
 
 
 class ContractMasterAPI:
@@ -33,22 +107,49 @@ class ContractMasterAPI:
     - INDICES: Index data
     """
     
-    def __init__(self, client: RestClient):
+    __slots__ = (
+        "client",
+        "cache_dir",
+        "_df_cache",
+        "_symbol_arr",
+        "_exact_idx",
+        "_cache_stamp",
+        "_json_cache",
+    )
+    
+    def __init__(self, client: RestClient, cache_dir: Optional[Path] = None):
         """
         Initialize ContractMasterAPI.
         
         Args:
             client: REST client instance
+            cache_dir: Directory for cached DataFrames
+                (default: ~/.cache/jainam_api)
         """
         self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        
+        # In-memory lookup structures per exchange, built once per refresh
+        self._df_cache: Dict[str, pd.DataFrame] = {}
+        self._symbol_arr: Dict[str, Any] = {}
+        self._exact_idx: Dict[str, Dict[str, int]] = {}
+        self._cache_stamp: Dict[str, datetime] = {}
+        
+        # Parsed JSON per exchange, with the refresh time it was fetched for
+        self._json_cache: Dict[str, Tuple[datetime, Any]] = {}
     
-    def get_contract_master(self, exchange: str) -> Dict[str, Any]:
+    def get_contract_master(self, exchange: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Download contract master JSON for an exchange.
         
+        The parsed data is kept in memory until the next 08:00 AM IST
+        refresh, so repeat calls skip both the download and the JSON
+        decode. The cached object is shared - copy it before modifying.
+        
         Args:
             exchange: Exchange code (lowercase):
                 nse, nfo, bse, bfo, mcx, cds, bcd, indices
+            use_cache: Read from and write to the in-memory cache
                 
         Returns:
             Parsed JSON contract data
@@ -61,16 +162,56 @@ class ContractMasterAPI:
                 {"token": "26009", "symbol": "NIFTY BANK", ...}
             ]
         """
-        exchange = exchange.lower()
-        if exchange not in urls.CONTRACT_URLS:
+        url = self.get_contract_url(exchange)
+        key = exchange.lower()
+        stamp = last_refresh_time()
+        
+        if use_cache:
+            cached = self._json_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+        
+        with self.client.download_stream(url) as raw:
+            data = self.parse_contract_stream(raw)
+        
+        if use_cache:
+            self._json_cache[key] = (stamp, data)
+        return data
+    
+    @staticmethod
+    def get_contract_url(exchange: str) -> str:
+        """
+        Resolve the download URL for an exchange's contract master.
+        
+        Args:
+            exchange: Exchange code (case-insensitive)
+            
+        Returns:
+            Contract master download URL
+            
+        Raises:
+            ValueError: If the exchange is not supported
+        """
+        if not exchange.islower():
+            exchange = exchange.lower()
+        if exchange not in _VALID_EXCHANGES:
             raise ValueError(
                 f"Invalid exchange: {exchange}. "
-                f"Valid options: {list(urls.CONTRACT_URLS.keys())}"
+                f"Valid options: {_VALID_EXCHANGES_STR}"
             )
+        return urls.CONTRACT_URLS[exchange]
+    
+    @staticmethod
+    def parse_contract_master(content: bytes) -> Dict[str, Any]:
+        """
+        Parse a downloaded contract master payload.
         
-        url = urls.CONTRACT_URLS[exchange]
-        content = self.client.download(url)
-        
+        Args:
+            content: Raw download, either a zip archive or plain JSON
+            
+        Returns:
+            Parsed JSON contract data
+        """
         # Content may be zipped
         try:
             # Try to unzip if it's a zip file
@@ -78,23 +219,316 @@ class ContractMasterAPI:
                 # Get the first file in the zip
                 filename = zf.namelist()[0]
                 with zf.open(filename) as f:
-                    return json.load(f)
+                    return loads(f.read())
         except zipfile.BadZipFile:
             # Not a zip file, parse as JSON directly
-            return json.loads(content)
+            return loads(content)
+    
+    @staticmethod
+    def parse_contract_stream(raw: IO[bytes]) -> Dict[str, Any]:
+        """
+        Parse a contract master payload straight from a binary stream.
+        
+        Args:
+            raw: Readable binary stream, e.g. from RestClient.download_stream
+            
+        Returns:
+            Parsed JSON contract data
+        """
+        return loads(ContractMasterAPI.read_contract_stream(raw))
+    
+    @staticmethod
+    def read_contract_stream(raw: IO[bytes]) -> bytes:
+        """
+        Read the JSON document out of a contract master download stream.
+        
+        The first bytes are peeked to tell a zip archive from plain JSON,
+        so the download is never materialised as one bytes object.
+        
+        Args:
+            raw: Readable binary stream, e.g. from RestClient.download_stream
+            
+        Returns:
+            Undecoded JSON bytes
+        """
+        with ContractMasterAPI._open_json_stream(raw) as f:
+            return f.read()
+    
+    @staticmethod
+    @contextmanager
+    def _open_json_stream(raw: IO[bytes]) -> Iterator[IO[bytes]]:
+        """
+        Open the JSON document inside a contract master download stream.
+        
+        Yields a readable stream supporting peek(): the download itself,
+        or the first member of a zip archive. Either is buffered so that
+        peek() can see JSON_HEAD_SIZE bytes.
+        """
+        buf = io.BufferedReader(raw, buffer_size=JSON_HEAD_SIZE)
+        head = buf.peek(4)[:4]
+        
+        if head[:2] != b"PK":
+            yield buf
+            return
+        
+        # ZipFile needs to seek to the central directory at the end of the
+        # archive, which a socket stream cannot do
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as spool:
+            shutil.copyfileobj(buf, spool)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as zf:
+                filename = zf.namelist()[0]
+                with zf.open(filename) as f:
+                    # A zip member's own peek() returns at most 512 bytes
+                    yield io.BufferedReader(f, buffer_size=JSON_HEAD_SIZE)
+    
+    def _download_bytes(self, exchange: str) -> bytes:
+        """Download an exchange's contract master as undecoded JSON bytes."""
+        url = self.get_contract_url(exchange)
+        with self.client.download_stream(url) as raw:
+            return self.read_contract_stream(raw)
+    
+    @staticmethod
+    def _to_dataframe(content: bytes) -> pd.DataFrame:
+        """
+        Build a DataFrame from contract master JSON bytes.
+        
+        Newline-delimited JSON is parsed by pyarrow straight into columnar
+        buffers. pyarrow's reader does not accept a top-level array or a
+        single object such as {"INDICES": [...]}, so those payloads are
+        decoded first.
+        """
+        if HAS_PYARROW and _is_ndjson(content[:JSON_HEAD_SIZE]):
+            import pyarrow as pa
+            import pyarrow.json as paj
+            return paj.read_json(pa.BufferReader(content)).to_pandas()
+        return pd.DataFrame(loads(content))
+    
+    @staticmethod
+    def _stream_dataframe(f: IO[bytes]) -> pd.DataFrame:
+        """
+        Build a DataFrame from a JSON stream without decoding it in one go.
+        
+        Records are parsed one at a time with ijson and appended to
+        per-column lists, so neither the undecoded body nor the full list
+        of record dicts is held in memory. Slower than the default path,
+        but peak memory is much lower for the large F&O masters.
+        
+        Handles the same payloads as _to_dataframe: newline-delimited
+        records, a top-level array of records, and an object of record
+        arrays such as {"INDICES": [...]} (one column per key).
+        """
+        import ijson
+        
+        head = f.peek(JSON_HEAD_SIZE)
+        if _is_ndjson(head):
+            records: Iterable[Dict[str, Any]] = ijson.items(
+                f, "", multiple_values=True, use_float=True
+            )
+        elif head.lstrip()[:1] == b"{":
+            # Like pd.DataFrame(loads(content)), each key's records stay
+            # whole in that key's column, so only the small index masters
+            # take this path
+            return pd.DataFrame(dict(ijson.kvitems(f, "", use_float=True)))
+        else:
+            records = ijson.items(f, "item", use_float=True)
+        
+        columns: Dict[str, List[Any]] = {}
+        for n, record in enumerate(records):
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    # Field first seen in this record: backfill earlier rows
+                    column = columns[key] = [None] * n
+                column.append(value)
+            
+            if len(record) != len(columns):
+                # Record lacks some fields: pad them
+                for column in columns.values():
+                    if len(column) <= n:
+                        column.append(None)
+        
+        return pd.DataFrame(columns)
+    
+    def _cache_path(self, exchange: str) -> Path:
+        """
+        Get the cache file for an exchange's current contract master.
+        
+        Args:
+            exchange: Exchange code
+            
+        Returns:
+            Path like ~/.cache/jainam_api/nse_20240115.feather
+        """
+        stamp = last_refresh_time().strftime("%Y%m%d")
+        return self.cache_dir / f"{exchange.lower()}_{stamp}.feather"
+    
+    def _has_fresh_cache(self, exchange: str) -> bool:
+        """Check for a cache file written after the last 08:00 IST refresh."""
+        if not HAS_PYARROW:
+            return False
+        try:
+            mtime = self._cache_path(exchange).stat().st_mtime
+        except OSError:
+            return False
+        return mtime >= last_refresh_time().timestamp()
+    
+    def _read_cache(self, exchange: str) -> Optional[pd.DataFrame]:
+        """Load a cached DataFrame written after the last 08:00 IST refresh."""
+        if not self._has_fresh_cache(exchange):
+            return None
+        
+        from pyarrow import feather
+        
+        path = self._cache_path(exchange)
+        
+        try:
+            return feather.read_feather(path, memory_map=True)
+        except (OSError, ValueError):
+            return None
     
-    def get_contract_master_df(self, exchange: str) -> pd.DataFrame:
+    def _write_cache(self, exchange: str, df: pd.DataFrame):
+        """Write a DataFrame to the cache, replacing older files for the exchange."""
+        path = self._cache_path(exchange)
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per writer, so concurrent writes of one exchange (threads
+            # or processes) never share a temp file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            os.close(fd)
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            
+            for old in path.parent.glob(f"{exchange.lower()}_*.feather"):
+                if old != path:
+                    # Another writer may have removed it already
+                    old.unlink(missing_ok=True)
+        except (OSError, ValueError, TypeError):
+            # Caching is best-effort; columns pyarrow cannot encode are skipped
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def get_contract_master_df(
+        self,
+        exchange: str,
+        use_cache: bool = True,
+        low_memory: bool = False,
+    ) -> pd.DataFrame:
         """
         Download contract master as pandas DataFrame.
         
+        When pyarrow is installed, the DataFrame is cached on disk in Feather
+        format until the next 08:00 AM IST refresh, so repeat calls skip the
+        download and JSON decode.
+        
         Args:
             exchange: Exchange code (lowercase)
+            use_cache: Read from and write to the on-disk cache
+            low_memory: Parse the download incrementally, one record at a
+                time, instead of decoding it whole. Uses far less memory
+                but is slower (requires pip install "jainam-api-client[stream]")
                 
         Returns:
             DataFrame with contract data
+            
+        Raises:
+            ImportError: If low_memory is True and ijson is not installed
         """
-        data = self.get_contract_master(exchange)
-        return pd.DataFrame(data)
+        if low_memory and not HAS_IJSON:
+            raise ImportError(
+                "ijson is required for low_memory=True. "
+                "Install it with: pip install \"jainam-api-client[stream]\""
+            )
+        
+        use_cache = use_cache and HAS_PYARROW
+        
+        if use_cache:
+            df = self._read_cache(exchange)
+            if df is not None:
+                return df
+        
+        if low_memory:
+            url = self.get_contract_url(exchange)
+            with self.client.download_stream(url) as raw:
+                with self._open_json_stream(raw) as f:
+                    df = self._stream_dataframe(f)
+        else:
+            df = self._to_dataframe(self._download_bytes(exchange))
+        
+        if use_cache:
+            self._write_cache(exchange, df)
+        return df
+    
+    def get_contract_masters(
+        self,
+        exchanges: List[str],
+        use_cache: bool = True,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download contract masters for several exchanges concurrently.
+        
+        Downloads share the client's connection pool and overlap their
+        network transfer, so total time is close to the slowest exchange.
+        
+        Args:
+            exchanges: Exchange codes, e.g. ["nse", "nfo", "bse", "bfo"]
+            use_cache: Read from and write to the on-disk cache
+            
+        Returns:
+            Dictionary mapping each exchange code to its DataFrame
+            
+        Example:
+            >>> masters = contract_master.get_contract_masters(["nse", "nfo"])
+            >>> masters["nfo"].head()
+        """
+        if not exchanges:
+            return {}
+        
+        workers = min(MAX_DOWNLOAD_WORKERS, len(exchanges))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.get_contract_master_df, exchange, use_cache): exchange
+                for exchange in exchanges
+            }
+            return {futures[f]: f.result() for f in as_completed(futures)}
+    
+    def _get_indexed(self, exchange: str) -> Tuple[pd.DataFrame, Any, Dict[str, int]]:
+        """
+        Get the contract master with its symbol lookup structures.
+        
+        Built on first use and kept until the next 08:00 AM IST refresh.
+        
+        Args:
+            exchange: Exchange code
+            
+        Returns:
+            Tuple of (DataFrame, symbol array for substring search,
+            exact symbol -> first row position index)
+        """
+        exchange = exchange.lower()
+        stamp = last_refresh_time()
+        
+        if self._cache_stamp.get(exchange) != stamp:
+            df = self.get_contract_master_df(exchange)
+            
+            if HAS_PYARROW:
+                import pyarrow as pa
+                symbols = pa.array(df['symbol'], type=pa.string(), from_pandas=True)
+            else:
+                symbols = df['symbol'].str.lower()
+            
+            exact_idx: Dict[str, int] = {}
+            for i, sym in enumerate(df['symbol']):
+                exact_idx.setdefault(sym, i)
+            
+            self._df_cache[exchange] = df
+            self._symbol_arr[exchange] = symbols
+            self._exact_idx[exchange] = exact_idx
+            self._cache_stamp[exchange] = stamp
+        
+        return self._df_cache[exchange], self._symbol_arr[exchange], self._exact_idx[exchange]
     
     def search_symbol(
         self,
@@ -109,7 +543,8 @@ class ContractMasterAPI:
         
         Args:
             exchange: Exchange code
-            symbol: Trading symbol to search
+            symbol: Trading symbol to search (case-insensitive regular
+                expression, e.g. "^NIFTY" or "BANK|FIN")
             expiry: Expiry date filter (optional)
             option_type: CE or PE for options (optional)
             strike_price: Strike price filter (optional)
@@ -117,21 +552,34 @@ class ContractMasterAPI:
         Returns:
             DataFrame with matching instruments
         """
-        df = self.get_contract_master_df(exchange)
+        df, symbols, _ = self._get_indexed(exchange)
         
-        # Filter by symbol
-        mask = df['symbol'].str.contains(symbol, case=False, na=False)
+        # Filter by symbol. Plain text (the usual case) takes the fast
+        # substring scan; patterns get pandas' regex search as before
+        if not _REGEX_CHARS.isdisjoint(symbol):
+            mask = df['symbol'].str.contains(symbol, case=False, na=False)
+            rows = np.flatnonzero(mask.to_numpy())
+        elif HAS_PYARROW:
+            import pyarrow.compute as pc
+            mask = pc.match_substring(symbols, symbol, ignore_case=True).fill_null(False)
+            rows = np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+        else:
+            mask = symbols.str.contains(symbol.lower(), regex=False, na=False)
+            rows = np.flatnonzero(mask.to_numpy())
         
+        result = df.take(rows)
+        
+        # Remaining filters only scan the symbol matches
         if expiry:
-            mask &= df['expiry'].str.contains(expiry, case=False, na=False)
+            result = result[result['expiry'].str.contains(expiry, case=False, na=False)]
         
         if option_type:
-            mask &= df['optionType'] == option_type.upper()
+            result = result[result['optionType'] == option_type.upper()]
         
         if strike_price is not None:
-            mask &= df['strikePrice'] == strike_price
+            result = result[result['strikePrice'] == strike_price]
         
-        return df[mask]
+        return result
     
     def get_instrument_token(
         self,
@@ -148,9 +596,24 @@ class ContractMasterAPI:
         Returns:
             Instrument token or None if not found
         """
-        df = self.get_contract_master_df(exchange)
-        matches = df[df['symbol'] == symbol]
+        indexed = self._cache_stamp.get(exchange.lower()) == last_refresh_time()
+        
+        if indexed or self._has_fresh_cache(exchange):
+            df, _, exact_idx = self._get_indexed(exchange)
+            idx = exact_idx.get(symbol)
+            
+            if idx is None:
+                return None
+            row = df.iloc[idx]
+            return str(row.get('token') or row.get('instrumentId'))
         
-        if len(matches) > 0:
-            return str(matches.iloc[0].get('token') or matches.iloc[0].get('instrumentId'))
-        return None
+        # Nothing cached yet: scan the raw records instead of building a DataFrame
+        data = self.get_contract_master(exchange)
+        return next(
+            (
+                str(record.get('token') or record.get('instrumentId'))
+                for record in data
+                if record.get('symbol') == symbol
+            ),
+            None
+        )
@@ -8,6 +8,7 @@ from typing import Dict, Any
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.models import Limits
 
 
 class FundsAPI:
@@ -17,6 +18,8 @@ class FundsAPI:
     Retrieves account balance, margin utilization, and collateral information.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize FundsAPI.
@@ -60,3 +63,18 @@ class FundsAPI:
             }
         """
         return self.client.get(urls.LIMITS)
+    
+    def get_limits_typed(self) -> Limits:
+        """
+        Get account funds and limits as a typed object.
+        
+        Returns:
+            Limits parsed from the first result record
+            
+        Example:
+            >>> funds.get_limits_typed().utilized_margin
+            69.95
+        """
+        response = self.get_limits()
+        result = response.get("result") or [{}]
+        return Limits.from_dict(result[0])
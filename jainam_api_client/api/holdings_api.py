@@ -4,10 +4,17 @@ Holdings API for Jainam Lite API
 Handles retrieving portfolio holdings.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.models import Holding
+
+
+# Endpoints for the documented product types, formatted once at import
+_HOLDING_ENDPOINTS = {
+    pt: urls.HOLDINGS.format(product_type=pt) for pt in ("cnc", "mtf", "mis")
+}
 
 
 class HoldingsAPI:
@@ -17,6 +24,8 @@ class HoldingsAPI:
     Retrieves long-term equity holdings from DEMAT account.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize HoldingsAPI.
@@ -63,5 +72,21 @@ class HoldingsAPI:
                 }]
             }
         """
-        endpoint = urls.HOLDINGS.format(product_type=product_type)
+        endpoint = (
+            _HOLDING_ENDPOINTS.get(product_type)
+            or urls.HOLDINGS.format(product_type=product_type)
+        )
         return self.client.get(endpoint)
+    
+    def get_holdings_typed(self, product_type: str = "cnc") -> List[Holding]:
+        """
+        Get portfolio holdings as typed objects.
+        
+        Args:
+            product_type: Product type filter (cnc, mtf, mis)
+            
+        Returns:
+            List of Holding objects
+        """
+        response = self.get_holdings(product_type)
+        return [Holding.from_dict(h) for h in response.get("result") or []]
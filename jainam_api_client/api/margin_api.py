@@ -4,7 +4,8 @@ Margin API for Jainam Lite API
 Handles calculating margin required for orders.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
@@ -15,6 +16,10 @@ from jainam_api_client.settings import (
 )
 
 
+# Upper bound on concurrent margin requests in check_margin_batch
+MAX_BATCH_WORKERS = 16
+
+
 class MarginAPI:
     """
     Margin API handler.
@@ -22,6 +27,22 @@ class MarginAPI:
     Calculates margin required for placing orders.
     """
     
+    __slots__ = ("client",)
+    
+    # Request body with static defaults; copied per call
+    _PAYLOAD_TEMPLATE = {
+        "exchange": "",
+        "instrumentId": "",
+        "transactionType": "",
+        "quantity": 0,
+        "product": "",
+        "orderComplexity": COMPLEXITY_REGULAR,
+        "orderType": ORDER_TYPE_MARKET,
+        "price": "",
+        "validity": VALIDITY_DAY,
+        "slTriggerPrice": "",
+    }
+    
     def __init__(self, client: RestClient):
         """
         Initialize MarginAPI.
@@ -90,16 +111,49 @@ class MarginAPI:
                 }]
             }
         """
-        payload = {
-            "exchange": exchange,
-            "instrumentId": instrument_id,
-            "transactionType": transaction_type,
-            "quantity": quantity,
-            "product": product,
-            "orderComplexity": order_complexity,
-            "orderType": order_type,
-            "price": price or "",
-            "validity": validity,
-            "slTriggerPrice": sl_trigger_price or "",
-        }
-        return self.client.post(urls.CHECK_MARGIN, payload)
+        payload = self._PAYLOAD_TEMPLATE.copy()
+        payload["exchange"] = exchange
+        payload["instrumentId"] = instrument_id
+        payload["transactionType"] = transaction_type
+        payload["quantity"] = quantity
+        payload["product"] = product
+        if order_complexity != COMPLEXITY_REGULAR:
+            payload["orderComplexity"] = order_complexity
+        if order_type != ORDER_TYPE_MARKET:
+            payload["orderType"] = order_type
+        if price:
+            payload["price"] = price
+        if validity != VALIDITY_DAY:
+            payload["validity"] = validity
+        if sl_trigger_price:
+            payload["slTriggerPrice"] = sl_trigger_price
+        return self.client.post(urls.CHECK_MARGIN, payload, idempotent=True)
+    
+    def check_margin_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Check margin for several orders concurrently.
+        
+        Requests are issued from a thread pool over the client's shared
+        connection pool, so total time is close to the slowest request.
+        
+        Args:
+            orders: List of keyword-argument dicts for check_margin
+            
+        Returns:
+            List of margin responses, in the same order as orders
+            
+        Example:
+            >>> margin.check_margin_batch([
+            ...     {"exchange": "NSE", "instrument_id": "22",
+            ...      "transaction_type": "BUY", "quantity": 1, "product": "INTRADAY"},
+            ...     {"exchange": "NSE", "instrument_id": "2885",
+            ...      "transaction_type": "BUY", "quantity": 1, "product": "INTRADAY"},
+            ... ])
+        """
+        if not orders:
+            return []
+        
+        workers = min(MAX_BATCH_WORKERS, len(orders))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.check_margin, **order) for order in orders]
+            return [f.result() for f in futures]
@@ -25,6 +25,8 @@ class ModifyOrderAPI:
     - Trailing stop loss
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize ModifyOrderAPI.
@@ -80,20 +82,25 @@ class ModifyOrderAPI:
                 }]
             }
         """
-        # Always send all fields per API docs - use empty string for unset values
-        payload = {
-            "brokerOrderId": broker_order_id,
-            "quantity": quantity if quantity is not None else "",
-            "orderType": order_type or "",
-            "price": price or "",
-            "slTriggerPrice": sl_trigger_price or "",
-            "validity": validity or "",
-            "disclosedQuantity": disclosed_quantity or "",
-            "marketProtectionPercent": market_protection_percent or "",
-            "trailingSLAmount": trailing_sl_amount or "",
-        }
+        # Only send fields being changed; unset values are left to the server
+        fields = (
+            ("quantity", quantity),
+            ("orderType", order_type),
+            ("price", price),
+            ("slTriggerPrice", sl_trigger_price),
+            ("validity", validity),
+            ("disclosedQuantity", disclosed_quantity),
+            ("marketProtectionPercent", market_protection_percent),
+            ("trailingSLAmount", trailing_sl_amount),
+        )
+        payload = {"brokerOrderId": broker_order_id}
+        payload.update((key, value) for key, value in fields if value is not None)
         
-        return self.client.post(urls.MODIFY_ORDER, payload)
+        return self.client.post(
+            urls.MODIFY_ORDER,
+            payload,
+            invalidate=urls.BOOK_ENDPOINTS
+        )
     
     def modify_price(
         self,
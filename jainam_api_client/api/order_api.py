@@ -4,6 +4,8 @@ Order Placement API for Jainam Lite API
 Handles placing new orders.
 """
 
+from __future__ import annotations
+
 from typing import Dict, Any, Optional, List
 
 from jainam_api_client.rest import RestClient
@@ -11,6 +13,7 @@ from jainam_api_client import urls
 from jainam_api_client.settings import (
     ORDER_TYPE_LIMIT,
     ORDER_TYPE_MARKET,
+    ORDER_TYPE_SL,
     PRODUCT_LONGTERM,
     COMPLEXITY_REGULAR,
     VALIDITY_DAY,
@@ -27,6 +30,35 @@ class OrderAPI:
     - Various product types (INTRADAY, LONGTERM, MTF)
     """
     
+    __slots__ = ("client",)
+    
+    # Order body fields; optional ones default to ""
+    _KEYS = (
+        "exchange",
+        "instrumentId",
+        "transactionType",
+        "quantity",
+        "product",
+        "orderComplexity",
+        "orderType",
+        "validity",
+        "price",
+        "slTriggerPrice",
+        "trailingSlAmount",
+        "disclosedQuantity",
+        "marketProtectionPercent",
+        "apiOrderSource",
+        "algoId",
+        "orderTag",
+    )
+    
+    # Body for the convenience methods, which only vary a few fields
+    _REGULAR_DAY_ORDER = dict(
+        dict.fromkeys(_KEYS, ""),
+        orderComplexity=COMPLEXITY_REGULAR,
+        validity=VALIDITY_DAY,
+    )
+    
     def __init__(self, client: RestClient):
         """
         Initialize OrderAPI.
@@ -99,27 +131,110 @@ class OrderAPI:
                 }]
             }
         """
-        order_data = {
-            "exchange": exchange,
-            "instrumentId": instrument_id,
-            "transactionType": transaction_type,
-            "quantity": quantity,
-            "product": product,
-            "orderComplexity": order_complexity,
-            "orderType": order_type,
-            "validity": validity,
-            "price": price or "",
-            "slTriggerPrice": sl_trigger_price or "",
-            "trailingSlAmount": trailing_sl_amount or "",
-            "disclosedQuantity": disclosed_quantity if disclosed_quantity else "",
-            "marketProtectionPercent": market_protection_percent or "",
-            "apiOrderSource": api_order_source or "",
-            "algoId": algo_id or "",
-            "orderTag": order_tag or "",
-        }
+        order_data = self.build_order(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            product=product,
+            order_complexity=order_complexity,
+            order_type=order_type,
+            price=price,
+            validity=validity,
+            sl_trigger_price=sl_trigger_price,
+            trailing_sl_amount=trailing_sl_amount,
+            disclosed_quantity=disclosed_quantity,
+            market_protection_percent=market_protection_percent,
+            api_order_source=api_order_source,
+            algo_id=algo_id,
+            order_tag=order_tag,
+        )
         
+        return self._send_order(order_data)
+    
+    def _send_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one order body."""
         # API expects array of orders
-        return self.client.post(urls.PLACE_ORDER, [order_data])
+        return self.client.post(
+            urls.PLACE_ORDER,
+            [order],
+            invalidate=urls.BOOK_ENDPOINTS
+        )
+    
+    def _regular_day_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str,
+        order_type: str,
+    ) -> Dict[str, Any]:
+        """Build a REGULAR/DAY order body without going through place_order."""
+        order = self._REGULAR_DAY_ORDER.copy()
+        order["exchange"] = exchange
+        order["instrumentId"] = instrument_id
+        order["transactionType"] = transaction_type
+        order["quantity"] = quantity
+        order["product"] = product
+        order["orderType"] = order_type
+        return order
+    
+    @staticmethod
+    def build_order(
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str = PRODUCT_LONGTERM,
+        order_complexity: str = COMPLEXITY_REGULAR,
+        order_type: str = ORDER_TYPE_LIMIT,
+        price: Optional[str] = None,
+        validity: str = VALIDITY_DAY,
+        sl_trigger_price: Optional[str] = None,
+        trailing_sl_amount: Optional[str] = None,
+        disclosed_quantity: Optional[int] = None,
+        market_protection_percent: Optional[str] = None,
+        api_order_source: Optional[str] = None,
+        algo_id: Optional[str] = None,
+        order_tag: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the request body for a single order.
+        
+        Takes the same arguments as place_order. The result can be sent on
+        its own or combined with others via place_orders.
+        
+        Returns:
+            Order dictionary in API format
+        """
+        order = dict.fromkeys(OrderAPI._KEYS, "")
+        order["exchange"] = exchange
+        order["instrumentId"] = instrument_id
+        order["transactionType"] = transaction_type
+        order["quantity"] = quantity
+        order["product"] = product
+        order["orderComplexity"] = order_complexity
+        order["orderType"] = order_type
+        order["validity"] = validity
+        
+        if price is not None:
+            order["price"] = price
+        if sl_trigger_price is not None:
+            order["slTriggerPrice"] = sl_trigger_price
+        if trailing_sl_amount is not None:
+            order["trailingSlAmount"] = trailing_sl_amount
+        if disclosed_quantity is not None:
+            order["disclosedQuantity"] = disclosed_quantity
+        if market_protection_percent is not None:
+            order["marketProtectionPercent"] = market_protection_percent
+        if api_order_source is not None:
+            order["apiOrderSource"] = api_order_source
+        if algo_id is not None:
+            order["algoId"] = algo_id
+        if order_tag is not None:
+            order["orderTag"] = order_tag
+        return order
     
     def place_orders(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -134,7 +249,35 @@ class OrderAPI:
         Returns:
             Response with list of brokerOrderIds
         """
-        return self.client.post(urls.PLACE_ORDER, orders)
+        return self.client.post(
+            urls.PLACE_ORDER,
+            orders,
+            invalidate=urls.BOOK_ENDPOINTS
+        )
+    
+    def place_orders_batch(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Place several orders in one request.
+        
+        Like place_orders, but each order is given as place_order keyword
+        arguments and built with build_order.
+        
+        Args:
+            orders: List of place_order keyword-argument dicts
+            
+        Returns:
+            Response whose "result" list holds one entry (brokerOrderId)
+            per order, in the same order as orders
+            
+        Example:
+            >>> order.place_orders_batch([
+            ...     {"exchange": "NFO", "instrument_id": "35001",
+            ...      "transaction_type": "BUY", "quantity": 75, "price": "120"},
+            ...     {"exchange": "NFO", "instrument_id": "35003",
+            ...      "transaction_type": "BUY", "quantity": 75, "price": "95"},
+            ... ])
+        """
+        return self.place_orders([self.build_order(**order) for order in orders])
     
     def place_market_order(
         self,
@@ -157,14 +300,9 @@ class OrderAPI:
         Returns:
             Response with brokerOrderId
         """
-        return self.place_order(
-            exchange=exchange,
-            instrument_id=instrument_id,
-            transaction_type=transaction_type,
-            quantity=quantity,
-            product=product,
-            order_type=ORDER_TYPE_MARKET,
-        )
+        return self._send_order(self._regular_day_order(
+            exchange, instrument_id, transaction_type, quantity, product, ORDER_TYPE_MARKET
+        ))
     
     def place_limit_order(
         self,
@@ -189,15 +327,11 @@ class OrderAPI:
         Returns:
             Response with brokerOrderId
         """
-        return self.place_order(
-            exchange=exchange,
-            instrument_id=instrument_id,
-            transaction_type=transaction_type,
-            quantity=quantity,
-            price=price,
-            product=product,
-            order_type=ORDER_TYPE_LIMIT,
+        order = self._regular_day_order(
+            exchange, instrument_id, transaction_type, quantity, product, ORDER_TYPE_LIMIT
         )
+        order["price"] = price
+        return self._send_order(order)
     
     def place_sl_order(
         self,
@@ -224,13 +358,9 @@ class OrderAPI:
         Returns:
             Response with brokerOrderId
         """
-        return self.place_order(
-            exchange=exchange,
-            instrument_id=instrument_id,
-            transaction_type=transaction_type,
-            quantity=quantity,
-            price=price,
-            sl_trigger_price=trigger_price,
-            product=product,
-            order_type="SL",
+        order = self._regular_day_order(
+            exchange, instrument_id, transaction_type, quantity, product, ORDER_TYPE_SL
         )
+        order["price"] = price
+        order["slTriggerPrice"] = trigger_price
+        return self._send_order(order)
@@ -4,12 +4,19 @@ Order History API for Jainam Lite API
 Handles retrieving order history for specific orders.
 """
 
-from typing import Dict, Any
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
 
 
+# Upper bound on concurrent requests in get_order_histories
+MAX_HISTORY_WORKERS = 16
+
+
 class OrderHistoryAPI:
     """
     Order history API handler.
@@ -17,6 +24,8 @@ class OrderHistoryAPI:
     Retrieves the complete history/audit trail for a specific order.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize OrderHistoryAPI.
@@ -59,4 +68,33 @@ class OrderHistoryAPI:
         payload = {
             "brokerOrderId": broker_order_id,
         }
-        return self.client.post(urls.ORDER_HISTORY, payload)
+        return self.client.post(urls.ORDER_HISTORY, payload, idempotent=True)
+    
+    def get_order_histories(self, broker_order_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get history for several orders concurrently.
+        
+        The endpoint takes one order per call, so requests are issued from
+        a thread pool over the client's shared connection pool and total
+        time is close to the slowest request.
+        
+        Args:
+            broker_order_ids: Order IDs (duplicates are fetched once)
+            
+        Returns:
+            Dict mapping each broker order ID to its history response
+            
+        Example:
+            >>> histories = order_history.get_order_histories(
+            ...     o["brokerOrderId"] for o in order_book["result"]
+            ... )
+            >>> histories["250526000002881"]["result"][0]["orderStatus"]
+            'open'
+        """
+        ids = list(dict.fromkeys(broker_order_ids))
+        if not ids:
+            return {}
+        
+        workers = min(MAX_HISTORY_WORKERS, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ids, executor.map(self.get_order_history, ids)))
@@ -4,10 +4,13 @@ Order Report API for Jainam Lite API
 Handles retrieving order book (all orders).
 """
 
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import Dict, Any, Iterator
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.settings import BOOK_CACHE_TTL
 
 
 class OrderReportAPI:
@@ -17,6 +20,8 @@ class OrderReportAPI:
     Retrieves all orders placed during the trading session.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize OrderReportAPI.
@@ -26,12 +31,17 @@ class OrderReportAPI:
         """
         self.client = client
     
-    def get_order_book(self) -> Dict[str, Any]:
+    def get_order_book(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get all orders (order book).
         
         Returns all orders including open, complete, cancelled, and rejected.
+        Responses are cached briefly to absorb tight polling loops; placing,
+        modifying or cancelling an order through this client clears the cache.
         
+        Args:
+            force_refresh: Skip the 1 second response cache
+            
         Returns:
             Response with list of orders containing:
             - brokerOrderId, exchangeOrderId
@@ -58,4 +68,27 @@ class OrderReportAPI:
                 }]
             }
         """
-        return self.client.get(urls.ORDER_BOOK)
+        return self.client.get(
+            urls.ORDER_BOOK,
+            ttl=BOOK_CACHE_TTL,
+            force_refresh=force_refresh
+        )
+    
+    def iter_orders(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the order book one order at a time.
+        
+        For large books: with ijson installed the response is parsed
+        incrementally instead of building the whole list in memory.
+        Bypasses the response cache.
+        
+        Yields:
+            Order records, as in get_order_book()["result"]
+            
+        Example:
+            >>> open_orders = [
+            ...     o for o in order_report.iter_orders()
+            ...     if o["orderStatus"] == "OPEN"
+            ... ]
+        """
+        return self.client.iter_result(urls.ORDER_BOOK)
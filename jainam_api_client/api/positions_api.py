@@ -4,10 +4,19 @@ Positions API for Jainam Lite API
 Handles retrieving open positions.
 """
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.settings import BOOK_CACHE_TTL
+
+
+# Positions per request and concurrent requests in square_off_chunked
+DEFAULT_SQUARE_OFF_CHUNK_SIZE = 25
+MAX_SQUARE_OFF_WORKERS = 8
 
 
 class PositionsAPI:
@@ -17,6 +26,8 @@ class PositionsAPI:
     Retrieves all open positions including F&O carryforward positions.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize PositionsAPI.
@@ -26,7 +37,7 @@ class PositionsAPI:
         """
         self.client = client
     
-    def get_positions(self) -> Dict[str, Any]:
+    def get_positions(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get all open positions.
         
@@ -35,6 +46,9 @@ class PositionsAPI:
         - Carryforward (overnight) positions
         - F&O positions
         
+        Args:
+            force_refresh: Skip the 1 second response cache
+            
         Returns:
             Response with list of positions containing:
             - instrumentId, tradingSymbol, exchange
@@ -61,7 +75,11 @@ class PositionsAPI:
                 }]
             }
         """
-        return self.client.get(urls.POSITIONS)
+        return self.client.get(
+            urls.POSITIONS,
+            ttl=BOOK_CACHE_TTL,
+            force_refresh=force_refresh
+        )
     
     def square_off(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -92,4 +110,108 @@ class PositionsAPI:
             ...     "validity": "DAY"
             ... }])
         """
-        return self.client.post(urls.SQUARE_OFF, positions)
+        return self.client.post(
+            urls.SQUARE_OFF,
+            positions,
+            invalidate=urls.BOOK_ENDPOINTS
+        )
+    
+    def square_off_chunked(
+        self,
+        positions: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_SQUARE_OFF_CHUNK_SIZE,
+        max_workers: int = MAX_SQUARE_OFF_WORKERS,
+    ) -> Dict[str, Any]:
+        """
+        Square off a large list of positions in concurrent chunks.
+        
+        The list is split into chunks of chunk_size positions, each sent
+        as its own square_off request from a thread pool over the client's
+        shared connection pool. A failed chunk does not stop the others.
+        
+        Args:
+            positions: List of position dictionaries (see square_off)
+            chunk_size: Maximum positions per request
+            max_workers: Maximum concurrent requests
+            
+        Returns:
+            Merged response (see merge_square_off_responses)
+            
+        Example:
+            >>> response = positions.square_off_chunked(all_positions)
+            >>> failed = [c for c in response["chunks"] if c["status"] != "Ok"]
+        """
+        chunks = self.split_positions(positions, chunk_size)
+        if not chunks:
+            return self.merge_square_off_responses([], [])
+        
+        def send(chunk):
+            try:
+                return self.square_off(chunk)
+            except Exception as e:
+                return e
+        
+        workers = min(max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(send, chunks))
+        
+        return self.merge_square_off_responses(chunks, outcomes)
+    
+    @staticmethod
+    def split_positions(
+        positions: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_SQUARE_OFF_CHUNK_SIZE,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Split positions into square-off request chunks.
+        
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        return [positions[i:i + chunk_size] for i in range(0, len(positions), chunk_size)]
+    
+    @staticmethod
+    def merge_square_off_responses(
+        chunks: List[List[Dict[str, Any]]],
+        outcomes: List[Any],
+    ) -> Dict[str, Any]:
+        """
+        Merge per-chunk square-off outcomes into one response.
+        
+        Args:
+            chunks: Position chunks, in submission order
+            outcomes: Response dict or raised exception for each chunk
+            
+        Returns:
+            Response with:
+            - status: "Ok" if every chunk succeeded, else "Not_ok"
+            - message: Summary of failed chunks
+            - result: Concatenated results of successful chunks, in order
+            - chunks: Per-chunk {"start", "count", "status", "response"}
+              or {"start", "count", "status", "error"} entries
+        """
+        result: List[Any] = []
+        summary: List[Dict[str, Any]] = []
+        start = 0
+        
+        for chunk, outcome in zip(chunks, outcomes):
+            entry: Dict[str, Any] = {"start": start, "count": len(chunk)}
+            if isinstance(outcome, Exception):
+                entry["status"] = "Error"
+                entry["error"] = outcome
+            else:
+                entry["status"] = outcome.get("status", "Ok")
+                entry["response"] = outcome
+                result.extend(outcome.get("result") or [])
+            summary.append(entry)
+            start += len(chunk)
+        
+        failed = sum(1 for entry in summary if entry["status"] != "Ok")
+        return {
+            "status": "Not_ok" if failed else "Ok",
+            "message": f"{failed} of {len(summary)} chunks failed" if failed else "Success",
+            "result": result,
+            "chunks": summary,
+        }
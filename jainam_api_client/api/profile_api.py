@@ -4,10 +4,13 @@ Profile API for Jainam Lite API
 Handles retrieving user profile information.
 """
 
+from __future__ import annotations
+
 from typing import Dict, Any
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.settings import PROFILE_CACHE_TTL
 
 
 class ProfileAPI:
@@ -17,6 +20,8 @@ class ProfileAPI:
     Retrieves user/client profile information.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize ProfileAPI.
@@ -26,13 +31,16 @@ class ProfileAPI:
         """
         self.client = client
     
-    def get_profile(self) -> Dict[str, Any]:
+    def get_profile(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get user profile information.
         
         Returns client details and account configuration.
         Note: This does not return authentication tokens.
         
+        Args:
+            force_refresh: Skip the 1 hour response cache
+            
         Returns:
             Response with profile containing:
             - clientId: Unique client identifier
@@ -60,4 +68,8 @@ class ProfileAPI:
                 }
             }
         """
-        return self.client.get(urls.PROFILE)
+        return self.client.get(
+            urls.PROFILE,
+            ttl=PROFILE_CACHE_TTL,
+            force_refresh=force_refresh
+        )
@@ -4,10 +4,13 @@ Trade Report API for Jainam Lite API
 Handles retrieving trade book (executed trades).
 """
 
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import Dict, Any, Iterator
 
 from jainam_api_client.rest import RestClient
 from jainam_api_client import urls
+from jainam_api_client.settings import BOOK_CACHE_TTL
 
 
 class TradeReportAPI:
@@ -17,6 +20,8 @@ class TradeReportAPI:
     Retrieves all executed trades for the trading session.
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: RestClient):
         """
         Initialize TradeReportAPI.
@@ -26,12 +31,15 @@ class TradeReportAPI:
         """
         self.client = client
     
-    def get_trade_book(self) -> Dict[str, Any]:
+    def get_trade_book(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get all executed trades (trade book).
         
         Returns only orders that have been executed (filled).
         
+        Args:
+            force_refresh: Skip the 1 second response cache
+            
         Returns:
             Response with list of trades containing:
             - brokerOrderId, exchangeOrderId, exchangeTradeId
@@ -56,4 +64,27 @@ class TradeReportAPI:
                 }]
             }
         """
-        return self.client.get(urls.TRADE_BOOK)
+        return self.client.get(
+            urls.TRADE_BOOK,
+            ttl=BOOK_CACHE_TTL,
+            force_refresh=force_refresh
+        )
+    
+    def iter_trades(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the trade book one trade at a time.
+        
+        For large books: with ijson installed the response is parsed
+        incrementally instead of building the whole list in memory.
+        Bypasses the response cache.
+        
+        Yields:
+            Trade records, as in get_trade_book()["result"]
+            
+        Example:
+            >>> bought = sum(
+            ...     t["filledQuantity"] for t in trade_report.iter_trades()
+            ...     if t["transactionType"] == "BUY"
+            ... )
+        """
+        return self.client.iter_result(urls.TRADE_BOOK)
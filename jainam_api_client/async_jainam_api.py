@@ -0,0 +1,426 @@
+"""
+Async Jainam Lite API Python SDK
+
+Coroutine-based client for issuing many API calls concurrently.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional, List
+
+from jainam_api_client.async_rest import (
+    AsyncRestClient,
+    DEFAULT_LIMIT,
+    DEFAULT_LIMIT_PER_HOST,
+)
+from jainam_api_client.rest import DEFAULT_CONNECT_TIMEOUT, DEFAULT_TIMEOUT
+from jainam_api_client.jainam_api import extract_session_token
+from jainam_api_client.urls import BASE_URL
+from jainam_api_client.api import (
+    AuthAPI,
+    OrderAPI,
+    ModifyOrderAPI,
+    CancelOrderAPI,
+    OrderReportAPI,
+    OrderHistoryAPI,
+    TradeReportAPI,
+    PositionsAPI,
+    HoldingsAPI,
+    FundsAPI,
+    MarginAPI,
+    ProfileAPI,
+)
+
+
+class AsyncJainamAPI:
+    """
+    Async client for Jainam Lite Trading API.
+    
+    Mirrors JainamAPI with coroutine methods. All calls share a single
+    aiohttp connection pool, so independent requests can be fanned out
+    with asyncio.gather.
+    
+    The API handlers only build request payloads and hand them to their
+    client, so they are reused as-is on top of AsyncRestClient.
+    
+    Usage:
+        >>> import asyncio
+        >>> from jainam_api_client.async_jainam_api import AsyncJainamAPI
+        >>>
+        >>> async def main():
+        ...     async with AsyncJainamAPI(access_token="your_token") as client:
+        ...         margins = await asyncio.gather(*[
+        ...             client.margin_required("NSE", iid, "BUY", 1, "INTRADAY")
+        ...             for iid in ("22", "14366", "2885")
+        ...         ])
+        >>>
+        >>> asyncio.run(main())
+    """
+    
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ):
+        """
+        Initialize async Jainam API client.
+        
+        Args:
+            access_token: Optional JWT access token if already authenticated
+            limit: Maximum number of simultaneous connections
+            limit_per_host: Maximum simultaneous connections per host
+            timeout: Seconds to wait between reads of a response
+            connect_timeout: Seconds to wait for a connection
+        """
+        self._rest_client = AsyncRestClient(
+            BASE_URL,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+        )
+        self._user_id: Optional[str] = None
+        self._session_id: Optional[str] = None
+        
+        # Initialize API handlers
+        self._auth = AuthAPI(self._rest_client)
+        self._order = OrderAPI(self._rest_client)
+        self._modify_order = ModifyOrderAPI(self._rest_client)
+        self._cancel_order = CancelOrderAPI(self._rest_client)
+        self._order_report = OrderReportAPI(self._rest_client)
+        self._order_history = OrderHistoryAPI(self._rest_client)
+        self._trade_report = TradeReportAPI(self._rest_client)
+        self._positions = PositionsAPI(self._rest_client)
+        self._holdings = HoldingsAPI(self._rest_client)
+        self._funds = FundsAPI(self._rest_client)
+        self._margin = MarginAPI(self._rest_client)
+        self._profile = ProfileAPI(self._rest_client)
+        
+        # Set token if provided
+        if access_token:
+            self.set_access_token(access_token)
+    
+    async def __aenter__(self) -> "AsyncJainamAPI":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the shared connection pool."""
+        await self._rest_client.close()
+    
+    # ==================== Authentication ====================
+    
+    async def login_with_sso(
+        self,
+        user_id: str,
+        auth_code: str,
+        api_secret: str,
+        app_code: str
+    ) -> Dict[str, Any]:
+        """
+        Authenticate using SSO vendor flow.
+        
+        Args:
+            user_id: User ID from redirect callback
+            auth_code: Authorization code from redirect callback
+            api_secret: Your API secret from developer portal
+            app_code: Your App Code from developer portal
+            
+        Returns:
+            Response containing userSession token
+        """
+        response = await self._auth.get_user_session(
+            user_id=user_id,
+            auth_code=auth_code,
+            api_secret=api_secret,
+            app_code=app_code
+        )
+        
+        session_token = extract_session_token(response)
+        if session_token:
+            self._user_id = user_id
+            self._session_id = session_token
+            self.set_access_token(session_token)
+        
+        return response
+    
+    def set_access_token(self, token: str):
+        """
+        Set access token for API authentication.
+        
+        Args:
+            token: JWT access token
+        """
+        self._rest_client.set_access_token(token)
+    
+    async def logout(self):
+        """Clear session and close the connection pool."""
+        self._rest_client.clear_token()
+        self._user_id = None
+        self._session_id = None
+        await self.close()
+    
+    # ==================== Order Management ====================
+    
+    async def place_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str = "LONGTERM",
+        order_complexity: str = "REGULAR",
+        order_type: str = "LIMIT",
+        price: Optional[str] = None,
+        validity: str = "DAY",
+        sl_trigger_price: Optional[str] = None,
+        trailing_sl_amount: Optional[str] = None,
+        disclosed_quantity: Optional[int] = None,
+        market_protection_percent: Optional[str] = None,
+        api_order_source: Optional[str] = None,
+        algo_id: Optional[str] = None,
+        order_tag: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Place a new order.
+        
+        See JainamAPI.place_order for argument details.
+        
+        Returns:
+            Response with brokerOrderId
+        """
+        return await self._order.place_order(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            product=product,
+            order_complexity=order_complexity,
+            order_type=order_type,
+            price=price,
+            validity=validity,
+            sl_trigger_price=sl_trigger_price,
+            trailing_sl_amount=trailing_sl_amount,
+            disclosed_quantity=disclosed_quantity,
+            market_protection_percent=market_protection_percent,
+            api_order_source=api_order_source,
+            algo_id=algo_id,
+            order_tag=order_tag,
+        )
+    
+    async def place_market_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str = "LONGTERM",
+    ) -> Dict[str, Any]:
+        """Place a market order."""
+        return await self._order.place_market_order(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            product=product,
+        )
+    
+    async def place_limit_order(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        price: str,
+        product: str = "LONGTERM",
+    ) -> Dict[str, Any]:
+        """Place a limit order."""
+        return await self._order.place_limit_order(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            price=price,
+            product=product,
+        )
+    
+    async def place_orders_batch(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Place several orders in a single request (see JainamAPI.place_orders_batch)."""
+        return await self._order.place_orders_batch(orders)
+    
+    async def modify_order(
+        self,
+        broker_order_id: str,
+        quantity: Optional[int] = None,
+        order_type: Optional[str] = None,
+        price: Optional[str] = None,
+        sl_trigger_price: Optional[str] = None,
+        validity: Optional[str] = None,
+        disclosed_quantity: Optional[str] = None,
+        market_protection_percent: Optional[str] = None,
+        trailing_sl_amount: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Modify an existing order.
+        
+        See JainamAPI.modify_order for argument details.
+        
+        Returns:
+            Response with modification status
+        """
+        return await self._modify_order.modify_order(
+            broker_order_id=broker_order_id,
+            quantity=quantity,
+            order_type=order_type,
+            price=price,
+            sl_trigger_price=sl_trigger_price,
+            validity=validity,
+            disclosed_quantity=disclosed_quantity,
+            market_protection_percent=market_protection_percent,
+            trailing_sl_amount=trailing_sl_amount,
+        )
+    
+    async def cancel_order(self, broker_order_id: str) -> Dict[str, Any]:
+        """Cancel an existing order."""
+        return await self._cancel_order.cancel_order(broker_order_id)
+    
+    # ==================== Order Information ====================
+    
+    async def order_report(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get order book (all orders)."""
+        return await self._order_report.get_order_book(force_refresh)
+    
+    async def order_history(self, broker_order_id: str) -> Dict[str, Any]:
+        """Get order history/audit trail."""
+        return await self._order_history.get_order_history(broker_order_id)
+    
+    async def order_histories(
+        self,
+        broker_order_ids: List[str],
+        max_concurrency: int = 16,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get history for several orders concurrently (see JainamAPI.order_histories)."""
+        ids = list(dict.fromkeys(broker_order_ids))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(broker_order_id):
+            async with semaphore:
+                return await self._order_history.get_order_history(broker_order_id)
+        
+        return dict(zip(ids, await asyncio.gather(*[fetch(i) for i in ids])))
+    
+    async def trade_report(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get trade book (executed trades)."""
+        return await self._trade_report.get_trade_book(force_refresh)
+    
+    # ==================== Portfolio ====================
+    
+    async def positions(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get open positions."""
+        return await self._positions.get_positions(force_refresh)
+    
+    async def square_off(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Square off (close) positions."""
+        return await self._positions.square_off(positions)
+    
+    async def square_off_chunked(
+        self,
+        positions: List[Dict[str, Any]],
+        chunk_size: int = 25,
+        max_concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Square off many positions as concurrent smaller requests.
+        
+        See JainamAPI.square_off_chunked.
+        """
+        chunks = PositionsAPI.split_positions(positions, chunk_size)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def send(chunk):
+            async with semaphore:
+                try:
+                    return await self._positions.square_off(chunk)
+                except Exception as e:
+                    return e
+        
+        outcomes = await asyncio.gather(*[send(chunk) for chunk in chunks])
+        return PositionsAPI.merge_square_off_responses(chunks, outcomes)
+    
+    async def holdings(self, product_type: str = "cnc") -> Dict[str, Any]:
+        """Get portfolio holdings."""
+        return await self._holdings.get_holdings(product_type)
+    
+    # ==================== Account ====================
+    
+    async def limits(self) -> Dict[str, Any]:
+        """Get account funds and limits."""
+        return await self._funds.get_limits()
+    
+    async def profile(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get user profile."""
+        return await self._profile.get_profile(force_refresh)
+    
+    async def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch orders, trades, positions, holdings, limits and profile at once.
+        
+        See JainamAPI.snapshot.
+        """
+        names = ("orders", "trades", "positions", "holdings", "limits", "profile")
+        responses = await asyncio.gather(
+            self._order_report.get_order_book(),
+            self._trade_report.get_trade_book(),
+            self._positions.get_positions(),
+            self._holdings.get_holdings(),
+            self._funds.get_limits(),
+            self._profile.get_profile(),
+        )
+        return dict(zip(names, responses))
+    
+    async def margin_required(
+        self,
+        exchange: str,
+        instrument_id: str,
+        transaction_type: str,
+        quantity: int,
+        product: str,
+        order_type: str = "MARKET",
+        price: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Check margin required for an order."""
+        return await self._margin.check_margin(
+            exchange=exchange,
+            instrument_id=instrument_id,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            product=product,
+            order_type=order_type,
+            price=price,
+        )
+    
+    async def margin_required_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Check margin for several orders concurrently (see JainamAPI.margin_required_batch)."""
+        return await asyncio.gather(*[self._margin.check_margin(**order) for order in orders])
+    
+    # ==================== Market Data ====================
+    
+    async def contract_master(self, exchange: str) -> Dict[str, Any]:
+        """
+        Download contract master for an exchange.
+        
+        Args:
+            exchange: Exchange code (nse, nfo, bse, bfo, mcx, cds, bcd, indices)
+            
+        Returns:
+            Contract master data as JSON
+        """
+        from jainam_api_client.api.contract_master_api import ContractMasterAPI
+        
+        url = ContractMasterAPI.get_contract_url(exchange)
+        content = await self._rest_client.download(url)
+        return ContractMasterAPI.parse_contract_master(content)
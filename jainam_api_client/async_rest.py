@@ -0,0 +1,320 @@
+"""
+Async REST Client for Jainam Lite API
+
+aiohttp-backed counterpart of RestClient for issuing many API calls
+concurrently over one shared connection pool.
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+import aiohttp
+
+from jainam_api_client.urls import BASE_URL
+from jainam_api_client.rest import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    check_response,
+    ResponseCache,
+)
+from jainam_api_client.serialization import dumps, loads
+from jainam_api_client.backoff import Backoff, parse_retry_after
+from jainam_api_client.exceptions import (
+    JainamApiException,
+    JainamNetworkError,
+)
+
+
+# Connection pool defaults
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 30
+DEFAULT_KEEPALIVE_TIMEOUT = 75
+
+
+class AsyncRestClient:
+    """
+    Async HTTP client for making authenticated requests to Jainam API.
+    
+    A single aiohttp.ClientSession is created lazily on first use and kept
+    for the lifetime of the client, so concurrent calls share keep-alive
+    connections. Call close() when done.
+    
+    Exposes the same get/post/download interface as RestClient, returning
+    coroutines instead of results.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        backoff: Optional[Backoff] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ):
+        """
+        Initialize async REST client.
+        
+        Args:
+            base_url: Base URL for API requests
+            limit: Maximum number of simultaneous connections
+            limit_per_host: Maximum simultaneous connections per host
+            keepalive_timeout: Seconds to keep idle connections open
+            backoff: Retry policy for transient API errors (default:
+                Backoff())
+            timeout: Seconds to wait between reads of a response
+            connect_timeout: Seconds to wait for a connection
+        """
+        self.base_url = base_url
+        self.access_token: Optional[str] = None
+        self.headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        # As in RestClient: no overall limit, so large downloads are not
+        # cut off, but a dead host or stalled read fails fast instead of
+        # waiting out aiohttp's 5 minute default
+        self._timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=connect_timeout,
+            sock_read=timeout,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.cache = ResponseCache()
+        # Cacheable GETs currently in flight, shared by concurrent callers
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.backoff = backoff if backoff is not None else Backoff()
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared ClientSession on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return self._session
+    
+    def set_access_token(self, token: str):
+        """
+        Set the access token for authentication.
+        
+        Args:
+            token: JWT access token
+        """
+        self.access_token = token
+        # Bearer prefix is required for Jainam API
+        self.headers["Authorization"] = f"Bearer {token}"
+        # Cached responses belong to the previous session
+        self.cache.invalidate()
+    
+    def clear_token(self):
+        """Clear the access token."""
+        self.access_token = None
+        self.headers.pop("Authorization", None)
+        self.cache.invalidate()
+    
+    async def close(self):
+        """Close the shared session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL for API requests."""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value.rstrip("/")
+        self._urls: Dict[str, str] = {}
+    
+    def _get_url(self, endpoint: str) -> str:
+        """Get the full URL for an endpoint, built once per endpoint."""
+        # Endpoints are a small fixed set, so after the first call of each
+        # this is a single dict hit
+        try:
+            return self._urls[endpoint]
+        except KeyError:
+            url = self._urls[endpoint] = f"{self._base_url}/{endpoint.lstrip('/')}"
+            return url
+    
+    @staticmethod
+    def _handle_response(status: int, body: bytes) -> Dict[str, Any]:
+        """
+        Handle API response.
+        
+        Args:
+            status: HTTP status code
+            body: Raw response body
+            
+        Returns:
+            Parsed JSON response
+            
+        Raises:
+            JainamApiException: If response indicates an error
+        """
+        try:
+            data = loads(body)
+        except ValueError:
+            text = body.decode(errors="replace")
+            raise JainamApiException(
+                f"Invalid JSON response: {text[:500]}",
+                response={"raw": text},
+                status_code=status,
+            )
+        
+        return check_response(status, data)
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a request over the shared session and handle the response.
+        
+        Transient failures are retried per self.backoff (see
+        RestClient._request).
+        """
+        session = await self._ensure_session()
+        url = self._get_url(endpoint)
+        started = time.monotonic()
+        attempt = 0
+        
+        while True:
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=self.headers,
+                    **kwargs
+                ) as response:
+                    body = await response.read()
+                    status = response.status
+                    retry_after = response.headers.get("Retry-After")
+                return self._handle_response(status, body)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = JainamNetworkError(f"Network error: {str(e)}")
+                error.__cause__ = e
+            except JainamApiException as e:
+                error = e
+                error.retry_after = parse_retry_after(retry_after)
+            
+            delay = self.backoff.next_delay(attempt, error, started, idempotent)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        ttl: float = 0,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make GET request.
+        
+        With a ttl, concurrent identical calls share one request
+        (single-flight).
+        
+        Args:
+            endpoint: API endpoint
+            params: Optional query parameters
+            ttl: Seconds to cache the response for (0 disables caching)
+            force_refresh: Skip the cache and any in-flight request and
+                fetch a fresh response
+            
+        Returns:
+            API response data
+        """
+        if ttl <= 0:
+            return await self._request("GET", endpoint, params=params)
+        
+        key = ResponseCache.key(endpoint, params)
+        if not force_refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        # Requests sent before an invalidation are not joined
+        generation = self.cache.generation
+        flight_key = (key, generation)
+        future = None if force_refresh else self._inflight.get(flight_key)
+        if future is not None:
+            # Shielded so one waiter's cancellation doesn't cancel the rest
+            return await asyncio.shield(future)
+        
+        future = self._inflight[flight_key] = asyncio.get_running_loop().create_future()
+        # Mark the exception retrieved even if nobody else was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            data = await self._request("GET", endpoint, params=params)
+            self.cache.set(key, data, ttl, generation)
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
+    
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Any] = None,
+        invalidate: Sequence[str] = (),
+        idempotent: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make POST request.
+        
+        Args:
+            endpoint: API endpoint
+            data: Request body data
+            invalidate: Cached GET endpoints made stale by this request
+            idempotent: Whether the request is a read that is safe to
+                retry on network and server errors
+            
+        Returns:
+            API response data
+        """
+        body = dumps(data) if data is not None else None
+        try:
+            return await self._request("POST", endpoint, idempotent, data=body)
+        finally:
+            if invalidate:
+                self.cache.invalidate(invalidate)
+    
+    async def download(self, url: str) -> bytes:
+        """
+        Download file from URL.
+        
+        Args:
+            url: Full URL to download
+            
+        Returns:
+            File content as bytes
+        """
+        session = await self._ensure_session()
+        try:
+            async with session.get(url, headers=self.headers) as response:
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise JainamNetworkError(f"Download error: {str(e)}")
@@ -0,0 +1,153 @@
+"""
+Retry Backoff for Jainam Lite API
+
+Truncated exponential backoff with jitter for transient API errors.
+"""
+
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from jainam_api_client.exceptions import (
+    JainamApiException,
+    JainamAuthError,
+    JainamNetworkError,
+    JainamRateLimitError,
+    JainamValidationError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# "An error occurred. Please try again later."
+RETRIABLE_ERROR_CODES = frozenset({"EC003"})
+
+
+def is_retriable(error: JainamApiException, idempotent: bool = True) -> bool:
+    """
+    Check whether a failed request may be retried.
+    
+    Rate limit rejections are always retriable, since the server did not
+    act on the request. Network errors, EC003 and HTTP 5xx responses are
+    only retried for idempotent requests - an order POST that timed out
+    may still have been placed. Validation (EC9xx) and auth (EC087)
+    errors are never retried.
+    
+    Args:
+        error: Exception raised for the request
+        idempotent: Whether repeating the request is safe
+        
+    Returns:
+        True if the request should be retried
+    """
+    if isinstance(error, (JainamValidationError, JainamAuthError)):
+        return False
+    if isinstance(error, JainamRateLimitError):
+        return True
+    if not idempotent:
+        return False
+    if isinstance(error, JainamNetworkError) or error.error_code in RETRIABLE_ERROR_CODES:
+        return True
+    return error.status_code is not None and error.status_code >= 500
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+    
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class Backoff:
+    """
+    Truncated exponential backoff with jitter.
+    
+    The delay before retry n (0-based) is
+    min(cap, base * 2**n) * uniform(0.5, 1.5), or the server's Retry-After
+    value when one was sent. Retrying stops after max_attempts requests
+    or once the next sleep would take the total time past budget seconds.
+    
+    Example:
+        >>> client = RestClient(backoff=Backoff(base=0.2, max_attempts=3))
+        >>> client = RestClient(backoff=Backoff(max_attempts=1))  # no retries
+    """
+    
+    __slots__ = ("base", "cap", "max_attempts", "budget")
+    
+    def __init__(
+        self,
+        base: float = 0.1,
+        cap: float = 8.0,
+        max_attempts: int = 5,
+        budget: float = 30.0,
+    ):
+        """
+        Initialize Backoff.
+        
+        Args:
+            base: Delay (seconds) before the first retry, before jitter
+            cap: Maximum delay between attempts, before jitter
+            max_attempts: Maximum number of requests, including the first
+            budget: Maximum seconds to spend on one call, including sleeps
+        """
+        self.base = base
+        self.cap = cap
+        self.max_attempts = max_attempts
+        self.budget = budget
+    
+    def next_delay(
+        self,
+        attempt: int,
+        error: JainamApiException,
+        started: float,
+        idempotent: bool = True,
+    ) -> Optional[float]:
+        """
+        Get the delay before retrying a failed request.
+        
+        Args:
+            attempt: 0-based number of the attempt that failed
+            error: Exception raised for the attempt
+            started: time.monotonic() when the first attempt was sent
+            idempotent: Whether repeating the request is safe
+            
+        Returns:
+            Seconds to sleep before retrying, or None to give up
+        """
+        if attempt + 1 >= self.max_attempts or not is_retriable(error, idempotent):
+            return None
+        
+        if error.retry_after is not None:
+            delay = error.retry_after
+        else:
+            delay = min(self.cap, self.base * 2 ** attempt) * random.uniform(0.5, 1.5)
+        
+        if time.monotonic() - started + delay > self.budget:
+            return None
+        
+        logger.warning(
+            "Retrying request after %s (attempt %d/%d, delay %.3fs)",
+            error, attempt + 1, self.max_attempts, delay,
+            extra={
+                "attempt": attempt + 1,
+                "delay": delay,
+                "error_code": error.error_code,
+                "status_code": error.status_code,
+            },
+        )
+        return delay
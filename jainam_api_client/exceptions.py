@@ -4,16 +4,39 @@ Custom Exceptions for Jainam Lite API SDK
 Error codes mapped from Jainam API documentation.
 """
 
+from types import MappingProxyType
+
 
 class JainamApiException(Exception):
     """Base exception for all Jainam API errors."""
     
-    def __init__(self, message: str, error_code: str = None, response: dict = None):
+    # Declares the error attributes; BaseException instances keep a
+    # __dict__ regardless, so this does not make them smaller
+    __slots__ = ("message", "error_code", "response", "status_code", "retry_after")
+    
+    def __init__(
+        self,
+        message: str,
+        error_code: str = None,
+        response: dict = None,
+        status_code: int = None,
+    ):
         self.message = message
         self.error_code = error_code
         self.response = response
+        self.status_code = status_code
+        # Seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = None
         super().__init__(self.message)
     
+    def __reduce__(self):
+        # Slots are not part of the default exception pickle state
+        return (
+            self.__class__,
+            (self.message, self.error_code, self.response, self.status_code),
+            {"retry_after": self.retry_after},
+        )
+    
     def __str__(self):
         if self.error_code:
             return f"[{self.error_code}] {self.message}"
@@ -22,31 +45,31 @@ class JainamApiException(Exception):
 
 class JainamAuthError(JainamApiException):
     """Authentication or session related errors."""
-    pass
+    __slots__ = ()
 
 
 class JainamOrderError(JainamApiException):
     """Order placement, modification, or cancellation errors."""
-    pass
+    __slots__ = ()
 
 
 class JainamValidationError(JainamApiException):
     """Input validation errors."""
-    pass
+    __slots__ = ()
 
 
 class JainamNetworkError(JainamApiException):
     """Network or connection errors."""
-    pass
+    __slots__ = ()
 
 
 class JainamRateLimitError(JainamApiException):
     """Rate limit exceeded error."""
-    pass
+    __slots__ = ()
 
 
 # Error code to message mapping from Jainam API documentation
-ERROR_CODES = {
+ERROR_CODES = MappingProxyType({
     "EC003": "An error occurred. Please try again later.",
     "EC087": "Session Expired",
     "EC088": "Single order slicing limit exceeded",
@@ -171,20 +194,44 @@ ERROR_CODES = {
     "EC090": "'exchange' should be one of the following values: { 'NSE', 'BSE', 'MCX', 'NFO', 'BFO'}.",
     "EC091": "'orderComplexity' should be one of the following values: {'REGULAR', 'AMO'}.",
     "EC092": "'product' should be one of the following values: {'INTRADAY', 'LONGTERM', 'MTF'}.",
-}
+})
+
+# Order-related error codes
+ORDER_ERROR_CODES = ("EC912", "EC937", "EC992", "EC993", "EC997", "EC999")
 
 
 def get_error_message(error_code: str) -> str:
     """Get human-readable error message for an error code."""
-    return ERROR_CODES.get(error_code, f"Unknown error: {error_code}")
+    message = ERROR_CODES.get(error_code)
+    if message is None:
+        # Only format the fallback for undocumented codes
+        return f"Unknown error: {error_code}"
+    return message
+
+
+def _error_class(error_code: str) -> type:
+    """Determine the exception type for an error code."""
+    if error_code == "EC087":
+        return JainamAuthError
+    elif error_code and error_code.startswith("EC9"):
+        # EC9xx are validation errors
+        return JainamValidationError
+    elif error_code in ORDER_ERROR_CODES:
+        return JainamOrderError
+    return JainamApiException
+
+
+# Exception type for every documented error code, resolved once at import
+_ERROR_CLASSES = {code: _error_class(code) for code in ERROR_CODES}
 
 
-def raise_from_response(response: dict):
+def raise_from_response(response: dict, status_code: int = None):
     """
     Raise appropriate exception based on API response.
     
     Args:
         response: API response dictionary
+        status_code: HTTP status code of the response, if known
         
     Raises:
         JainamApiException or subclass based on error type
@@ -195,14 +242,6 @@ def raise_from_response(response: dict):
     error_code = response.get("errorCode") or response.get("error_code")
     message = response.get("message") or get_error_message(error_code)
     
-    # Determine exception type based on error code
-    if error_code == "EC087":
-        raise JainamAuthError(message, error_code, response)
-    elif error_code and error_code.startswith("EC9"):
-        # EC9xx are validation errors
-        raise JainamValidationError(message, error_code, response)
-    elif error_code in ("EC912", "EC937", "EC992", "EC993", "EC997", "EC999"):
-        # Order-related errors
-        raise JainamOrderError(message, error_code, response)
-    else:
-        raise JainamApiException(message, error_code, response)
+    # Undocumented codes fall back to classifying by prefix
+    error_class = _ERROR_CLASSES.get(error_code) or _error_class(error_code)
+    raise error_class(message, error_code, response, status_code)
@@ -4,26 +4,43 @@ Jainam Lite API Python SDK
 Main API client class that provides access to all Jainam trading API endpoints.
 """
 
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Union
 
-from jainam_api_client.rest import RestClient
+from jainam_api_client.rest import (
+    RestClient,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
 from jainam_api_client.urls import BASE_URL
 from jainam_api_client.websocket import JainamWebSocket
-from jainam_api_client.api import (
-    AuthAPI,
-    OrderAPI,
-    ModifyOrderAPI,
-    CancelOrderAPI,
-    OrderReportAPI,
-    OrderHistoryAPI,
-    TradeReportAPI,
-    PositionsAPI,
-    HoldingsAPI,
-    FundsAPI,
-    MarginAPI,
-    ProfileAPI,
-    ContractMasterAPI,
-)
+from jainam_api_client.models import Limits, Holding
+from jainam_api_client.settings import WS_CONNECT_TIMEOUT
+from jainam_api_client import api as _api
+
+
+def extract_session_token(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the session token from an SSO login response.
+    
+    Args:
+        response: Response from AuthAPI.get_user_session
+        
+    Returns:
+        Session token, or None if login did not succeed
+    """
+    if response.get("status") != "Ok":
+        return None
+    
+    # The result is a one-element list, or a bare object on older servers
+    result = response.get("result")
+    if type(result) is list:
+        result = result[0] if result else None
+    if not result:
+        return None
+    
+    # API returns accessToken (not userSession)
+    return result.get("accessToken") or result.get("userSession")
 
 
 class JainamAPI:
@@ -70,33 +87,36 @@ class JainamAPI:
         >>> positions = client.positions()
     """
     
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        backend: str = "requests",
+        warmup: bool = False,
+    ):
         """
         Initialize Jainam API client.
         
         Args:
             access_token: Optional JWT access token if already authenticated
-        """
-        self._rest_client = RestClient(BASE_URL)
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections per host
+            backend: HTTP library, "requests" or "httpx" (HTTP/2)
+            warmup: Connect to the API host in the background right away,
+                so the first order doesn't pay the TLS handshake
+        """
+        self._rest_client = RestClient(
+            BASE_URL,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            backend=backend,
+            warmup=warmup,
+        )
         self._user_id: Optional[str] = None
         self._session_id: Optional[str] = None
         self._websocket: Optional[JainamWebSocket] = None
         
-        # Initialize API handlers
-        self._auth = AuthAPI(self._rest_client)
-        self._order = OrderAPI(self._rest_client)
-        self._modify_order = ModifyOrderAPI(self._rest_client)
-        self._cancel_order = CancelOrderAPI(self._rest_client)
-        self._order_report = OrderReportAPI(self._rest_client)
-        self._order_history = OrderHistoryAPI(self._rest_client)
-        self._trade_report = TradeReportAPI(self._rest_client)
-        self._positions = PositionsAPI(self._rest_client)
-        self._holdings = HoldingsAPI(self._rest_client)
-        self._funds = FundsAPI(self._rest_client)
-        self._margin = MarginAPI(self._rest_client)
-        self._profile = ProfileAPI(self._rest_client)
-        self._contract_master = ContractMasterAPI(self._rest_client)
-        
         # WebSocket callbacks
         self.on_message = None
         self.on_error = None
@@ -107,13 +127,54 @@ class JainamAPI:
         if access_token:
             self.set_access_token(access_token)
     
+    # API handlers, created on first use (see __getattr__)
+    _HANDLERS = {
+        "_auth": "AuthAPI",
+        "_order": "OrderAPI",
+        "_modify_order": "ModifyOrderAPI",
+        "_cancel_order": "CancelOrderAPI",
+        "_order_report": "OrderReportAPI",
+        "_order_history": "OrderHistoryAPI",
+        "_trade_report": "TradeReportAPI",
+        "_positions": "PositionsAPI",
+        "_holdings": "HoldingsAPI",
+        "_funds": "FundsAPI",
+        "_margin": "MarginAPI",
+        "_profile": "ProfileAPI",
+        "_contract_master": "ContractMasterAPI",
+    }
+    
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. once per handler:
+        # the instance is stored so later accesses skip this method.
+        # Handler modules (and pandas, for ContractMasterAPI) are
+        # imported here rather than when the client is created.
+        cls_name = self._HANDLERS.get(name)
+        if cls_name is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        handler = getattr(_api, cls_name)(self._rest_client)
+        setattr(self, name, handler)
+        return handler
+    
+    def __enter__(self) -> "JainamAPI":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Disconnect WebSocket and close the shared connection pool."""
+        self._drop_websocket()
+        self._rest_client.close()
+    
     # ==================== Authentication ====================
     
     def login_with_sso(
         self,
         user_id: str,
         auth_code: str,
-        api_secret: str,
+        api_secret: Union[str, bytes],
         app_code: str
     ) -> Dict[str, Any]:
         """
@@ -139,17 +200,11 @@ class JainamAPI:
         )
         
         # Extract and set session token
-        if response.get("status") == "Ok":
-            result = response.get("result", {})
-            if isinstance(result, list) and len(result) > 0:
-                result = result[0]
-            
-            # API returns accessToken (not userSession)
-            session_token = result.get("accessToken") or result.get("userSession")
-            if session_token:
-                self._user_id = user_id
-                self._session_id = session_token
-                self.set_access_token(session_token)
+        session_token = extract_session_token(response)
+        if session_token:
+            self._user_id = user_id
+            self._session_id = session_token
+            self.set_access_token(session_token)
         
         return response
     
@@ -163,14 +218,19 @@ class JainamAPI:
         self._rest_client.set_access_token(token)
     
     def logout(self):
-        """Clear session and disconnect WebSocket."""
+        """Clear session, disconnect WebSocket and drop pooled connections."""
         self._rest_client.clear_token()
+        self._rest_client.release_connections()
         self._user_id = None
         self._session_id = None
-        
-        if self._websocket:
-            self._websocket.disconnect()
-            self._websocket = None
+        self._drop_websocket()
+    
+    def _drop_websocket(self):
+        """Detach the WebSocket, then disconnect it."""
+        # Swap first so other threads never see a half-closed socket
+        ws, self._websocket = self._websocket, None
+        if ws:
+            ws.disconnect()
     
     # ==================== Order Management ====================
     
@@ -272,6 +332,18 @@ class JainamAPI:
             product=product,
         )
     
+    def place_orders_batch(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Place several orders in a single request.
+        
+        Args:
+            orders: List of place_order keyword-argument dicts
+            
+        Returns:
+            Response with one brokerOrderId per order, in input order
+        """
+        return self._order.place_orders_batch(orders)
+    
     def modify_order(
         self,
         broker_order_id: str,
@@ -327,14 +399,26 @@ class JainamAPI:
     
     # ==================== Order Information ====================
     
-    def order_report(self) -> Dict[str, Any]:
+    def order_report(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get order book (all orders).
         
+        Args:
+            force_refresh: Bypass the short-lived response cache
+            
         Returns:
             Response with list of orders
         """
-        return self._order_report.get_order_book()
+        return self._order_report.get_order_book(force_refresh)
+    
+    def iter_orders(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the order book without loading it all at once.
+        
+        Yields:
+            Order records
+        """
+        return self._order_report.iter_orders()
     
     def order_history(self, broker_order_id: str) -> Dict[str, Any]:
         """
@@ -348,25 +432,52 @@ class JainamAPI:
         """
         return self._order_history.get_order_history(broker_order_id)
     
-    def trade_report(self) -> Dict[str, Any]:
+    def order_histories(self, broker_order_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get history for several orders in parallel.
+        
+        Args:
+            broker_order_ids: Order IDs
+            
+        Returns:
+            Dict mapping each order ID to its history response
+        """
+        return self._order_history.get_order_histories(broker_order_ids)
+    
+    def trade_report(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get trade book (executed trades).
         
+        Args:
+            force_refresh: Bypass the short-lived response cache
+            
         Returns:
             Response with list of trades
         """
-        return self._trade_report.get_trade_book()
+        return self._trade_report.get_trade_book(force_refresh)
+    
+    def iter_trades(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the trade book without loading it all at once.
+        
+        Yields:
+            Trade records
+        """
+        return self._trade_report.iter_trades()
     
     # ==================== Portfolio ====================
     
-    def positions(self) -> Dict[str, Any]:
+    def positions(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get open positions.
         
+        Args:
+            force_refresh: Bypass the short-lived response cache
+            
         Returns:
             Response with list of positions
         """
-        return self._positions.get_positions()
+        return self._positions.get_positions(force_refresh)
     
     def square_off(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -380,6 +491,25 @@ class JainamAPI:
         """
         return self._positions.square_off(positions)
     
+    def square_off_chunked(
+        self,
+        positions: List[Dict[str, Any]],
+        chunk_size: int = 25,
+        max_workers: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Square off many positions as concurrent smaller requests.
+        
+        Args:
+            positions: List of position orders
+            chunk_size: Maximum positions per request
+            max_workers: Maximum concurrent requests
+            
+        Returns:
+            Merged response with per-chunk status under "chunks"
+        """
+        return self._positions.square_off_chunked(positions, chunk_size, max_workers)
+    
     def holdings(self, product_type: str = "cnc") -> Dict[str, Any]:
         """
         Get portfolio holdings.
@@ -392,6 +522,18 @@ class JainamAPI:
         """
         return self._holdings.get_holdings(product_type)
     
+    def holdings_typed(self, product_type: str = "cnc") -> List[Holding]:
+        """
+        Get portfolio holdings as typed Holding objects.
+        
+        Args:
+            product_type: "cnc" (LONGTERM), "mtf", or "mis" (INTRADAY)
+            
+        Returns:
+            List of Holding objects
+        """
+        return self._holdings.get_holdings_typed(product_type)
+    
     # ==================== Account ====================
     
     def limits(self) -> Dict[str, Any]:
@@ -403,14 +545,53 @@ class JainamAPI:
         """
         return self._funds.get_limits()
     
-    def profile(self) -> Dict[str, Any]:
+    def limits_typed(self) -> Limits:
+        """
+        Get account funds and limits as a typed Limits object.
+        
+        Returns:
+            Limits with attribute access (e.g. limits.opening_cash_limit)
+        """
+        return self._funds.get_limits_typed()
+    
+    def profile(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get user profile.
         
+        Args:
+            force_refresh: Bypass the short-lived response cache
+            
         Returns:
             Response with profile details
         """
-        return self._profile.get_profile()
+        return self._profile.get_profile(force_refresh)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch orders, trades, positions, holdings, limits and profile at once.
+        
+        The six independent requests run in parallel over the shared
+        connection pool, so this takes about as long as the slowest one.
+        
+        Returns:
+            Dict with "orders", "trades", "positions", "holdings" (CNC),
+            "limits" and "profile" responses
+            
+        Example:
+            >>> snap = client.snapshot()
+            >>> snap["positions"]["result"]
+        """
+        calls = {
+            "orders": self._order_report.get_order_book,
+            "trades": self._trade_report.get_trade_book,
+            "positions": self._positions.get_positions,
+            "holdings": self._holdings.get_holdings,
+            "limits": self._funds.get_limits,
+            "profile": self._profile.get_profile,
+        }
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+            return {name: future.result() for name, future in futures.items()}
     
     def margin_required(
         self,
@@ -447,19 +628,46 @@ class JainamAPI:
             price=price,
         )
     
+    def margin_required_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Check margin required for several orders in parallel.
+        
+        Args:
+            orders: List of margin_required keyword-argument dicts
+                (exchange, instrument_id, transaction_type, quantity,
+                product, order_type, price)
+            
+        Returns:
+            List of margin responses, in the same order as orders
+        """
+        return self._margin.check_margin_batch(orders)
+    
     # ==================== Market Data ====================
     
-    def contract_master(self, exchange: str) -> Dict[str, Any]:
+    def contract_master(self, exchange: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Download contract master for an exchange.
         
         Args:
             exchange: Exchange code (nse, nfo, bse, bfo, mcx, cds, bcd, indices)
+            use_cache: Reuse the data parsed earlier today (default True)
             
         Returns:
             Contract master data as JSON
         """
-        return self._contract_master.get_contract_master(exchange)
+        return self._contract_master.get_contract_master(exchange, use_cache=use_cache)
+    
+    def contract_masters(self, exchanges: List[str]) -> Dict[str, Any]:
+        """
+        Download contract masters for several exchanges in parallel.
+        
+        Args:
+            exchanges: Exchange codes, e.g. ["nse", "nfo", "bse", "bfo"]
+            
+        Returns:
+            Dictionary mapping each exchange code to a DataFrame
+        """
+        return self._contract_master.get_contract_masters(exchanges)
     
     def search_symbol(
         self,
@@ -502,10 +710,50 @@ class JainamAPI:
             token=self._session_id
         )
     
+    def connect_websocket(self, timeout: float = WS_CONNECT_TIMEOUT) -> JainamWebSocket:
+        """
+        Open the market data WebSocket, if not already open.
+        
+        Called by subscribe() on first use. Call it right after login to
+        have the connection ready before the first subscription.
+        
+        Args:
+            timeout: Seconds to wait for the server to accept the session
+            
+        Returns:
+            The connected JainamWebSocket
+            
+        Raises:
+            Exception: If not authenticated
+        """
+        ws = self._websocket
+        if ws:
+            return ws
+        
+        if not self._user_id or not self._session_id:
+            raise Exception("Not authenticated. Call login_with_sso first.")
+        
+        # Create WebSocket and set callbacks
+        ws = JainamWebSocket(
+            user_id=self._user_id,
+            session_id=self._session_id
+        )
+        ws.on_message = self.on_message
+        ws.on_error = self.on_error
+        ws.on_close = self.on_close
+        ws.on_open = self.on_open
+        
+        # Connect and wait for the server to accept the session
+        self._websocket = ws
+        ws.connect()
+        ws.wait_connected(timeout=timeout)
+        return ws
+    
     def subscribe(
         self,
         instruments: List[Dict[str, str]],
-        is_depth: bool = False
+        is_depth: bool = False,
+        coalesce_ms: float = 0,
     ):
         """
         Subscribe to market data via WebSocket.
@@ -513,6 +761,8 @@ class JainamAPI:
         Args:
             instruments: List of dicts with 'exchange' and 'token' keys
             is_depth: If True, subscribe to depth data
+            coalesce_ms: If > 0, batch with other subscribe calls made
+                within this many milliseconds into one WebSocket frame
             
         Example:
             >>> client.on_message = lambda msg: print(msg)
@@ -521,31 +771,9 @@ class JainamAPI:
             ...     {"exchange": "NFO", "token": "54957"}
             ... ])
         """
-        if not self._websocket:
-            if not self._user_id or not self._session_id:
-                raise Exception("Not authenticated. Call login_with_sso first.")
-            
-            # Create WebSocket and set callbacks
-            self._websocket = JainamWebSocket(
-                user_id=self._user_id,
-                session_id=self._session_id
-            )
-            self._websocket.on_message = self.on_message
-            self._websocket.on_error = self.on_error
-            self._websocket.on_close = self.on_close
-            self._websocket.on_open = self.on_open
-            
-            # Connect
-            self._websocket.connect()
-            
-            # Wait for connection
-            import time
-            for _ in range(10):
-                if self._websocket.connected:
-                    break
-                time.sleep(0.5)
-        
-        self._websocket.subscribe(instruments, is_depth=is_depth)
+        self.connect_websocket().subscribe(
+            instruments, is_depth=is_depth, coalesce_ms=coalesce_ms
+        )
     
     def unsubscribe(
         self,
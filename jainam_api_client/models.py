@@ -0,0 +1,156 @@
+"""
+Typed Response Models for Jainam Lite API
+
+Lightweight read-only views over API response records, for code that
+reads the same fields repeatedly (e.g. strategy polling loops).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+
+def _float(value: Any) -> float:
+    """Convert a numeric API field (number, numeric string or empty) to float."""
+    return float(value) if value not in (None, "") else 0.0
+
+
+def _int(value: Any) -> int:
+    """Convert a quantity API field (number, numeric string or empty) to int."""
+    return int(float(value)) if value not in (None, "") else 0
+
+
+@dataclass(frozen=True)
+class Limits:
+    """
+    Account funds and limits.
+    
+    Built from one record of the limits response.
+    
+    Example:
+        >>> limits = funds.get_limits_typed()
+        >>> limits.opening_cash_limit
+        52926.4
+    """
+    
+    __slots__ = (
+        "trading_limit",
+        "opening_cash_limit",
+        "intraday_payin",
+        "collateral_margin",
+        "credit_for_sell",
+        "adhoc_margin",
+        "utilized_margin",
+        "blocked_for_payout",
+        "utilized_span_margin",
+        "utilized_exposure_margin",
+    )
+    
+    trading_limit: float
+    opening_cash_limit: float
+    intraday_payin: float
+    collateral_margin: float
+    credit_for_sell: float
+    adhoc_margin: float
+    utilized_margin: float
+    blocked_for_payout: float
+    utilized_span_margin: float
+    utilized_exposure_margin: float
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Limits":
+        """
+        Build from a limits response record.
+        
+        Args:
+            data: One entry of the response "result" list
+            
+        Returns:
+            Limits instance (missing fields default to 0.0)
+        """
+        get = data.get
+        return cls(
+            trading_limit=_float(get("tradingLimit")),
+            opening_cash_limit=_float(get("openingCashLimit")),
+            intraday_payin=_float(get("intradayPayin")),
+            collateral_margin=_float(get("collateralMargin")),
+            credit_for_sell=_float(get("creditForSell")),
+            adhoc_margin=_float(get("adhocMargin")),
+            utilized_margin=_float(get("utilizedMargin")),
+            blocked_for_payout=_float(get("blockedForPayout")),
+            utilized_span_margin=_float(get("utilizedSpanMargin")),
+            utilized_exposure_margin=_float(get("utilizedExposureMargin")),
+        )
+
+
+@dataclass(frozen=True)
+class Holding:
+    """
+    A single portfolio holding.
+    
+    Built from one record of the holdings response.
+    
+    Example:
+        >>> for h in holdings.get_holdings_typed():
+        ...     print(h.formatted_instrument_name, h.total_quantity)
+    """
+    
+    __slots__ = (
+        "isin",
+        "nse_instrument_id",
+        "bse_instrument_id",
+        "nse_trading_symbol",
+        "bse_trading_symbol",
+        "formatted_instrument_name",
+        "product",
+        "previous_day_close",
+        "average_traded_price",
+        "total_quantity",
+        "dp_quantity",
+        "t1_quantity",
+        "collateral_quantity",
+        "authorized_quantity",
+    )
+    
+    isin: str
+    nse_instrument_id: Optional[str]
+    bse_instrument_id: Optional[str]
+    nse_trading_symbol: Optional[str]
+    bse_trading_symbol: Optional[str]
+    formatted_instrument_name: str
+    product: str
+    previous_day_close: float
+    average_traded_price: float
+    total_quantity: int
+    dp_quantity: int
+    t1_quantity: int
+    collateral_quantity: int
+    authorized_quantity: int
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Holding":
+        """
+        Build from a holdings response record.
+        
+        Args:
+            data: One entry of the response "result" list
+            
+        Returns:
+            Holding instance
+        """
+        get = data.get
+        return cls(
+            isin=get("isin", ""),
+            nse_instrument_id=get("nseInstrumentId"),
+            bse_instrument_id=get("bseInstrumentId"),
+            nse_trading_symbol=get("nseTradingSymbol"),
+            bse_trading_symbol=get("bseTradingSymbol"),
+            formatted_instrument_name=get("formattedInstrumentName", ""),
+            product=get("product", ""),
+            previous_day_close=_float(get("previousDayClose")),
+            average_traded_price=_float(get("averageTradedPrice")),
+            total_quantity=_int(get("totalQuantity")),
+            dp_quantity=_int(get("dpQuantity")),
+            t1_quantity=_int(get("t1Quantity")),
+            collateral_quantity=_int(get("collateralQuantity")),
+            authorized_quantity=_int(get("authorizedQuantity")),
+        )
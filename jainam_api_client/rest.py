@@ -4,16 +4,280 @@ REST Client for Jainam Lite API
 Handles HTTP requests with JWT token authentication.
 """
 
+import hashlib
+import io
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Optional, Dict, Any, IO, Iterator, Sequence, Tuple
+
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-from jainam_api_client.urls import BASE_URL
+from jainam_api_client.urls import BASE_URL, PROFILE
+from jainam_api_client.serialization import dumps, loads
 from jainam_api_client.exceptions import (
     JainamApiException,
     JainamNetworkError,
     JainamAuthError,
+    JainamRateLimitError,
     raise_from_response,
 )
+from jainam_api_client.backoff import Backoff, parse_retry_after
+
+
+logger = logging.getLogger(__name__)
+
+
+# Connection pool defaults
+DEFAULT_POOL_CONNECTIONS = 50
+DEFAULT_POOL_MAXSIZE = 100
+
+# Request timeouts (seconds). Connecting is bounded separately so a dead
+# host fails fast instead of using up the whole read timeout.
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONNECT_TIMEOUT = 3.0
+
+BACKENDS = ("requests", "httpx")
+
+# Top-level response fields watched while streaming a result list
+_STATUS_FIELDS = frozenset(("status", "message", "errorCode", "error_code"))
+_STREAM_JSON_ERRORS = (ijson.JSONError,) if ijson is not None else ()
+
+# Conditional-GET cache for file downloads (contract masters)
+DEFAULT_DOWNLOAD_CACHE_DIR = Path.home() / ".cache" / "jainam_api" / "http"
+
+# TCP keepalive probes on pooled sockets, so NAT gateways and firewalls
+# don't silently drop connections that sit idle between sparse calls
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 20
+KEEPALIVE_COUNT = 3
+
+
+def _keepalive_socket_options() -> list:
+    """
+    Socket options enabling TCP keepalive, for the platforms that have them.
+    
+    SO_KEEPALIVE is always set. The idle/interval/count tunables are added
+    where the OS exposes them (macOS names the idle time TCP_KEEPALIVE).
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    for name, value in (
+        (idle, KEEPALIVE_IDLE),
+        (getattr(socket, "TCP_KEEPINTVL", None), KEEPALIVE_INTERVAL),
+        (getattr(socket, "TCP_KEEPCNT", None), KEEPALIVE_COUNT),
+    ):
+        if name is not None:
+            options.append((socket.IPPROTO_TCP, name, value))
+    return options
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections send TCP keepalive probes."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + _keepalive_socket_options(),
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _default_retry() -> Retry:
+    """
+    Transport retry policy for failed connection attempts.
+    
+    Error responses (5xx, 429, EC003) are retried by RestClient's Backoff,
+    which also sees the response body.
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status=0,
+        raise_on_status=False,
+    )
+
+
+def check_response(status_code: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a decoded API response.
+    
+    Shared by the sync and async REST clients.
+    
+    Args:
+        status_code: HTTP status code
+        data: Parsed JSON body
+        
+    Returns:
+        The response data if it indicates success
+        
+    Raises:
+        JainamApiException: If response indicates an error
+    """
+    # Check for error status
+    if status_code >= 400:
+        if status_code == 401:
+            raise JainamAuthError(
+                "Unauthorized. Please check your access token.",
+                error_code="EC087",
+                response=data,
+                status_code=status_code
+            )
+        if status_code == 429:
+            raise JainamRateLimitError(
+                "Rate limit exceeded. Please slow down requests.",
+                response=data,
+                status_code=status_code
+            )
+        raise_from_response(data, status_code)
+    
+    # Check response status field
+    if data.get("status") != "Ok":
+        raise_from_response(data, status_code)
+    
+    return data
+
+
+class BearerAuth(AuthBase):
+    """
+    Adds the Authorization header to each outgoing request.
+    
+    The header value is built once per token and swapped in with a single
+    attribute assignment, so a token refresh from another thread is never
+    seen half-applied and the request path takes no lock. Works as the
+    auth of both requests.Session and httpx.Client.
+    """
+    
+    def __init__(self):
+        self.header: Optional[str] = None
+    
+    def set(self, token: Optional[str]):
+        """Use token for subsequent requests (None sends no header)."""
+        # Bearer prefix is required for Jainam API
+        self.header = f"Bearer {token}" if token else None
+    
+    def __call__(self, request):
+        header = self.header
+        if header is not None:
+            request.headers["Authorization"] = header
+        return request
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for GET responses.
+    
+    Entries are keyed by endpoint and query parameters. Shared by the sync
+    and async REST clients.
+    
+    Every invalidate() bumps generation; a response fetched under an older
+    generation is not stored, so a request that was in flight while an
+    order went out cannot repopulate the cache with pre-order data.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+    
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> Tuple:
+        """Build the cache key for a request."""
+        return (endpoint, tuple(sorted(params.items())) if params else None)
+    
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def set(
+        self,
+        key: Tuple,
+        value: Dict[str, Any],
+        ttl: float,
+        generation: Optional[int] = None,
+    ):
+        """
+        Cache a response for ttl seconds.
+        
+        Args:
+            key: Cache key
+            value: Response data
+            ttl: Seconds to keep the response
+            generation: Generation the request was sent under; the
+                response is dropped if the cache was invalidated since
+        """
+        with self._lock:
+            if generation is None or generation == self.generation:
+                self._entries[key] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, endpoints: Sequence[str] = ()):
+        """
+        Drop cached responses.
+        
+        Args:
+            endpoints: Endpoints to drop (default: everything)
+        """
+        with self._lock:
+            self.generation += 1
+            if not endpoints:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] in endpoints]:
+                del self._entries[key]
+
+
+class _ChunkStream(io.RawIOBase):
+    """Readable raw stream over an httpx response's byte chunks."""
+    
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = memoryview(b"")
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+    
+    def close(self):
+        if not self.closed:
+            self._response.close()
+        super().close()
 
 
 class RestClient:
@@ -22,24 +286,178 @@ class RestClient:
     
     Handles:
     - JWT token management
+    - Connection pooling (keep-alive connections shared by all API handlers,
+      with TCP keepalive probes so idle sockets survive NAT timeouts)
+    - Short-lived caching of GET responses (opt-in per call via ttl)
     - Request/response handling
     - Error handling
+    
+    Uses requests by default. With backend="httpx" (requires
+    pip install "jainam-api-client[http2]"), requests go over an HTTP/2
+    httpx.Client so concurrent calls are multiplexed on one connection.
     """
     
-    def __init__(self, base_url: str = BASE_URL):
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: Optional[Retry] = None,
+        download_cache_dir: Optional[Path] = DEFAULT_DOWNLOAD_CACHE_DIR,
+        backend: str = "requests",
+        backoff: Optional[Backoff] = None,
+        warmup: bool = False,
+    ):
         """
         Initialize REST client.
         
         Args:
             base_url: Base URL for API requests
+            pool_connections: Number of host connection pools to cache
+                (httpx: maximum keep-alive connections)
+            pool_maxsize: Maximum connections kept alive per host
+                (httpx: maximum connections)
+            max_retries: urllib3 Retry policy for the requests backend
+                (default: retry failed connection attempts)
+            download_cache_dir: Directory for ETag/Last-Modified download
+                cache (None disables it)
+            backend: HTTP library to use, "requests" or "httpx"
+            backoff: Retry policy for transient API errors (default:
+                Backoff(); Backoff(max_attempts=1) disables retries)
+            warmup: Open a pooled connection in the background right away
+                (see warmup())
+            
+        Raises:
+            ValueError: If backend is not supported
+            ImportError: If backend is "httpx" and httpx is not installed
         """
-        self.base_url = base_url.rstrip("/")
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}. Valid options: {list(BACKENDS)}")
+        
+        self.base_url = base_url
         self.access_token: Optional[str] = None
-        self.session = requests.Session()
+        self._auth = BearerAuth()
+        self.download_cache_dir = Path(download_cache_dir) if download_cache_dir else None
+        self.cache = ResponseCache()
+        # Cacheable GETs currently in flight, shared by concurrent callers
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.backoff = backoff if backoff is not None else Backoff()
+        self._backend = backend
+        
+        self._pool_limits = (pool_connections, pool_maxsize)
+        if backend == "httpx":
+            self.session = self._create_httpx_client(pool_connections, pool_maxsize)
+            self._network_errors = (httpx.HTTPError, httpx.StreamError)
+            # Timeouts are configured on the httpx.Client
+            self._timeout = {}
+        else:
+            self.session = requests.Session()
+            
+            # Reuse keep-alive connections instead of paying a TCP+TLS handshake per call
+            adapter = KeepAliveAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries if max_retries is not None else _default_retry(),
+                # Open an extra connection rather than wait when the pool is busy
+                pool_block=False,
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self._network_errors = (requests.RequestException,)
+            # requests has no session-wide timeout, so it is passed per call
+            self._timeout = {"timeout": (DEFAULT_CONNECT_TIMEOUT, DEFAULT_TIMEOUT)}
+        
+        self.session.auth = self._auth
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Connection": "keep-alive",
         })
+        
+        if warmup:
+            self.warmup()
+    
+    def warmup(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Open a keep-alive connection to the API host ahead of the first call.
+        
+        Sends a HEAD request to the profile endpoint so the TCP and TLS
+        handshakes happen now instead of on the first order. The response
+        status is ignored; failures are logged and the first real call
+        connects as usual.
+        
+        Args:
+            background: Run in a daemon thread instead of blocking
+            
+        Returns:
+            The warmup thread if background is True, else None
+        """
+        def run():
+            try:
+                self.session.head(self._get_url(PROFILE), **self._timeout)
+            except self._network_errors as e:
+                logger.debug("Connection warmup failed: %s", e)
+        
+        if not background:
+            run()
+            return None
+        
+        thread = threading.Thread(target=run, name="jainam-rest-warmup", daemon=True)
+        thread.start()
+        return thread
+    
+    def __enter__(self) -> "RestClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+    
+    def release_connections(self):
+        """
+        Close pooled connections but keep the client usable.
+        
+        The next call opens a fresh connection. Used on logout so idle
+        sockets are not held open between sessions.
+        """
+        if self._backend == "httpx":
+            # A closed httpx.Client can't be reused, so swap in a new one
+            headers = self.session.headers
+            self.session.close()
+            self.session = self._create_httpx_client(*self._pool_limits)
+            self.session.auth = self._auth
+            self.session.headers.update(headers)
+        else:
+            for adapter in self.session.adapters.values():
+                adapter.close()
+    
+    @staticmethod
+    def _create_httpx_client(max_keepalive: int, max_connections: int):
+        """Create an HTTP/2 httpx.Client with pooling and connection retries."""
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for backend='httpx'. "
+                "Install it with: pip install \"jainam-api-client[http2]\""
+            )
+        
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+        )
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=limits,
+            retries=3,
+            socket_options=_keepalive_socket_options(),
+        )
+        return httpx.Client(
+            transport=transport,
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=DEFAULT_CONNECT_TIMEOUT),
+        )
     
     def set_access_token(self, token: str):
         """
@@ -49,18 +467,35 @@ class RestClient:
             token: JWT access token
         """
         self.access_token = token
-        # Bearer prefix is required for Jainam API
-        self.session.headers["Authorization"] = f"Bearer {token}"
+        self._auth.set(token)
+        # Cached responses belong to the previous session
+        self.cache.invalidate()
     
     def clear_token(self):
         """Clear the access token."""
         self.access_token = None
-        if "Authorization" in self.session.headers:
-            del self.session.headers["Authorization"]
+        self._auth.set(None)
+        self.cache.invalidate()
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL for API requests."""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value.rstrip("/")
+        self._urls: Dict[str, str] = {}
     
     def _get_url(self, endpoint: str) -> str:
-        """Build full URL from endpoint."""
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Get the full URL for an endpoint, built once per endpoint."""
+        # Endpoints are a small fixed set, so after the first call of each
+        # this is a single dict hit
+        try:
+            return self._urls[endpoint]
+        except KeyError:
+            url = self._urls[endpoint] = f"{self._base_url}/{endpoint.lstrip('/')}"
+            return url
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -76,76 +511,293 @@ class RestClient:
             JainamApiException: If response indicates an error
         """
         try:
-            data = response.json()
+            data = loads(response.content)
         except ValueError:
-            print(f"DEBUG: Invalid JSON response from {response.url}")
-            print(f"DEBUG: Status Code: {response.status_code}")
-            print(f"DEBUG: Content: {response.text[:500]}")
+            # Decode the body once; it is only needed on this path
+            text = response.text
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Invalid JSON response from %s (status %s): %.500s",
+                    response.url, response.status_code, text,
+                )
             raise JainamApiException(
-                f"Invalid JSON response: {response.text}",
-                response={"raw": response.text}
+                f"Invalid JSON response: {text[:500]}",
+                response={"raw": text},
+                status_code=response.status_code,
             )
         
-        # Check for error status
-        if response.status_code >= 400:
-            if response.status_code == 401:
-                raise JainamAuthError(
-                    "Unauthorized. Please check your access token.",
-                    error_code="EC087",
-                    response=data
-                )
-            raise_from_response(data)
+        return check_response(response.status_code, data)
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a request, retrying transient failures per self.backoff.
         
-        # Check response status field
-        if data.get("status") != "Ok":
-            raise_from_response(data)
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            idempotent: Whether repeating the request is safe
+            **kwargs: Passed to the session's request method
+            
+        Returns:
+            API response data
+            
+        Raises:
+            JainamApiException: The last attempt's error if all attempts fail
+        """
+        url = self._get_url(endpoint)
+        started = time.monotonic()
+        attempt = 0
         
-        return data
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs, **self._timeout)
+                return self._handle_response(response)
+            except self._network_errors as e:
+                error = JainamNetworkError(f"Network error: {str(e)}")
+                error.__cause__ = e
+            except JainamApiException as e:
+                error = e
+                error.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            
+            delay = self.backoff.next_delay(attempt, error, started, idempotent)
+            if delay is None:
+                raise error
+            time.sleep(delay)
+            attempt += 1
     
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        ttl: float = 0,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
         """
         Make GET request.
         
+        Transient failures are retried per self.backoff. With a ttl,
+        concurrent identical calls share one request (single-flight).
+        
         Args:
             endpoint: API endpoint
             params: Optional query parameters
+            ttl: Seconds to cache the response for (0 disables caching)
+            force_refresh: Skip the cache and any in-flight request and
+                fetch a fresh response
             
         Returns:
             API response data
         """
+        if ttl <= 0:
+            return self._request("GET", endpoint, params=params)
+        
+        key = ResponseCache.key(endpoint, params)
+        if not force_refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        # Requests sent before an invalidation are not joined
+        generation = self.cache.generation
+        flight_key = (key, generation)
+        with self._inflight_lock:
+            future = None if force_refresh else self._inflight.get(flight_key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._inflight[flight_key] = Future()
+        if not owner:
+            return future.result()
+        
         try:
-            response = self.session.get(
-                self._get_url(endpoint),
-                params=params
-            )
-            return self._handle_response(response)
-        except requests.RequestException as e:
-            raise JainamNetworkError(f"Network error: {str(e)}")
+            data = self._request("GET", endpoint, params=params)
+            self.cache.set(key, data, ttl, generation)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(flight_key) is future:
+                    del self._inflight[flight_key]
     
-    def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+    def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        invalidate: Sequence[str] = (),
+        idempotent: bool = False,
+    ) -> Dict[str, Any]:
         """
         Make POST request.
         
+        Only rate limit rejections are retried unless idempotent is set,
+        so an order that may have reached the server is never resent.
+        
         Args:
             endpoint: API endpoint
             data: Request body data
+            invalidate: Cached GET endpoints made stale by this request
+            idempotent: Whether the request is a read that is safe to
+                retry on network and server errors
             
         Returns:
             API response data
         """
+        # Content-Type: application/json is already a session header
+        body = dumps(data) if data is not None else None
+        # httpx takes raw bytes as content=, requests as data=
+        body_arg = "content" if self._backend == "httpx" else "data"
         try:
-            response = self.session.post(
-                self._get_url(endpoint),
-                json=data
-            )
-            return self._handle_response(response)
-        except requests.RequestException as e:
+            return self._request("POST", endpoint, idempotent, **{body_arg: body})
+        finally:
+            if invalidate:
+                self.cache.invalidate(invalidate)
+    
+    def iter_result(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Any]:
+        """
+        Make GET request and yield the records of its "result" list.
+        
+        With ijson installed (pip install "jainam-api-client[stream]"),
+        the body is parsed incrementally so only one record is held in
+        memory at a time; otherwise the whole response is parsed first.
+        Streamed requests are not cached or retried.
+        
+        Args:
+            endpoint: API endpoint
+            params: Optional query parameters
+            
+        Yields:
+            Records of the response "result" list, in order
+            
+        Raises:
+            JainamApiException: If response indicates an error
+        """
+        url = self._get_url(endpoint)
+        try:
+            if self._backend == "httpx":
+                request = self.session.build_request("GET", url, params=params)
+                response = self.session.send(request, stream=True)
+            else:
+                response = self.session.get(url, params=params, stream=True, **self._timeout)
+        except self._network_errors as e:
+            raise JainamNetworkError(f"Network error: {str(e)}")
+        
+        try:
+            if response.status_code >= 400 or ijson is None:
+                if self._backend == "httpx":
+                    response.read()
+                yield from self._handle_response(response).get("result") or []
+                return
+            
+            status: Dict[str, Any] = {}
+            
+            def events():
+                body = self._body_stream(response)
+                for prefix, event, value in ijson.parse(body, use_float=True):
+                    if prefix in _STATUS_FIELDS:
+                        status[prefix] = value
+                    yield prefix, event, value
+            
+            for record in ijson.items(events(), "result.item"):
+                if status.get("status", "Ok") != "Ok":
+                    break
+                yield record
+            
+            if status.get("status") != "Ok":
+                raise_from_response(status, response.status_code)
+        except _STREAM_JSON_ERRORS as e:
+            raise JainamApiException(f"Invalid JSON response: {str(e)}")
+        except self._network_errors + (Urllib3HTTPError,) as e:
             raise JainamNetworkError(f"Network error: {str(e)}")
+        finally:
+            response.close()
+    
+    def _cache_files(self, url: str) -> Tuple[Path, Path]:
+        """Get the (body, metadata) cache files for a download URL."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return (
+            self.download_cache_dir / f"{key}.body",
+            self.download_cache_dir / f"{key}.json",
+        )
+    
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached URL."""
+        if self.download_cache_dir is None:
+            return {}
+        
+        body_path, meta_path = self._cache_files(url)
+        try:
+            meta = loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not body_path.exists():
+            return {}
+        
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+    
+    def _is_cacheable(self, response: requests.Response) -> bool:
+        """Check whether a download response carries cache validators."""
+        return self.download_cache_dir is not None and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        )
+    
+    def _store_download(self, url: str, response: requests.Response, body: IO[bytes]) -> bool:
+        """
+        Save a downloaded body and its validators to the cache.
+        
+        Args:
+            url: Downloaded URL
+            response: Response carrying ETag/Last-Modified headers
+            body: Readable stream of the body
+            
+        Returns:
+            True if the body was cached
+        """
+        if not self._is_cacheable(response):
+            return False
+        
+        body_path, meta_path = self._cache_files(url)
+        tmp_path = None
+        try:
+            self.download_cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.download_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(body, f)
+            os.replace(tmp_path, body_path)
+            meta_path.write_bytes(dumps({
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }))
+            return True
+        except OSError:
+            # Caching is best-effort
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
     
     def download(self, url: str) -> bytes:
         """
         Download file from URL.
         
+        Responses with an ETag or Last-Modified header are cached on disk and
+        revalidated with a conditional GET, so unchanged files come back as
+        304 Not Modified without re-transferring the body.
+        
         Args:
             url: Full URL to download
             
@@ -153,8 +805,94 @@ class RestClient:
             File content as bytes
         """
         try:
-            response = self.session.get(url)
+            response = self.session.get(
+                url,
+                headers=self._conditional_headers(url),
+                **self._timeout
+            )
+            if response.status_code == 304:
+                try:
+                    return self._cache_files(url)[0].read_bytes()
+                except OSError:
+                    # Cached body removed since the validators were read
+                    response = self.session.get(url, **self._timeout)
             response.raise_for_status()
-            return response.content
-        except requests.RequestException as e:
+        except self._network_errors as e:
             raise JainamNetworkError(f"Download error: {str(e)}")
+        
+        content = response.content
+        self._store_download(url, response, io.BytesIO(content))
+        return content
+    
+    def download_stream(self, url: str) -> IO[bytes]:
+        """
+        Open a streaming download of a file.
+        
+        The body is read from the socket as it is consumed instead of being
+        buffered in memory up front. Use as a context manager so the
+        connection is released when done. Downloads are cached and
+        revalidated as in download(); cached bodies are streamed from disk.
+        
+        Args:
+            url: Full URL to download
+            
+        Returns:
+            Readable binary file-like object (transfer encoding decoded)
+            
+        Example:
+            >>> with client.download_stream(url) as raw:
+            ...     data = raw.read()
+        """
+        response = self._open_stream(url, self._conditional_headers(url))
+        if response.status_code == 304:
+            response.close()
+            try:
+                return open(self._cache_files(url)[0], "rb", buffering=0)
+            except OSError:
+                # Cached body removed since the validators were read
+                response = self._open_stream(url)
+        
+        raw = self._body_stream(response)
+        
+        # Spool cacheable bodies to disk while downloading, then read them back
+        if self._is_cacheable(response):
+            try:
+                stored = self._store_download(url, response, raw)
+            finally:
+                response.close()
+            if stored:
+                try:
+                    return open(self._cache_files(url)[0], "rb", buffering=0)
+                except OSError:
+                    pass
+            # The failed cache write (or a body removed since) consumed
+            # the body; fetch it again
+            raw = self._body_stream(self._open_stream(url))
+        
+        return raw
+    
+    def _open_stream(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """Send a streaming GET for a download, raising on HTTP errors."""
+        try:
+            if self._backend == "httpx":
+                request = self.session.build_request("GET", url, headers=headers)
+                response = self.session.send(request, stream=True)
+            else:
+                response = self.session.get(url, headers=headers, stream=True, **self._timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except self._network_errors as e:
+            raise JainamNetworkError(f"Download error: {str(e)}")
+        
+        return response
+    
+    def _body_stream(self, response) -> IO[bytes]:
+        """Get a readable, content-decoded stream over a streaming response."""
+        if self._backend == "httpx":
+            return _ChunkStream(response)
+        
+        raw = response.raw
+        raw.decode_content = True
+        # Stay open once drained so the stream can be wrapped in a BufferedReader
+        raw.auto_close = False
+        return raw
@@ -0,0 +1,38 @@
+"""
+JSON Serialization for Jainam Lite API
+
+Uses orjson when installed (pip install "jainam-api-client[fast]"), then
+msgspec, falling back to the standard library json module.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+import json
+from typing import Any
+
+
+HAS_ORJSON = orjson is not None
+HAS_MSGSPEC = msgspec is not None
+
+
+if HAS_ORJSON:
+    loads = orjson.loads
+    dumps = orjson.dumps
+elif HAS_MSGSPEC:
+    # Reusable encoder/decoder instances skip per-call setup
+    loads = msgspec.json.Decoder().decode
+    dumps = msgspec.json.Encoder().encode
+else:
+    loads = json.loads
+    
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
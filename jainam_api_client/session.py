@@ -8,15 +8,64 @@ Handles:
 """
 
 import os
-import json
 import hashlib
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import logging
+import tempfile
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from jainam_api_client.serialization import dumps, loads
 
-# Default session file location
-DEFAULT_SESSION_FILE = Path.home() / ".jainam_session.json"
+
+logger = logging.getLogger(__name__)
+
+# Default session file name, in the user's home directory
+DEFAULT_SESSION_FILENAME = ".jainam_session.json"
+
+# Sessions typically expire at end of trading day
+SESSION_MAX_AGE_HOURS = 8
+
+
+@lru_cache(maxsize=1)
+def _default_session_file() -> Path:
+    """Resolve the default session file on first use, not at import."""
+    return Path.home() / DEFAULT_SESSION_FILENAME
+
+
+@lru_cache(maxsize=4)
+def _read_session_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and decode a session file, with its timestamps as epoch seconds.
+    
+    Keyed by the file's mtime and size as well as its path, so a
+    rewritten file is read again while repeat loads of an unchanged one
+    skip the read and JSON decode.
+    
+    Files written by older versions only have ISO login_time/expires_at
+    strings; those are converted here, once per file version.
+    """
+    data = loads(Path(path).read_bytes())
+    
+    login_ts = data.get("login_time_epoch")
+    if login_ts is None and data.get("login_time"):
+        login_ts = datetime.fromisoformat(data["login_time"]).timestamp()
+    data["login_time_epoch"] = login_ts
+    
+    expires_at = data.get("expires_at")
+    if isinstance(expires_at, str):
+        data["expires_at"] = datetime.fromisoformat(expires_at).timestamp()
+    return data
+
+
+def __getattr__(name: str):
+    # DEFAULT_SESSION_FILE stays importable without resolving the home
+    # directory at import time
+    if name == "DEFAULT_SESSION_FILE":
+        return _default_session_file()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SessionManager:
@@ -64,12 +113,28 @@ class SessionManager:
         self.user_id = user_id or os.getenv("JAINAM_USER_ID")
         self.api_secret = api_secret or os.getenv("JAINAM_API_SECRET")
         self.app_code = app_code or os.getenv("JAINAM_APP_CODE")
-        self.session_file = session_file or DEFAULT_SESSION_FILE
+        self.session_file = Path(session_file) if session_file else _default_session_file()
         
         # Session data
         self.access_token: Optional[str] = None
         self.checksum: Optional[str] = None
         self.login_time: Optional[datetime] = None
+        # Inputs self.checksum was computed from
+        self._checksum_key: Optional[Tuple[Optional[str], str, Optional[str]]] = None
+        # Client that logged in, handed out by get_api_client() so its
+        # open connection is reused
+        self._client: Optional['JainamAPI'] = None
+    
+    @property
+    def api_secret(self) -> Optional[str]:
+        """API secret used for checksum creation."""
+        return self._api_secret
+    
+    @api_secret.setter
+    def api_secret(self, value: Optional[str]):
+        self._api_secret = value
+        # Encoded once and reused across SSO logins
+        self._api_secret_bytes = value.encode() if value else None
     
     def create_checksum(self, auth_code: str) -> str:
         """
@@ -83,9 +148,24 @@ class SessionManager:
         Returns:
             SHA-256 hex digest
         """
-        data = f"{self.user_id}{auth_code}{self.api_secret}"
-        checksum = hashlib.sha256(data.encode()).hexdigest()
+        # Retried logins with the same authCode reuse the last checksum
+        key = (self.user_id, auth_code, self.api_secret)
+        if key == self._checksum_key and self.checksum:
+            return self.checksum
+        
+        # Parts are fed to the hash separately rather than joined first;
+        # the secret is already encoded by the api_secret setter
+        secret = self._api_secret_bytes
+        if secret is None:
+            secret = str(self.api_secret).encode()
+        
+        h = hashlib.sha256()
+        h.update(str(self.user_id).encode())
+        h.update(auth_code.encode())
+        h.update(secret)
+        checksum = h.hexdigest()
         self.checksum = checksum
+        self._checksum_key = key
         return checksum
     
     def login_with_authcode(self, auth_code: str) -> Dict[str, Any]:
@@ -98,7 +178,7 @@ class SessionManager:
         Returns:
             API response with accessToken
         """
-        from jainam_api_client import JainamAPI
+        from jainam_api_client.jainam_api import JainamAPI, extract_session_token
         
         if not all([self.user_id, self.api_secret, self.app_code]):
             raise ValueError(
@@ -109,26 +189,30 @@ class SessionManager:
         # Create checksum
         self.create_checksum(auth_code)
         
-        # Login via SDK
+        # Login via SDK; on success the client is kept for get_api_client()
         api = JainamAPI()
-        response = api.login_with_sso(
-            user_id=self.user_id,
-            auth_code=auth_code,
-            api_secret=self.api_secret,
-            app_code=self.app_code
-        )
+        try:
+            response = api.login_with_sso(
+                user_id=self.user_id,
+                auth_code=auth_code,
+                api_secret=self._api_secret_bytes,
+                app_code=self.app_code
+            )
+        except Exception:
+            api.close()
+            raise
         
         # Extract and cache session
-        if response.get("status") == "Ok":
-            result = response.get("result", {})
-            if isinstance(result, list) and len(result) > 0:
-                result = result[0]
-            
-            self.access_token = result.get("accessToken")
+        token = extract_session_token(response)
+        if token:
+            self.access_token = token
             self.login_time = datetime.now()
+            self._client = api
             
             # Save to file
             self.save_session()
+        else:
+            api.close()
         
         return response
     
@@ -142,52 +226,91 @@ class SessionManager:
         if not self.access_token:
             return False
         
+        login_ts = self.login_time.timestamp() if self.login_time else None
         session_data = {
             "user_id": self.user_id,
             "access_token": self.access_token,
             "checksum": self.checksum,
+            # ISO login_time is kept for older SDK versions reading the file
             "login_time": self.login_time.isoformat() if self.login_time else None,
+            "login_time_epoch": login_ts,
+            "expires_at": (
+                login_ts + SESSION_MAX_AGE_HOURS * 3600 if login_ts is not None else None
+            ),
             "app_code": self.app_code,
         }
         
+        # Write to a temporary file and rename it over the old one, so a
+        # crash mid-write never leaves a truncated session behind
+        tmp_path = None
         try:
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.session_file.parent,
+                prefix=self.session_file.name,
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(session_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.session_file)
+            # mtime resolution can be coarse (e.g. 2s on FAT)
+            _read_session_file.cache_clear()
             return True
         except Exception as e:
-            print(f"Warning: Could not save session: {e}")
+            logger.warning("Could not save session: %s", e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return False
     
-    def load_session(self) -> bool:
+    def load_session(self, max_age_hours: Optional[float] = None) -> bool:
         """
         Load session from JSON file.
         
+        Sessions past the expires_at time stored in the file are not
+        loaded.
+        
+        Args:
+            max_age_hours: Skip reading a file last written more than this
+                many hours ago (the session in it can only be older)
+                
         Returns:
             True if session loaded and appears valid
         """
-        if not self.session_file.exists():
+        try:
+            st = self.session_file.stat()
+        except OSError:
+            return False
+        
+        if max_age_hours is not None and time.time() - st.st_mtime > max_age_hours * 3600:
             return False
         
         try:
-            with open(self.session_file, 'r') as f:
-                data = json.load(f)
+            data = _read_session_file(str(self.session_file), st.st_mtime_ns, st.st_size)
+            
+            expires_at = data.get("expires_at")
+            if expires_at and expires_at <= time.time():
+                return False
             
             self.user_id = data.get("user_id")
             self.access_token = data.get("access_token")
             self.checksum = data.get("checksum")
             self.app_code = data.get("app_code")
             
-            login_time_str = data.get("login_time")
-            if login_time_str:
-                self.login_time = datetime.fromisoformat(login_time_str)
+            login_ts = data["login_time_epoch"]
+            if login_ts:
+                self.login_time = datetime.fromtimestamp(login_ts)
             
             return bool(self.access_token)
             
         except Exception as e:
-            print(f"Warning: Could not load session: {e}")
+            logger.warning("Could not load session: %s", e)
             return False
     
-    def is_session_valid(self, max_age_hours: int = 8) -> bool:
+    def is_session_valid(self, max_age_hours: float = SESSION_MAX_AGE_HOURS) -> bool:
         """
         Check if cached session is still valid.
         
@@ -202,14 +325,17 @@ class SessionManager:
         if not self.access_token or not self.login_time:
             return False
         
-        age = datetime.now() - self.login_time
-        return age < timedelta(hours=max_age_hours)
+        return time.time() - self.login_time.timestamp() < max_age_hours * 3600
     
     def clear_session(self):
         """Clear cached session and delete file."""
         self.access_token = None
         self.checksum = None
         self.login_time = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        _read_session_file.cache_clear()
         
         if self.session_file.exists():
             try:
@@ -217,28 +343,52 @@ class SessionManager:
             except Exception:
                 pass
     
-    def get_api_client(self) -> 'JainamAPI':
+    def get_api_client(self, **options) -> 'JainamAPI':
         """
         Get authenticated JainamAPI client.
         
+        Without options, the same client is returned on every call (the
+        one that logged in, after login_with_authcode()), so all callers
+        share its connection pool. Passing options always creates a new
+        client, which the caller is responsible for closing.
+        
+        Args:
+            **options: Other JainamAPI arguments, e.g. backend="httpx" for
+                HTTP/2, pool sizes or warmup=True
+                
         Returns:
             Authenticated JainamAPI instance
             
         Raises:
             ValueError: If no valid session
+            
+        Example:
+            >>> client = sm.get_api_client(backend="httpx", warmup=True)
         """
         from jainam_api_client import JainamAPI
         
         if not self.access_token:
             raise ValueError("No session. Call login_with_authcode() or load_session() first.")
         
-        api = JainamAPI()
-        api.set_access_token(self.access_token)
+        if not options and self._client is not None:
+            if self._client._session_id == self.access_token:
+                return self._client
+        
+        api = JainamAPI(access_token=self.access_token, **options)
         api._user_id = self.user_id
         api._session_id = self.access_token
+        if not options:
+            self._client = api
         return api
 
 
+@lru_cache(maxsize=1)
+def _load_dotenv_once():
+    """Load .env into the environment, once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 def interactive_login(session_file: Optional[Path] = None) -> SessionManager:
     """
     Interactive login helper - prompts for authCode if needed.
@@ -246,13 +396,13 @@ def interactive_login(session_file: Optional[Path] = None) -> SessionManager:
     Returns:
         SessionManager with valid session
     """
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Re-logins in a long-running process skip the .env search
+    _load_dotenv_once()
     
     sm = SessionManager(session_file=session_file)
     
     # Try loading cached session
-    if sm.load_session() and sm.is_session_valid():
+    if sm.load_session(max_age_hours=SESSION_MAX_AGE_HOURS) and sm.is_session_valid():
         print(f"Loaded cached session for user: {sm.user_id}")
         return sm
     
@@ -4,6 +4,9 @@ Configuration and Constants for Jainam Lite API
 Values from API documentation appendix.
 """
 
+# Each list below keeps the documented order for display and iteration;
+# its *_SET twin is for membership checks.
+
 # Order Types
 ORDER_TYPE_LIMIT = "LIMIT"
 ORDER_TYPE_MARKET = "MARKET"
@@ -11,6 +14,7 @@ ORDER_TYPE_SL = "SL"       # Stop Loss
 ORDER_TYPE_SLM = "SLM"     # Stop Loss Market
 
 ORDER_TYPES = [ORDER_TYPE_LIMIT, ORDER_TYPE_MARKET, ORDER_TYPE_SL, ORDER_TYPE_SLM]
+ORDER_TYPES_SET = frozenset(ORDER_TYPES)
 
 # Product Types
 PRODUCT_INTRADAY = "INTRADAY"   # Positions squared off same day
@@ -18,6 +22,7 @@ PRODUCT_LONGTERM = "LONGTERM"   # Delivery-based (CNC equivalent)
 PRODUCT_MTF = "MTF"             # Margin Trading Facility
 
 PRODUCTS = [PRODUCT_INTRADAY, PRODUCT_LONGTERM, PRODUCT_MTF]
+PRODUCTS_SET = frozenset(PRODUCTS)
 
 # Holdings Product Types (for API requests)
 HOLDINGS_PRODUCT_MAP = {
@@ -41,12 +46,14 @@ EXCHANGES = [
     EXCHANGE_NSE, EXCHANGE_BSE, EXCHANGE_NFO, EXCHANGE_BFO,
     EXCHANGE_MCX, EXCHANGE_CDS, EXCHANGE_BCD, EXCHANGE_NCO, EXCHANGE_BCO
 ]
+EXCHANGES_SET = frozenset(EXCHANGES)
 
 # Transaction Types
 TRANSACTION_BUY = "BUY"
 TRANSACTION_SELL = "SELL"
 
 TRANSACTION_TYPES = [TRANSACTION_BUY, TRANSACTION_SELL]
+TRANSACTION_TYPES_SET = frozenset(TRANSACTION_TYPES)
 
 # Order Complexity
 COMPLEXITY_REGULAR = "REGULAR"
@@ -55,12 +62,14 @@ COMPLEXITY_BO = "BO"         # Bracket Order
 COMPLEXITY_CO = "CO"         # Cover Order
 
 ORDER_COMPLEXITIES = [COMPLEXITY_REGULAR, COMPLEXITY_AMO, COMPLEXITY_BO, COMPLEXITY_CO]
+ORDER_COMPLEXITIES_SET = frozenset(ORDER_COMPLEXITIES)
 
 # Order Validity
 VALIDITY_DAY = "DAY"
 VALIDITY_IOC = "IOC"  # Immediate or Cancel
 
 VALIDITIES = [VALIDITY_DAY, VALIDITY_IOC]
+VALIDITIES_SET = frozenset(VALIDITIES)
 
 # Order Statuses
 ORDER_STATUS_OPEN = "OPEN"
@@ -84,6 +93,13 @@ WS_RESP_TICK_FEED = "tf"        # Tick feed
 WS_RESP_DEPTH_ACK = "dk"        # Depth acknowledgement
 WS_RESP_DEPTH_FEED = "df"       # Depth feed
 
+# Seconds subscribe() waits for the WebSocket session to be accepted
+WS_CONNECT_TIMEOUT = 5.0
+
 # Rate Limits
 RATE_LIMIT_GENERAL = 1800       # Per 15 minutes
 RATE_LIMIT_WINDOW = 15 * 60     # 15 minutes in seconds
+
+# Response Cache TTLs (seconds)
+PROFILE_CACHE_TTL = 3600        # Profile does not change within a session
+BOOK_CACHE_TTL = 1.0            # Order book, trade book and positions
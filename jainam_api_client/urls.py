@@ -23,6 +23,9 @@ HOLDINGS = "omt/api-order-rest/v1/holdings/{product_type}"
 POSITIONS = "omt/api-order-rest/v1/positions"
 SQUARE_OFF = "omt/api-order-rest/v1/orders/positions/sqroff"
 
+# Cached order/trade/position reads made stale by order activity
+BOOK_ENDPOINTS = (ORDER_BOOK, TRADE_BOOK, POSITIONS)
+
 # Account
 LIMITS = "omt/api-order-rest/v1/limits/"
 PROFILE = "omt/api-order-rest/v1/profile/"
@@ -34,14 +37,11 @@ INVALIDATE_WS_SESSION = "api/client-rest/profile/invalidateWsSess"
 # Contract Master - JSON format
 CONTRACT_MASTER_JSON = "contract/json/{exchange}"
 
+# Exchanges with a downloadable contract master
+CONTRACT_EXCHANGES = ("nse", "nfo", "bse", "bfo", "mcx", "cds", "bcd", "indices")
+
 # Contract Master Download URLs (direct links)
 CONTRACT_URLS = {
-    "nse": f"{BASE_URL}contract/json/nse",
-    "nfo": f"{BASE_URL}contract/json/nfo",
-    "bse": f"{BASE_URL}contract/json/bse",
-    "bfo": f"{BASE_URL}contract/json/bfo",
-    "mcx": f"{BASE_URL}contract/json/mcx",
-    "cds": f"{BASE_URL}contract/json/cds",
-    "bcd": f"{BASE_URL}contract/json/bcd",
-    "indices": f"{BASE_URL}contract/json/indices",
+    exchange: BASE_URL + CONTRACT_MASTER_JSON.format(exchange=exchange)
+    for exchange in CONTRACT_EXCHANGES
 }
@@ -5,15 +5,18 @@ Handles real-time market data streaming.
 """
 
 import hashlib
-import json
 import threading
-import time
-from typing import Callable, Dict, Any, List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional, Set
 
 import websocket
 
 from jainam_api_client.urls import WEBSOCKET_URL
+from jainam_api_client.serialization import dumps, loads
 from jainam_api_client.settings import (
+    WS_RESP_CONNECT,
     WS_TYPE_CONNECT,
     WS_TYPE_HEARTBEAT,
     WS_TYPE_TICK,
@@ -23,6 +26,23 @@ from jainam_api_client.settings import (
 )
 
 
+# Seconds between heartbeats
+HEARTBEAT_INTERVAL = 50
+
+# Heartbeat frame never changes, so it is encoded once. Frames are sent
+# as UTF-8 bytes, which websocket-client writes as text frames unchanged.
+_HEARTBEAT_MSG = dumps({"k": "", "t": WS_TYPE_HEARTBEAT})
+
+
+@lru_cache(maxsize=8)
+def _susertoken(session_id: str) -> str:
+    """Double SHA-256 of a session ID, memoised across reconnects."""
+    # The server hashes the hex form of the first digest, so the
+    # intermediate hexdigest is part of the protocol
+    first_hash = hashlib.sha256(session_id.encode()).hexdigest()
+    return hashlib.sha256(first_hash.encode("ascii")).hexdigest()
+
+
 class JainamWebSocket:
     """
     WebSocket client for real-time market data.
@@ -51,12 +71,31 @@ class JainamWebSocket:
         self.user_id = f"{user_id}_API"
         self.session_id = session_id
         self.susertoken = self._create_susertoken(session_id)
+        # Connection request, sent unchanged on every (re)connect
+        self._connect_msg = dumps({
+            "susertoken": self.susertoken,
+            "t": WS_TYPE_CONNECT,
+            "actid": self.user_id,
+            "uid": self.user_id,
+            "source": "API",
+        })
         
         self.ws: Optional[websocket.WebSocketApp] = None
         self.ws_thread: Optional[threading.Thread] = None
         self.heartbeat_thread: Optional[threading.Thread] = None
         self.connected = False
-        self.subscribed_tokens: set = set()
+        # Set once the server accepts or rejects the session, or the
+        # socket closes - whichever comes first
+        self._handshake_done = threading.Event()
+        # Wakes the heartbeat thread immediately on disconnect/close
+        self._stop_heartbeat = threading.Event()
+        # Subscribed tokens per exchange code
+        self.subscribed: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Coalesced subscriptions waiting to be sent, keyed by is_depth
+        self._pending: Dict[bool, List[Dict[str, str]]] = {}
+        self._pending_timers: Dict[bool, threading.Timer] = {}
+        self._pending_lock = threading.Lock()
         
         # Callbacks
         self.on_message: Optional[Callable[[Dict], None]] = None
@@ -74,11 +113,30 @@ class JainamWebSocket:
         Returns:
             Double SHA-256 hex digest
         """
-        # First hash
-        first_hash = hashlib.sha256(session_id.encode()).hexdigest()
-        # Second hash
-        second_hash = hashlib.sha256(first_hash.encode()).hexdigest()
-        return second_hash
+        return _susertoken(session_id)
+    
+    @property
+    def subscribed_tokens(self) -> Set[str]:
+        """Subscribed instruments as "EXCHANGE|token" keys."""
+        return {
+            f"{exchange}|{token}"
+            for exchange, tokens in self.subscribed.items()
+            for token in tokens
+        }
+    
+    @staticmethod
+    def _instrument_keys(instruments: List[Dict[str, str]]) -> List[str]:
+        """
+        Build the "EXCHANGE|token" key of each instrument.
+        
+        Args:
+            instruments: List of dicts with 'exchange' and 'token' keys
+            
+        Returns:
+            Keys like ["NSE|26000", "BSE|1"]
+        """
+        upper = str.upper
+        return [f"{upper(inst['exchange'])}|{inst['token']}" for inst in instruments]
     
     def _format_instruments(self, instruments: List[Dict[str, str]]) -> str:
         """
@@ -90,29 +148,37 @@ class JainamWebSocket:
         Returns:
             Formatted string like "NSE|26000#BSE|1"
         """
-        formatted = []
-        for inst in instruments:
-            exchange = inst.get("exchange", "").upper()
-            token = inst.get("token", "")
-            formatted.append(f"{exchange}|{token}")
-        return "#".join(formatted)
+        return "#".join(self._instrument_keys(instruments))
     
     def _on_message(self, ws, message: str):
         """Handle incoming WebSocket message."""
         try:
-            data = json.loads(message)
-            
-            # Check connection status
-            if data.get("t") == "cf":
-                if data.get("s") == "OK":
-                    self.connected = True
-                    self._start_heartbeat()
-            
-            if self.on_message:
-                self.on_message(data)
-        except json.JSONDecodeError:
+            # orjson/msgspec when installed: this runs for every tick
+            data = loads(message)
+        except ValueError:
+            # Base class of every JSON backend's decode error
             if self.on_error:
                 self.on_error(Exception(f"Invalid JSON: {message}"))
+            return
+        
+        # Check connection status
+        if data.get("t") == WS_RESP_CONNECT:
+            if data.get("s") == "OK":
+                self.connected = True
+                self._start_heartbeat()
+            self._handshake_done.set()
+        
+        callback = self.on_message
+        if callback is None:
+            return
+        
+        # Errors in user code go to on_error as they are, instead of
+        # being reported as bad JSON or escaping into the reader thread
+        try:
+            callback(data)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
     
     def _on_error(self, ws, error):
         """Handle WebSocket error."""
@@ -122,31 +188,29 @@ class JainamWebSocket:
     def _on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket close."""
         self.connected = False
+        self._handshake_done.set()
+        self._stop_heartbeat.set()
         if self.on_close:
             self.on_close(f"Connection closed: {close_status_code} - {close_msg}")
     
     def _on_open(self, ws):
         """Handle WebSocket connection open."""
         # Send connection request
-        connect_msg = {
-            "susertoken": self.susertoken,
-            "t": WS_TYPE_CONNECT,
-            "actid": self.user_id,
-            "uid": self.user_id,
-            "source": "API",
-        }
-        ws.send(json.dumps(connect_msg))
+        ws.send(self._connect_msg)
         
         if self.on_open:
             self.on_open()
     
     def _start_heartbeat(self):
         """Start heartbeat thread to keep connection alive."""
+        stop = self._stop_heartbeat
+        
         def heartbeat_loop():
-            while self.connected:
-                time.sleep(50)  # Send heartbeat every 50 seconds
-                if self.connected and self.ws:
-                    self.send_heartbeat()
+            # wait() returns True as soon as the connection is stopped
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                if not self.connected:
+                    break
+                self.send_heartbeat()
         
         self.heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
         self.heartbeat_thread.start()
@@ -155,8 +219,13 @@ class JainamWebSocket:
         """
         Connect to WebSocket server.
         
-        Starts the WebSocket connection in a background thread.
+        Starts the WebSocket connection in a background thread. Use
+        wait_connected() to block until the session is accepted.
         """
+        self._handshake_done.clear()
+        # Fresh event per connection; heartbeat threads of earlier
+        # connections keep the one that stopped them
+        self._stop_heartbeat = threading.Event()
         self.ws = websocket.WebSocketApp(
             WEBSOCKET_URL,
             on_message=self._on_message,
@@ -171,22 +240,47 @@ class JainamWebSocket:
         )
         self.ws_thread.start()
     
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the server accepts the session.
+        
+        Returns as soon as the connection is acknowledged, rejected or
+        closed, rather than polling.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if connected
+        """
+        self._handshake_done.wait(timeout)
+        return self.connected
+    
     def disconnect(self):
         """Disconnect from WebSocket server."""
         self.connected = False
+        self._stop_heartbeat.set()
+        
+        # Drop coalesced subscriptions that were never sent
+        with self._pending_lock:
+            timers = list(self._pending_timers.values())
+            self._pending.clear()
+            self._pending_timers.clear()
+        for timer in timers:
+            timer.cancel()
         if self.ws:
             self.ws.close()
     
     def send_heartbeat(self):
         """Send heartbeat to keep connection alive."""
         if self.ws and self.connected:
-            msg = {"k": "", "t": WS_TYPE_HEARTBEAT}
-            self.ws.send(json.dumps(msg))
+            self.ws.send(_HEARTBEAT_MSG)
     
     def subscribe(
         self,
         instruments: List[Dict[str, str]],
-        is_depth: bool = False
+        is_depth: bool = False,
+        coalesce_ms: float = 0,
     ):
         """
         Subscribe to market data for instruments.
@@ -194,13 +288,24 @@ class JainamWebSocket:
         Args:
             instruments: List of dicts with 'exchange' and 'token' keys
             is_depth: If True, subscribe to depth data (5-level)
+            coalesce_ms: If > 0, queue the instruments and send everything
+                queued within this many milliseconds as one frame (see
+                flush()). Errors while sending go to on_error.
             
         Example:
             >>> ws.subscribe([
             ...     {"exchange": "NSE", "token": "26000"},
             ...     {"exchange": "NFO", "token": "54957"}
             ... ])
+            >>>
+            >>> # Watchlist load: one frame instead of one per symbol
+            >>> for inst in watchlist:
+            ...     ws.subscribe([inst], coalesce_ms=5)
         """
+        if coalesce_ms > 0:
+            self._queue_subscribe(instruments, is_depth, coalesce_ms)
+            return
+        
         if not self.ws or not self.connected:
             raise Exception("WebSocket not connected")
         
@@ -208,11 +313,50 @@ class JainamWebSocket:
         msg_type = WS_TYPE_DEPTH if is_depth else WS_TYPE_TICK
         
         msg = {"k": formatted, "t": msg_type}
-        self.ws.send(json.dumps(msg))
+        self.ws.send(dumps(msg))
         
         # Track subscribed tokens
+        subscribed = self.subscribed
         for inst in instruments:
-            self.subscribed_tokens.add(f"{inst['exchange']}|{inst['token']}")
+            subscribed[inst['exchange'].upper()].add(inst['token'])
+    
+    def _queue_subscribe(
+        self,
+        instruments: List[Dict[str, str]],
+        is_depth: bool,
+        coalesce_ms: float,
+    ):
+        """Add instruments to the pending batch, starting its timer if new."""
+        with self._pending_lock:
+            pending = self._pending.get(is_depth)
+            if pending is None:
+                pending = self._pending[is_depth] = []
+                timer = threading.Timer(coalesce_ms / 1000, self._flush_pending, (is_depth,))
+                timer.daemon = True
+                self._pending_timers[is_depth] = timer
+                timer.start()
+            pending.extend(instruments)
+    
+    def _flush_pending(self, is_depth: bool):
+        """Send one pending batch (runs on its timer thread or from flush())."""
+        with self._pending_lock:
+            batch = self._pending.pop(is_depth, None)
+            timer = self._pending_timers.pop(is_depth, None)
+        if timer is not None:
+            timer.cancel()
+        if not batch:
+            return
+        
+        try:
+            self.subscribe(batch, is_depth=is_depth)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
+    
+    def flush(self):
+        """Send coalesced subscriptions now instead of when their timer fires."""
+        for is_depth in (False, True):
+            self._flush_pending(is_depth)
     
     def unsubscribe(
         self,
@@ -222,10 +366,16 @@ class JainamWebSocket:
         """
         Unsubscribe from market data.
         
+        Queued coalesced subscriptions are sent first, so the server sees
+        requests in the order they were made.
+        
         Args:
             instruments: List of dicts with 'exchange' and 'token' keys
             is_depth: If True, unsubscribe from depth data
         """
+        if self._pending:
+            self.flush()
+        
         if not self.ws or not self.connected:
             raise Exception("WebSocket not connected")
         
@@ -233,11 +383,14 @@ class JainamWebSocket:
         msg_type = WS_TYPE_UNSUBSCRIBE_DEPTH if is_depth else WS_TYPE_UNSUBSCRIBE
         
         msg = {"k": formatted, "t": msg_type}
-        self.ws.send(json.dumps(msg))
+        self.ws.send(dumps(msg))
         
         # Remove from tracked tokens
+        subscribed = self.subscribed
         for inst in instruments:
-            self.subscribed_tokens.discard(f"{inst['exchange']}|{inst['token']}")
+            tokens = subscribed.get(inst['exchange'].upper())
+            if tokens is not None:
+                tokens.discard(inst['token'])
     
     def subscribe_tick(self, instruments: List[Dict[str, str]]):
         """
@@ -259,7 +412,7 @@ class JainamWebSocket:
 
 
 # WebSocket message field mappings for reference
-WS_FIELD_MAPPING = {
+_FIELD_NAMES = {
     "t": "type",           # tf=tick feed, tk=tick ack, df=depth feed, dk=depth ack
     "e": "exchange",
     "tk": "token",
@@ -280,9 +433,38 @@ WS_FIELD_MAPPING = {
     "tsq": "total_sell_qty",
     "uc": "upper_circuit",
     "lc": "lower_circuit",
-    # Depth fields (1-5)
-    "bp1": "bid_price_1", "sp1": "ask_price_1",
-    "bq1": "bid_qty_1", "sq1": "ask_qty_1",
-    "bo1": "bid_orders_1", "so1": "ask_orders_1",
-    # ... up to bp5, sp5, etc.
 }
+# Depth fields (1-5)
+for _level in range(1, 6):
+    _FIELD_NAMES.update({
+        f"bp{_level}": f"bid_price_{_level}", f"sp{_level}": f"ask_price_{_level}",
+        f"bq{_level}": f"bid_qty_{_level}", f"sq{_level}": f"ask_qty_{_level}",
+        f"bo{_level}": f"bid_orders_{_level}", f"so{_level}": f"ask_orders_{_level}",
+    })
+del _level
+
+# Read-only view, so the lookup table used by translate_tick can't drift
+WS_FIELD_MAPPING = MappingProxyType(_FIELD_NAMES)
+
+
+def translate_tick(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rename a feed message's short field keys to descriptive names.
+    
+    on_message receives the raw short-key dicts; call this only where
+    the long names are wanted. Feed updates carry just the fields that
+    changed, so only the message's own keys are visited. Unknown keys
+    are kept as they are.
+    
+    Args:
+        message: Message dict passed to on_message
+        
+    Returns:
+        New dict keyed by WS_FIELD_MAPPING names
+        
+    Example:
+        >>> translate_tick({"t": "tf", "e": "NSE", "tk": "26000", "lp": "22150.5"})
+        {'type': 'tf', 'exchange': 'NSE', 'token': '26000', 'ltp': '22150.5'}
+    """
+    name = _FIELD_NAMES.get
+    return {name(key, key): value for key, value in message.items()}
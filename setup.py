@@ -9,6 +9,15 @@ REQUIRES = [
     'pandas>=1.5.0',
 ]
 
+EXTRAS_REQUIRE = {
+    'async': ['aiohttp>=3.8.0'],
+    'fast': ['orjson>=3.6'],
+    'msgspec': ['msgspec>=0.18'],
+    'cache': ['pyarrow>=8.0'],
+    'http2': ['httpx[http2]>=0.24'],
+    'stream': ['ijson>=3.1'],
+}
+
 setup(
     name=NAME,
     version=VERSION,
@@ -18,6 +27,7 @@ setup(
     url="",
     keywords=["Jainam", "Trading API", "Stock Trading"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests", "inspiration"]),
     include_package_data=True,
     python_requires=">=3.8",
@@ -35,7 +35,11 @@ def main():
     
     # Start Chrome
     print("\nStarting Chrome...")
-    driver = webdriver.Chrome()
+    options = webdriver.ChromeOptions()
+    # driver.get() returns at DOMContentLoaded; the steps below wait for
+    # their own elements
+    options.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=options)
     
     try:
         # Navigate
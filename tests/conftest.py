@@ -0,0 +1,39 @@
+"""
+Shared pytest fixtures for the Jainam Lite API SDK tests.
+
+Every test module shares one authenticated session, loaded once per
+pytest process from the saved session file (run tests/auto_login.py or
+tests/test_all_apis.py first). Tests that need it are skipped when there
+is no valid session.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sm():
+    """SessionManager for the saved session."""
+    from jainam_api_client import SessionManager
+    
+    session = SessionManager()
+    if not session.load_session() or not session.is_session_valid():
+        pytest.skip("No valid saved session. Run tests/auto_login.py first.")
+    return session
+
+
+@pytest.fixture(scope="session")
+def api(sm):
+    """Authenticated JainamAPI client shared by all tests."""
+    client = sm.get_api_client()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def logger(tmp_path):
+    """OutputLogger writing to a per-test file."""
+    from tests.utils.output_logger import OutputLogger
+    
+    log = OutputLogger(tmp_path / "output.txt")
+    yield log
+    log.save()
@@ -2,54 +2,42 @@
 Unified API Test - Login and Test All Endpoints
 
 This script:
-1. Performs auto-login via Selenium (gets fresh authCode)
+1. Reuses a still-valid saved session, or else performs auto-login via
+   Selenium (gets fresh authCode); pass --force-login to always log in
 2. Creates checksum and exchanges for session token
 3. Saves session to JSON file
-4. Tests all API endpoints using the saved session
+4. Tests all API endpoints concurrently using the saved session
 5. Outputs detailed results to test_output.txt
 """
 
+import argparse
+import asyncio
 import os
 import sys
-import time
-import json
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv()
+from tests.utils.output_logger import OutputLogger, write_json
+from tests.utils.session_cache import load_valid_session
 
 # Output file
 OUTPUT_FILE = Path(__file__).parent / "test_output.txt"
-
-
-class OutputLogger:
-    """Logger that writes to both console and file."""
-    
-    def __init__(self, filepath):
-        self.filepath = filepath
-        self.lines = []
-    
-    def log(self, message=""):
-        print(message)
-        self.lines.append(message)
-    
-    def save(self):
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(self.lines))
+RESULTS_FILE = Path(__file__).parent / "test_results.json"
+# One JSON line per endpoint test, written as each result is reported
+RESULTS_STREAM_FILE = Path(__file__).parent / "test_results.jsonl"
 
 
 def selenium_login(logger):
-    """Perform Selenium auto-login and get authCode."""
-    import pyotp
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    """
+    Perform Selenium auto-login and get authCode.
+    
+    Uses tests.utils.browser_login with a reused browser, which attaches
+    to a Chrome started with --remote-debugging-port=9222 if there is one.
+    """
+    from tests.utils.browser_login import get_auth_code_via_browser
     
     user_id = os.getenv("JAINAM_USER_ID")
     password = os.getenv("JAINAM_USER_PASSWORD")
@@ -62,71 +50,22 @@ def selenium_login(logger):
     logger.log(f"User ID: {user_id}")
     logger.log(f"App Code: {app_code}")
     
-    driver = webdriver.Chrome()
-    auth_code = None
-    
     try:
-        url = f"https://protrade.jainam.in/?appcode={app_code}"
-        logger.log(f"Opening: {url}")
-        driver.get(url)
-        
-        wait = WebDriverWait(driver, 30)
-        time.sleep(3)
-        
-        # Step 1: User ID
-        logger.log("[1] Entering User ID...")
-        user_input = wait.until(EC.presence_of_element_located((By.ID, "user")))
-        user_input.send_keys(user_id)
-        driver.find_element(By.ID, "user_con_btn").click()
-        time.sleep(2)
-        
-        # Step 2: Password
-        logger.log("[2] Entering Password...")
-        pass_input = wait.until(EC.presence_of_element_located((By.ID, "passcode")))
-        pass_input.send_keys(password)
-        driver.find_element(By.ID, "pass_con_btn").click()
-        time.sleep(2)
-        
-        # Step 3: TOTP
-        logger.log("[3] Entering TOTP...")
-        totp = pyotp.TOTP(totp_secret)
-        otp = totp.now()
-        remaining = 30 - (datetime.now().second % 30)
-        logger.log(f"    Generated OTP: {otp} (valid for {remaining}s)")
-        
-        if remaining < 5:
-            logger.log(f"    TOTP about to expire, waiting {remaining + 2}s...")
-            time.sleep(remaining + 2)
-            otp = totp.now()
-        
-        totp_input = wait.until(EC.presence_of_element_located((By.ID, "totp_input")))
-        totp_input.send_keys(otp)
-        driver.find_element(By.ID, "totp_con_btn").click()
-        time.sleep(3)
-        
-        # Wait for redirect
-        logger.log("[4] Waiting for redirect...")
-        max_wait = 60
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait:
-            current_url = driver.current_url
-            if "authCode" in current_url:
-                parsed = urlparse(current_url)
-                params = parse_qs(parsed.query)
-                auth_code = params.get('authCode', [''])[0].split(',')[0]
-                break
-            time.sleep(2)
-        
-        if auth_code:
-            logger.log(f"[OK] Got authCode: {auth_code}")
-        else:
-            logger.log("[FAIL] Timeout waiting for redirect")
-            
-    finally:
-        driver.quit()
-        logger.log("Browser closed.")
+        auth_code, _ = get_auth_code_via_browser(
+            user_id=user_id,
+            password=password,
+            totp_secret=totp_secret,
+            app_code=app_code,
+            reuse_driver=True,
+        )
+    except Exception as e:
+        logger.log(f"[FAIL] Login failed: {e}")
+        return None
     
+    if not auth_code:
+        logger.log("[FAIL] No authCode in redirect URL")
+        return None
+    logger.log(f"[OK] Got authCode: {auth_code}")
     return auth_code
 
 
@@ -162,140 +101,121 @@ def exchange_for_session(auth_code, logger):
         return None, response
 
 
-def test_all_apis(sm, logger):
-    """Test all API endpoints using the saved session."""
+def _first(result):
+    return result[0] if isinstance(result, list) else result
+
+
+def _count(label):
+    """Details function that reports the number of records."""
+    return lambda result: [(label, len(result) if result else 0)]
+
+
+def _limits_details(result):
+    if not result:
+        return []
+    data = _first(result)
+    return [
+        ("Trading Limit", data.get('tradingLimit', 'N/A')),
+        ("Opening Cash", data.get('openingCashLimit', 'N/A')),
+        ("Collateral", data.get('collateralMargin', 'N/A')),
+    ]
+
+
+def _order_book_details(result):
+    details = [("Orders count", len(result) if result else 0)]
+    if result:
+        order = result[0]
+        details.append(("Last Order", f"{order.get('tradingSymbol')} - {order.get('orderStatus')}"))
+    return details
+
+
+def _profile_details(result):
+    if not result:
+        return []
+    data = _first(result)
+    return [
+        ("Name", data.get('name', data.get('userName', 'N/A'))),
+        ("Client ID", data.get('clientId', 'N/A')),
+        ("Email", data.get('email', 'N/A')),
+    ]
+
+
+# (key, title, AsyncJainamAPI method, details) of each endpoint test, in
+# the order they are reported. details maps the "result" of a successful
+# response to (label, value) pairs to log.
+API_TESTS = (
+    ("limits", "Funds/Limits", "limits", _limits_details),
+    ("order_book", "Order Book", "order_report", _order_book_details),
+    ("positions", "Positions", "positions", _count("Positions count")),
+    ("holdings", "Holdings", "holdings", _count("Holdings count")),
+    ("profile", "Profile", "profile", _profile_details),
+    ("trade_book", "Trade Book", "trade_report", _count("Trades count")),
+)
+
+
+async def fetch_all(sm):
+    """Fetch all endpoints concurrently; failures are returned, not raised."""
+    from jainam_api_client.async_jainam_api import AsyncJainamAPI
+    
+    async with AsyncJainamAPI(access_token=sm.access_token) as api:
+        return await asyncio.gather(
+            *(getattr(api, method)() for _, _, method, _ in API_TESTS),
+            return_exceptions=True,
+        )
+
+
+def run_api_tests(sm, logger, sink=None):
+    """
+    Test all API endpoints using the saved session.
+    
+    Each test's status and raw response is also written to sink (an open
+    text file) as one JSON line, as soon as it is reported.
+    """
     
     logger.log("")
     logger.log("=" * 70)
     logger.log("STEP 3: TEST ALL API ENDPOINTS")
     logger.log("=" * 70)
     
-    api = sm.get_api_client()
     results = {}
     responses = {}
     
-    # Test 1: Funds/Limits
-    logger.log("")
-    logger.log("[Test 1] Funds/Limits")
-    logger.log("-" * 40)
-    try:
-        response = api.limits()
-        responses["limits"] = response
-        status = response.get("status", "Unknown")
-        results["limits"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            result = response.get("result", [])
-            if result:
-                data = result[0] if isinstance(result, list) else result
-                logger.log(f"  Trading Limit: {data.get('tradingLimit', 'N/A')}")
-                logger.log(f"  Opening Cash: {data.get('openingCashLimit', 'N/A')}")
-                logger.log(f"  Collateral: {data.get('collateralMargin', 'N/A')}")
-    except Exception as e:
-        results["limits"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
-    
-    # Test 2: Order Book
-    logger.log("")
-    logger.log("[Test 2] Order Book")
-    logger.log("-" * 40)
-    try:
-        response = api.order_report()
-        responses["order_book"] = response
-        status = response.get("status", "Unknown")
-        results["order_book"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            orders = response.get("result", [])
-            logger.log(f"  Orders count: {len(orders) if orders else 0}")
-            if orders and len(orders) > 0:
-                order = orders[0]
-                logger.log(f"  Last Order: {order.get('tradingSymbol')} - {order.get('orderStatus')}")
-    except Exception as e:
-        results["order_book"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
+    # The endpoints are independent, so fetch them all at once and
+    # report in order afterwards
+    outcomes = asyncio.run(fetch_all(sm))
     
-    # Test 3: Positions
-    logger.log("")
-    logger.log("[Test 3] Positions")
-    logger.log("-" * 40)
-    try:
-        response = api.positions()
-        responses["positions"] = response
-        status = response.get("status", "Unknown")
-        results["positions"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            positions = response.get("result", [])
-            logger.log(f"  Positions count: {len(positions) if positions else 0}")
-    except Exception as e:
-        results["positions"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
-    
-    # Test 4: Holdings
-    logger.log("")
-    logger.log("[Test 4] Holdings")
-    logger.log("-" * 40)
-    try:
-        response = api.holdings()
-        responses["holdings"] = response
-        status = response.get("status", "Unknown")
-        results["holdings"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            holdings = response.get("result", [])
-            logger.log(f"  Holdings count: {len(holdings) if holdings else 0}")
-    except Exception as e:
-        results["holdings"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
-    
-    # Test 5: Profile
-    logger.log("")
-    logger.log("[Test 5] Profile")
-    logger.log("-" * 40)
-    try:
-        response = api.profile()
-        responses["profile"] = response
-        status = response.get("status", "Unknown")
-        results["profile"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            result = response.get("result", {})
-            if result:
-                data = result[0] if isinstance(result, list) else result
-                logger.log(f"  Name: {data.get('name', data.get('userName', 'N/A'))}")
-                logger.log(f"  Client ID: {data.get('clientId', 'N/A')}")
-                logger.log(f"  Email: {data.get('email', 'N/A')}")
-    except Exception as e:
-        results["profile"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
-    
-    # Test 6: Trade Book
-    logger.log("")
-    logger.log("[Test 6] Trade Book")
-    logger.log("-" * 40)
-    try:
-        response = api.trade_report()
-        responses["trade_book"] = response
-        status = response.get("status", "Unknown")
-        results["trade_book"] = status
-        logger.log(f"  Status: {status}")
-        logger.log(f"  Message: {response.get('message', 'N/A')}")
-        if status == "Ok":
-            trades = response.get("result", [])
-            logger.log(f"  Trades count: {len(trades) if trades else 0}")
-    except Exception as e:
-        results["trade_book"] = f"Error: {e}"
-        logger.log(f"  Error: {e}")
+    for i, ((name, title, _, details), outcome) in enumerate(zip(API_TESTS, outcomes), 1):
+        logger.log("")
+        logger.log(f"[Test {i}] {title}")
+        logger.log("-" * 40)
+        if isinstance(outcome, Exception):
+            results[name] = f"Error: {outcome}"
+            logger.log(f"  Error: {outcome}")
+            response = None
+        else:
+            response = responses[name] = outcome
+            status = outcome.get("status", "Unknown")
+            results[name] = status
+            logger.log(f"  Status: {status}")
+            logger.log(f"  Message: {outcome.get('message', 'N/A')}")
+            if status == "Ok":
+                for label, value in details(outcome.get("result")):
+                    logger.log(f"  {label}: {value}")
+        
+        if sink is not None:
+            write_json({"test": name, "status": results[name], "response": response}, sink, indent=False)
+            sink.write('\n')
     
     return results, responses
 
 
+def test_all_apis(sm, logger):
+    """Every endpoint in API_TESTS returns status Ok."""
+    results, _ = run_api_tests(sm, logger)
+    failed = {name: status for name, status in results.items() if status != "Ok"}
+    assert not failed, f"Endpoints failed: {failed}"
+
+
 def print_summary(results, responses, sm, logger):
     """Print test summary."""
     logger.log("")
@@ -331,48 +251,67 @@ def print_summary(results, responses, sm, logger):
         logger.log("")
         logger.log(f">>> {api_name.upper()} <<<")
         logger.log("-" * 40)
-        logger.log(json.dumps(response, indent=2, default=str))
+        logger.log_json(response)
     
-    # Save results to JSON
-    results_file = Path(__file__).parent / "test_results.json"
-    with open(results_file, 'w') as f:
-        json.dump({
+    # Save the summary to JSON; raw responses were already streamed to
+    # RESULTS_STREAM_FILE by run_api_tests
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f:
+        write_json({
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "user_id": sm.user_id,
             "checksum": sm.checksum,
             "results": results,
             "passed": passed,
             "failed": failed,
-            "raw_responses": responses
-        }, f, indent=2, default=str)
+            "raw_responses_file": RESULTS_STREAM_FILE.name,
+        }, f)
     logger.log("")
-    logger.log(f"Results JSON: {results_file}")
+    logger.log(f"Results JSON: {RESULTS_FILE}")
+    logger.log(f"Raw responses (JSON lines): {RESULTS_STREAM_FILE}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force-login",
+        action="store_true",
+        help="Log in via Selenium even if a saved session is still valid",
+    )
+    args = parser.parse_args()
+    
     logger = OutputLogger(OUTPUT_FILE)
     
+    # Imported here rather than at module level, so importing this module
+    # (e.g. under pytest) stays cheap
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     logger.log("#" * 70)
     logger.log("# JAINAM LITE API SDK - UNIFIED TEST")
     logger.log(f"# Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.log("#" * 70)
     
-    # Step 1: Selenium login
-    auth_code = selenium_login(logger)
-    if not auth_code:
-        logger.log("[FAIL] Could not get authCode from login")
-        logger.save()
-        return
-    
-    # Step 2: Exchange for session
-    sm, login_response = exchange_for_session(auth_code, logger)
-    if not sm:
-        logger.log("[FAIL] Could not get session token")
-        logger.save()
-        return
+    sm = None if args.force_login else load_valid_session(logger.log)
+    if sm is not None:
+        logger.log(f"[CACHE HIT] Reusing saved session from {sm.login_time}")
+    if sm is None:
+        # Step 1: Selenium login
+        auth_code = selenium_login(logger)
+        if not auth_code:
+            logger.log("[FAIL] Could not get authCode from login")
+            logger.save()
+            return
+        
+        # Step 2: Exchange for session
+        sm, login_response = exchange_for_session(auth_code, logger)
+        if not sm:
+            logger.log("[FAIL] Could not get session token")
+            logger.save()
+            return
     
     # Step 3: Test all APIs
-    results, responses = test_all_apis(sm, logger)
+    with open(RESULTS_STREAM_FILE, 'w', encoding='utf-8', buffering=1) as sink:
+        results, responses = run_api_tests(sm, logger, sink)
     
     # Print summary
     print_summary(results, responses, sm, logger)
@@ -0,0 +1,85 @@
+"""
+Test retry backoff
+
+Offline tests; no session or network access is needed.
+
+Functions tested:
+- is_retriable(): Which failed requests may be retried
+- parse_retry_after(): Retry-After header parsing
+- Backoff.next_delay(): Delay before the next attempt
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from jainam_api_client.backoff import Backoff, is_retriable, parse_retry_after
+from jainam_api_client.exceptions import (
+    JainamApiException,
+    JainamAuthError,
+    JainamNetworkError,
+    JainamRateLimitError,
+    JainamValidationError,
+)
+
+
+@pytest.mark.parametrize("error, idempotent, expected", [
+    (JainamRateLimitError("Too many requests"), False, True),
+    (JainamNetworkError("Timed out"), True, True),
+    (JainamNetworkError("Timed out"), False, False),
+    (JainamApiException("Try again", error_code="EC003"), True, True),
+    (JainamApiException("Try again", error_code="EC003"), False, False),
+    (JainamApiException("Bad gateway", status_code=502), True, True),
+    (JainamApiException("Not found", status_code=404), True, False),
+    (JainamValidationError("Bad quantity", error_code="EC904", status_code=500), True, False),
+    (JainamAuthError("Session Expired", error_code="EC087"), True, False),
+])
+def test_is_retriable(error, idempotent, expected):
+    assert is_retriable(error, idempotent) is expected
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    
+    delay = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert 25 <= delay <= 30
+
+
+def test_next_delay_grows_exponentially_within_jitter():
+    backoff = Backoff(base=0.1, cap=100, max_attempts=10, budget=1000)
+    error = JainamNetworkError("Timed out")
+    started = time.monotonic()
+    
+    for attempt in range(5):
+        delay = backoff.next_delay(attempt, error, started)
+        assert 0.1 * 2 ** attempt * 0.5 <= delay <= 0.1 * 2 ** attempt * 1.5
+
+
+def test_next_delay_is_capped():
+    backoff = Backoff(base=1, cap=2, max_attempts=10, budget=1000)
+    delay = backoff.next_delay(6, JainamNetworkError("Timed out"), time.monotonic())
+    assert delay <= 2 * 1.5
+
+
+def test_next_delay_uses_retry_after():
+    error = JainamRateLimitError("Too many requests")
+    error.retry_after = 4.0
+    assert Backoff().next_delay(0, error, time.monotonic()) == 4.0
+
+
+def test_next_delay_gives_up():
+    error = JainamNetworkError("Timed out")
+    started = time.monotonic()
+    
+    # Out of attempts
+    assert Backoff(max_attempts=3).next_delay(2, error, started) is None
+    assert Backoff(max_attempts=1).next_delay(0, error, started) is None
+    # Not retriable
+    assert Backoff().next_delay(0, error, started, idempotent=False) is None
+    # Sleeping would exceed the time budget
+    assert Backoff(base=5, budget=1).next_delay(0, error, started) is None
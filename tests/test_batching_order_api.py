@@ -0,0 +1,112 @@
+"""
+Test batched order placement
+
+Offline tests against a stub client; no session or network access is
+needed, and no orders are placed.
+
+Functions tested:
+- BatchingOrderAPI.place_order_async(): Batch concurrent orders
+- BatchingOrderAPI.place_market_order(): Sync batching from threads
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from jainam_api_client import urls
+from jainam_api_client.api.batching_order_api import BatchingOrderAPI
+from jainam_api_client.exceptions import JainamApiException, JainamNetworkError
+
+
+INSTRUMENT_IDS = ("22", "14366", "2885")
+
+
+class StubClient:
+    """
+    AsyncRestClient stand-in for the place order endpoint.
+    
+    Answers each POST with one result per order (or the first
+    results_per_batch of them), or raises error if set.
+    """
+    
+    def __init__(self, error=None, results_per_batch=None):
+        self.error = error
+        self.results_per_batch = results_per_batch
+        self.batches = []
+    
+    async def post(self, endpoint, orders, invalidate=()):
+        assert endpoint == urls.PLACE_ORDER
+        self.batches.append(orders)
+        if self.error is not None:
+            raise self.error
+        results = [{"brokerOrderId": order["instrumentId"]} for order in orders]
+        return {"status": "Ok", "result": results[:self.results_per_batch]}
+    
+    async def close(self):
+        pass
+
+
+async def place_all(batcher):
+    """Place one market order per INSTRUMENT_IDS entry concurrently."""
+    try:
+        return await asyncio.gather(*[
+            batcher.place_order_async("NSE", iid, "BUY", 1, order_type="MARKET")
+            for iid in INSTRUMENT_IDS
+        ], return_exceptions=True)
+    finally:
+        await batcher.aclose()
+
+
+def test_concurrent_orders_share_one_request():
+    """Each caller gets its own result, wrapped like a single order response."""
+    client = StubClient()
+    
+    responses = asyncio.run(place_all(BatchingOrderAPI(client)))
+    
+    assert len(client.batches) == 1
+    assert [order["instrumentId"] for order in client.batches[0]] == list(INSTRUMENT_IDS)
+    assert responses == [
+        {"status": "Ok", "result": [{"brokerOrderId": iid}]} for iid in INSTRUMENT_IDS
+    ]
+
+
+def test_max_batch_splits_requests():
+    client = StubClient()
+    
+    responses = asyncio.run(place_all(BatchingOrderAPI(client, max_batch=2)))
+    
+    assert [len(batch) for batch in client.batches] == [2, 1]
+    assert [r["result"][0]["brokerOrderId"] for r in responses] == list(INSTRUMENT_IDS)
+
+
+def test_failed_request_fails_every_order():
+    error = JainamNetworkError("Timed out")
+    
+    responses = asyncio.run(place_all(BatchingOrderAPI(StubClient(error=error))))
+    
+    assert responses == [error] * len(INSTRUMENT_IDS)
+
+
+def test_missing_result_fails_only_that_order():
+    client = StubClient(results_per_batch=2)
+    
+    responses = asyncio.run(place_all(BatchingOrderAPI(client)))
+    
+    assert [r["result"][0]["brokerOrderId"] for r in responses[:2]] == list(INSTRUMENT_IDS[:2])
+    assert isinstance(responses[2], JainamApiException)
+
+
+def test_sync_orders_from_threads():
+    client = StubClient()
+    batcher = BatchingOrderAPI(client)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(INSTRUMENT_IDS)) as executor:
+            responses = list(executor.map(
+                lambda iid: batcher.place_market_order("NSE", iid, "BUY", 1),
+                INSTRUMENT_IDS,
+            ))
+    finally:
+        batcher.close()
+    
+    assert [r["result"][0]["brokerOrderId"] for r in responses] == list(INSTRUMENT_IDS)
+    assert sum(len(batch) for batch in client.batches) == len(INSTRUMENT_IDS)
@@ -0,0 +1,39 @@
+"""
+Test browser login helpers
+
+Offline tests; no browser, session or network access is needed (Selenium
+must be installed, as for the login itself).
+
+Functions tested:
+- _query_param(): Read a parameter from the login redirect URL
+"""
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("pyotp")
+
+from tests.utils.browser_login import _query_param
+
+
+REDIRECT = "https://example.com/callback"
+
+
+@pytest.mark.parametrize("url, expected", [
+    (f"{REDIRECT}?authCode=abc&userId=RAI03", "abc"),
+    (f"{REDIRECT}?userId=RAI03&authCode=abc", "abc"),
+    # Only the first comma-separated value is used
+    (f"{REDIRECT}?authCode=abc,def", "abc"),
+    # Values and names are percent/plus decoded
+    (f"{REDIRECT}?authCode=a%2Bb+c", "a+b c"),
+    (f"{REDIRECT}?auth%43ode=abc", "abc"),
+    # Blank occurrences are skipped, as parse_qs does
+    (f"{REDIRECT}?authCode=&authCode=abc", "abc"),
+    (f"{REDIRECT}?authCode=", ""),
+    # Names must match exactly; the fragment is not part of the query
+    (f"{REDIRECT}?xauthCode=abc", ""),
+    (f"{REDIRECT}?userId=RAI03#authCode=abc", ""),
+    (REDIRECT, ""),
+])
+def test_query_param(url, expected):
+    assert _query_param(url, "authCode") == expected
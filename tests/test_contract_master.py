@@ -0,0 +1,100 @@
+"""
+Test contract master parsing
+
+Offline tests against the sample payloads in docs/json-collection; no
+session or network access is needed.
+
+Functions tested:
+- ContractMasterAPI._to_dataframe(): Build a DataFrame from JSON bytes
+- ContractMasterAPI._stream_dataframe(): Build one incrementally (low_memory)
+- ContractMasterAPI.search_symbol(): Substring and regex symbol search
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from jainam_api_client.api.contract_master_api import ContractMasterAPI, HAS_IJSON, HAS_PYARROW
+from jainam_api_client.rest import RestClient
+
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "docs" / "json-collection"
+
+# INDICES is one pretty-printed {"INDICES": [...]} object, BCD a top-level
+# array of records
+SAMPLES = ("INDICES", "BCD")
+
+
+def read_sample(name: str) -> bytes:
+    """Read a sample contract master payload."""
+    return (SAMPLES_DIR / f"{name}.json").read_bytes()
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_to_dataframe_matches_json_loads(name):
+    """_to_dataframe gives the same frame as pd.DataFrame(json.loads(...))."""
+    content = read_sample(name)
+    expected = pd.DataFrame(json.loads(content))
+    
+    df = ContractMasterAPI._to_dataframe(content)
+    
+    assert df.shape == expected.shape
+    assert list(df.columns) == list(expected.columns)
+
+
+def test_to_dataframe_indices_shape():
+    """The {"INDICES": [...]} object is not mistaken for NDJSON."""
+    assert ContractMasterAPI._to_dataframe(read_sample("INDICES")).shape == (115, 1)
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="NDJSON is parsed with pyarrow")
+def test_to_dataframe_ndjson():
+    """Newline-delimited records give one row per line."""
+    records = json.loads(read_sample("BCD"))
+    content = b"\n".join(json.dumps(record).encode() for record in records)
+    
+    df = ContractMasterAPI._to_dataframe(content)
+    
+    assert df.shape == pd.DataFrame(records).shape
+
+
+@pytest.mark.skipif(not HAS_IJSON, reason="ijson is not installed")
+@pytest.mark.parametrize("name", SAMPLES)
+def test_stream_dataframe_matches_to_dataframe(name):
+    """The low_memory path gives the same frame as the default one."""
+    content = read_sample(name)
+    
+    with ContractMasterAPI._open_json_stream(io.BytesIO(content)) as f:
+        df = ContractMasterAPI._stream_dataframe(f)
+    
+    assert df.shape == ContractMasterAPI._to_dataframe(content).shape
+
+
+SYMBOLS = ["NIFTY", "BANKNIFTY", "FINNIFTY", "NIFTYNXT50", "RELIANCE", None]
+
+
+@pytest.fixture
+def contracts(monkeypatch):
+    """ContractMasterAPI serving a small in-memory NSE master."""
+    api = ContractMasterAPI(RestClient(download_cache_dir=None))
+    df = pd.DataFrame({"symbol": SYMBOLS})
+    monkeypatch.setattr(ContractMasterAPI, "get_contract_master_df", lambda self, exchange: df)
+    return api
+
+
+@pytest.mark.parametrize("symbol, expected", [
+    # Plain text: case-insensitive substring
+    ("nifty", ["NIFTY", "BANKNIFTY", "FINNIFTY", "NIFTYNXT50"]),
+    ("RELI", ["RELIANCE"]),
+    ("TCS", []),
+    # Patterns keep their regex meaning
+    ("^NIFTY", ["NIFTY", "NIFTYNXT50"]),
+    ("BANK|FIN", ["BANKNIFTY", "FINNIFTY"]),
+    ("nifty$", ["NIFTY", "BANKNIFTY", "FINNIFTY"]),
+])
+def test_search_symbol(contracts, symbol, expected):
+    """Matches pd.Series.str.contains(symbol, case=False)."""
+    assert list(contracts.search_symbol("NSE", symbol)["symbol"]) == expected
@@ -10,38 +10,21 @@ This script:
 WARNING: This will place REAL orders on your account!
 """
 
+import asyncio
 import os
 import sys
-import json
-import time
 from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv()
+from tests.utils.output_logger import OutputLogger, write_json
 
 # Output file
 OUTPUT_FILE = Path(__file__).parent / "order_test_output.txt"
 
 
-class OutputLogger:
-    """Logger that writes to both console and file."""
-    
-    def __init__(self):
-        self.lines = []
-    
-    def log(self, message=""):
-        print(message)
-        self.lines.append(message)
-    
-    def save(self, filepath):
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(self.lines))
-
-
 def load_session(logger):
     """Load session from JSON file."""
     from jainam_api_client import SessionManager
@@ -132,8 +115,14 @@ def place_nfo_order(api, logger):
         return {"error": str(e)}, None, order_params
 
 
-def check_order_status(api, broker_order_id, logger):
-    """Check order status from order book."""
+async def check_order_status(sm, broker_order_id, logger):
+    """
+    Check order status from order book.
+    
+    Funds/limits are refreshed during the wait for the order to be
+    processed, and returned alongside the order book.
+    """
+    from jainam_api_client.async_jainam_api import AsyncJainamAPI
     
     logger.log("")
     logger.log("=" * 70)
@@ -147,14 +136,26 @@ def check_order_status(api, broker_order_id, logger):
     logger.log(f"Looking for Order ID: {broker_order_id}")
     logger.log("-" * 70)
     
-    # Wait a moment for order to be processed
-    logger.log("Waiting 2 seconds for order processing...")
-    time.sleep(2)
+    async with AsyncJainamAPI(access_token=sm.access_token) as api:
+        # Fetch limits while waiting a moment for the order to be processed
+        limits_task = asyncio.ensure_future(api.limits())
+        logger.log("Waiting 2 seconds for order processing...")
+        await asyncio.sleep(2)
+        
+        # Get order book
+        response, limits = await asyncio.gather(
+            api.order_report(), limits_task, return_exceptions=True
+        )
+    
+    if isinstance(limits, Exception):
+        logger.log(f"[WARNING] Could not refresh limits: {limits}")
+        limits = None
+    
+    if isinstance(response, Exception):
+        logger.log(f"[ERROR] {type(response).__name__}: {response}")
+        return {"error": str(response), "limits": limits}
     
     try:
-        # Get order book
-        response = api.order_report()
-        
         status = response.get("status", "Unknown")
         logger.log(f"Order Book Status: {status}")
         
@@ -163,11 +164,8 @@ def check_order_status(api, broker_order_id, logger):
             logger.log(f"Total Orders in Book: {len(orders) if orders else 0}")
             
             # Find our order
-            our_order = None
-            for order in (orders or []):
-                if order.get("brokerOrderId") == broker_order_id:
-                    our_order = order
-                    break
+            orders_by_id = {order.get("brokerOrderId"): order for order in (orders or [])}
+            our_order = orders_by_id.get(broker_order_id)
             
             if our_order:
                 logger.log("")
@@ -183,15 +181,15 @@ def check_order_status(api, broker_order_id, logger):
                 logger.log(f"  Avg Traded Price: {our_order.get('averageTradedPrice', 'N/A')}")
                 logger.log(f"  Order Time:       {our_order.get('orderTime', 'N/A')}")
                 logger.log(f"  Rejection Reason: {our_order.get('rejectionReason', 'N/A')}")
-                return {"order_book": response, "our_order": our_order}
+                return {"order_book": response, "our_order": our_order, "limits": limits}
             else:
                 logger.log(f"[WARNING] Order {broker_order_id} not found in order book")
         
-        return {"order_book": response, "our_order": None}
+        return {"order_book": response, "our_order": None, "limits": limits}
         
     except Exception as e:
         logger.log(f"[ERROR] {type(e).__name__}: {e}")
-        return {"error": str(e)}
+        return {"error": str(e), "limits": limits}
 
 
 def save_raw_responses(sm, order_params, place_response, status_response, logger):
@@ -205,14 +203,14 @@ def save_raw_responses(sm, order_params, place_response, status_response, logger
     logger.log("")
     logger.log(">>> PLACE ORDER RESPONSE <<<")
     logger.log("-" * 40)
-    logger.log(json.dumps(place_response, indent=2, default=str))
+    logger.log_json(place_response)
     
     if status_response:
         logger.log("")
         logger.log(">>> ORDER STATUS (from Order Book) <<<")
         logger.log("-" * 40)
         if status_response.get("our_order"):
-            logger.log(json.dumps(status_response["our_order"], indent=2, default=str))
+            logger.log_json(status_response["our_order"])
         else:
             logger.log("Order not found in order book")
         
@@ -220,19 +218,19 @@ def save_raw_responses(sm, order_params, place_response, status_response, logger
         logger.log(">>> FULL ORDER BOOK RESPONSE <<<")
         logger.log("-" * 40)
         if status_response.get("order_book"):
-            logger.log(json.dumps(status_response["order_book"], indent=2, default=str))
+            logger.log_json(status_response["order_book"])
     
     # Save JSON file
     json_file = Path(__file__).parent / "order_test_results.json"
     with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump({
+        write_json({
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "user_id": sm.user_id,
             "checksum": sm.checksum,
             "order_params": order_params,
             "place_order_response": place_response,
             "order_status_response": status_response
-        }, f, indent=2, default=str)
+        }, f)
     
     logger.log("")
     logger.log(f"JSON saved to: {json_file}")
@@ -241,6 +239,10 @@ def save_raw_responses(sm, order_params, place_response, status_response, logger
 def main():
     logger = OutputLogger()
     
+    # Deferred until the script actually runs
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     logger.log("#" * 70)
     logger.log("# NFO ORDER TEST")
     logger.log(f"# {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -269,7 +271,7 @@ def main():
     place_response, broker_order_id, order_params = place_nfo_order(api, logger)
     
     # Step 2: Check order status
-    status_response = check_order_status(api, broker_order_id, logger)
+    status_response = asyncio.run(check_order_status(sm, broker_order_id, logger))
     
     # Save all raw responses
     save_raw_responses(sm, order_params, place_response, status_response, logger)
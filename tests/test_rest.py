@@ -0,0 +1,153 @@
+"""
+Test REST client internals
+
+Offline tests; no session or network access is needed.
+
+Functions tested:
+- ResponseCache: TTL expiry and generation-based invalidation
+- RestClient.download() / download_stream(): ETag caching and 304 handling
+"""
+
+import io
+import time
+
+import pytest
+
+from jainam_api_client.rest import ResponseCache, RestClient
+
+
+URL = "https://example.com/contracts/NSE.json"
+BODY = b'[{"symbol": "NIFTY"}]'
+
+
+def test_response_cache_get_set():
+    cache = ResponseCache()
+    key = ResponseCache.key("orders", {"b": 2, "a": 1})
+    
+    assert key == ResponseCache.key("orders", {"a": 1, "b": 2})
+    assert cache.get(key) is None
+    
+    cache.set(key, {"status": "Ok"}, ttl=60)
+    assert cache.get(key) == {"status": "Ok"}
+
+
+def test_response_cache_expiry():
+    cache = ResponseCache()
+    key = ResponseCache.key("orders")
+    
+    cache.set(key, {"status": "Ok"}, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get(key) is None
+
+
+def test_response_cache_invalidate_endpoints():
+    cache = ResponseCache()
+    orders, profile = ResponseCache.key("orders"), ResponseCache.key("profile")
+    cache.set(orders, {"status": "Ok"}, ttl=60)
+    cache.set(profile, {"status": "Ok"}, ttl=60)
+    
+    cache.invalidate(["orders"])
+    assert cache.get(orders) is None
+    assert cache.get(profile) is not None
+    
+    cache.invalidate()
+    assert cache.get(profile) is None
+
+
+def test_response_cache_drops_responses_from_older_generation():
+    """A response fetched before an invalidate() is not stored."""
+    cache = ResponseCache()
+    key = ResponseCache.key("orders")
+    
+    generation = cache.generation
+    cache.invalidate(["orders"])
+    cache.set(key, {"status": "stale"}, ttl=60, generation=generation)
+    assert cache.get(key) is None
+    
+    cache.set(key, {"status": "Ok"}, ttl=60, generation=cache.generation)
+    assert cache.get(key) == {"status": "Ok"}
+
+
+class StubResponse:
+    """Minimal requests.Response stand-in for download tests."""
+    
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+        self.raw = io.BytesIO(body)
+    
+    def raise_for_status(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+class StubSession:
+    """
+    Serves BODY with an ETag, answering 304 to a matching If-None-Match.
+    
+    Records the headers of every request.
+    """
+    
+    def __init__(self):
+        self.requests = []
+    
+    def get(self, url, headers=None, stream=False, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return StubResponse(304)
+        return StubResponse(200, BODY, {"ETag": '"v1"'})
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = RestClient(download_cache_dir=tmp_path)
+    client.session = StubSession()
+    return client
+
+
+def remove_body_after_validation(client, monkeypatch):
+    """
+    Make the cached body disappear right after its validators are read.
+    
+    Returns:
+        Path of the cached body
+    """
+    client.download(URL)
+    body_path = client._cache_files(URL)[0]
+    conditional_headers = client._conditional_headers
+    
+    def headers_then_remove_body(url):
+        headers = conditional_headers(url)
+        body_path.unlink()
+        return headers
+    
+    monkeypatch.setattr(client, "_conditional_headers", headers_then_remove_body)
+    return body_path
+
+
+def test_download_revalidates_cached_body(client):
+    assert client.download(URL) == BODY
+    assert client.download(URL) == BODY
+    
+    assert client.session.requests == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_download_refetches_when_cached_body_disappears(client, monkeypatch):
+    """A 304 whose cached body was removed meanwhile falls back to a plain GET."""
+    body_path = remove_body_after_validation(client, monkeypatch)
+    
+    assert client.download(URL) == BODY
+    assert client.session.requests[1:] == [{"If-None-Match": '"v1"'}, {}]
+    # The refetched body is cached again
+    assert body_path.read_bytes() == BODY
+
+
+def test_download_stream_refetches_when_cached_body_disappears(client, monkeypatch):
+    remove_body_after_validation(client, monkeypatch)
+    
+    with client.download_stream(URL) as raw:
+        assert raw.read() == BODY
@@ -7,20 +7,30 @@ Functions tested:
 - create_websocket_session(): Create WebSocket session
 - subscribe(): Subscribe to market data
 - unsubscribe(): Unsubscribe from market data
+- translate_tick(): Rename feed message keys (offline, no session needed)
 
 Note: WebSocket tests require a stable connection and may timeout
 if the market is closed or connection issues occur.
 """
 
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 from jainam_api_client import JainamAPI
-from tests.test_auth import get_authenticated_api
+from jainam_api_client.websocket import WS_FIELD_MAPPING, translate_tick
+from jainam_api_client.settings import (
+    WS_RESP_TICK_ACK,
+    WS_RESP_TICK_FEED,
+    WS_RESP_DEPTH_ACK,
+    WS_RESP_DEPTH_FEED,
+)
 
 
 # Test instruments for subscription
@@ -29,6 +39,44 @@ TEST_INSTRUMENTS = [
     {"exchange": "NSE", "token": "26009"},  # NIFTY BANK
 ]
 
+# Maximum seconds to wait for the first message of a feed
+DATA_TIMEOUT = 3
+
+# Set by on_message when the first tick / depth message arrives, so the
+# subscribe tests stop waiting as soon as there is data
+tick_received = threading.Event()
+depth_received = threading.Event()
+
+
+def on_message(message):
+    """WebSocket callback recording which feeds have sent data."""
+    msg_type = message.get("t")
+    if msg_type in (WS_RESP_TICK_ACK, WS_RESP_TICK_FEED):
+        tick_received.set()
+    elif msg_type in (WS_RESP_DEPTH_ACK, WS_RESP_DEPTH_FEED):
+        depth_received.set()
+
+
+@pytest.fixture(scope="module")
+def api(api):
+    """The shared client, connected with on_message recording feed data."""
+    api.on_message = on_message
+    ws = api.connect_websocket()
+    # Also covers a socket opened earlier without the callback
+    ws.on_message = on_message
+    yield api
+    ws.on_message = api.on_message = None
+
+
+def get_authenticated_api():
+    """Get an API client for the saved session, or None if there is none."""
+    from jainam_api_client import SessionManager
+    
+    sm = SessionManager()
+    if not sm.load_session() or not sm.is_session_valid():
+        return None
+    return sm.get_api_client()
+
 
 def test_create_websocket_session(api: JainamAPI):
     """Test WebSocket session creation."""
@@ -60,6 +108,8 @@ def test_subscribe(api: JainamAPI):
         print("SKIPPED: No authenticated API instance")
         return None
     
+    tick_received.clear()
+    response = None
     try:
         # Subscribe to tick data
         response = api.subscribe(
@@ -69,15 +119,16 @@ def test_subscribe(api: JainamAPI):
         print(f"SUCCESS: Subscribed to tick data")
         print(f"  Instruments: {TEST_INSTRUMENTS}")
         print(f"  Response: {response}")
-        
-        # Wait a bit to receive some data
-        print("\n  Waiting 3 seconds for data...")
-        time.sleep(3)
-        
-        return response
     except Exception as e:
         print(f"ERROR: {type(e).__name__}: {e}")
-        return None
+    
+    # Wait for the first tick (or the subscription ack)
+    print(f"\n  Waiting up to {DATA_TIMEOUT} seconds for data...")
+    received = tick_received.wait(DATA_TIMEOUT)
+    print("  Data received" if received else "  No data received")
+    assert received, f"No tick data within {DATA_TIMEOUT}s"
+    
+    return response
 
 
 def test_subscribe_depth(api: JainamAPI):
@@ -90,6 +141,8 @@ def test_subscribe_depth(api: JainamAPI):
         print("SKIPPED: No authenticated API instance")
         return None
     
+    depth_received.clear()
+    response = None
     try:
         # Subscribe to depth data
         response = api.subscribe(
@@ -98,15 +151,16 @@ def test_subscribe_depth(api: JainamAPI):
         )
         print(f"SUCCESS: Subscribed to depth data")
         print(f"  Response: {response}")
-        
-        # Wait a bit to receive some data
-        print("\n  Waiting 3 seconds for depth data...")
-        time.sleep(3)
-        
-        return response
     except Exception as e:
         print(f"ERROR: {type(e).__name__}: {e}")
-        return None
+    
+    # Wait for the first depth message (or the subscription ack)
+    print(f"\n  Waiting up to {DATA_TIMEOUT} seconds for depth data...")
+    received = depth_received.wait(DATA_TIMEOUT)
+    print("  Depth data received" if received else "  No depth data received")
+    assert received, f"No depth data within {DATA_TIMEOUT}s"
+    
+    return response
 
 
 def test_unsubscribe(api: JainamAPI):
@@ -157,6 +211,36 @@ def test_unsubscribe_depth(api: JainamAPI):
         return None
 
 
+def test_translate_tick():
+    """Short feed keys are renamed; unknown keys are kept."""
+    message = {"t": "tf", "e": "NSE", "tk": "26000", "lp": "22150.5", "bp1": "22150", "zz": 1}
+    
+    assert translate_tick(message) == {
+        "type": "tf",
+        "exchange": "NSE",
+        "token": "26000",
+        "ltp": "22150.5",
+        "bid_price_1": "22150",
+        "zz": 1,
+    }
+    # The input is left as it was
+    assert "lp" in message
+
+
+def test_field_mapping_is_read_only():
+    with pytest.raises(TypeError):
+        WS_FIELD_MAPPING["lp"] = "last_price"
+
+
+def run_test(test, api: JainamAPI):
+    """Run a test outside pytest, reporting a failed assertion instead of raising it."""
+    try:
+        return test(api)
+    except AssertionError as e:
+        print(f"FAILED: {test.__name__}: {e}")
+        return None
+
+
 if __name__ == "__main__":
     print("\n" + "#" * 60)
     print("# JAINAM LITE API SDK - WebSocket Tests")
@@ -173,17 +257,18 @@ if __name__ == "__main__":
         # Test create WebSocket session
         test_create_websocket_session(api)
         
-        # Test subscribe to tick data
-        test_subscribe(api)
-        
-        # Test subscribe to depth data
-        test_subscribe_depth(api)
-        
-        # Test unsubscribe from tick
-        test_unsubscribe(api)
+        api.on_message = on_message
+        # Connect once up front rather than from both subscribe threads
+        api.connect_websocket()
         
-        # Test unsubscribe from depth
-        test_unsubscribe_depth(api)
+        # Tick and depth feeds are independent, so each pair of tests
+        # runs side by side and waits for data together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Test subscribe to tick and depth data
+            list(executor.map(lambda test: run_test(test, api), (test_subscribe, test_subscribe_depth)))
+            
+            # Test unsubscribe from tick and depth
+            list(executor.map(lambda test: run_test(test, api), (test_unsubscribe, test_unsubscribe_depth)))
         
         # Logout
         api.logout()
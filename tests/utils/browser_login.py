@@ -10,11 +10,19 @@ Uses Selenium + ChromeDriver to automate:
 NOTE: This is for TESTING purposes only - not part of the public SDK.
 """
 
+import atexit
 import os
+import queue
+import shutil
+import socket
 import sys
+import tempfile
 import time
-from typing import Tuple
-from urllib.parse import urlparse, parse_qs
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import unquote_plus
 
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -26,70 +34,274 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 
+from tests.utils.session_cache import load_valid_session
 
-def get_auth_code_via_browser(
-    user_id: str,
-    password: str,
-    totp_secret: str,
-    app_code: str,
-    headless: bool = False,
-    timeout: int = 60
-) -> Tuple[str, str]:
+
+def get_chromedriver_service() -> Service:
     """
-    Automate browser login to get authCode and userId.
+    Get the chromedriver service for the login browser.
     
-    Args:
-        user_id: Jainam user ID (e.g., RAI03)
-        password: Jainam account password
-        totp_secret: TOTP secret key for generating OTP
-        app_code: Application code for vendor login
-        headless: Run browser in headless mode (default: False)
-        timeout: Max wait time in seconds (default: 60)
-        
-    Returns:
-        Tuple of (auth_code, user_id) extracted from redirect URL
+    JAINAM_CHROMEDRIVER_PATH selects a specific chromedriver; otherwise
+    Selenium Manager (Selenium 4.11+) finds one matching the installed
+    Chrome, downloading it into ~/.cache/selenium on first use.
     """
-    # Setup Chrome options
+    return Service(executable_path=os.getenv("JAINAM_CHROMEDRIVER_PATH"))
+
+
+# Requests the login form does not need; stylesheets are still loaded,
+# since the visibility/clickability waits depend on layout
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff", "*.woff2", "*.ttf"]
+
+# Persistent Chrome profile, so the login page's scripts and styles stay
+# in Chrome's HTTP and code caches between runs. Cookies are cleared on
+# every login, so no session carries over. A browser started while another
+# one has the profile open gets a temporary profile instead.
+CHROME_PROFILE_DIR = Path(
+    os.getenv("JAINAM_CHROME_PROFILE", Path.home() / ".cache" / "jainam" / "chrome-profile")
+)
+
+# Profiles of the BrowserLoginPool browsers, one per slot - Chrome will not
+# open one profile directory in two browsers at once
+POOL_PROFILES_DIR = CHROME_PROFILE_DIR.parent / "profiles"
+
+# Chrome subsystems the login never uses (sync, translate, background
+# networking, audio, first-run setup...), turned off to cut startup time
+# and memory
+CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=520,1080",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints",
+)
+
+# A Chrome started with --remote-debugging-port=9222 is attached to by
+# reuse_driver=True logins instead of launching a new browser
+CHROME_DEBUGGER_ADDRESS = os.getenv("CHROME_DEBUGGER_ADDRESS", "127.0.0.1:9222")
+
+# Browser kept alive between logins when reuse_driver=True
+_DRIVER_SINGLETON = None
+
+
+def _debugger_listening(address: str) -> bool:
+    """Check whether a Chrome remote debugging port is open."""
+    host, _, port = address.rpartition(":")
+    try:
+        socket.create_connection((host, int(port)), timeout=0.2).close()
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def _headless(headless: Optional[bool]) -> bool:
+    """Resolve a headless argument; None means headless unless JAINAM_SELENIUM_HEADED=1."""
+    if headless is None:
+        return os.getenv("JAINAM_SELENIUM_HEADED") != "1"
+    return headless
+
+
+def _chrome_options(headless: Optional[bool], profile_dir) -> Options:
+    """Build the options for a launched Chrome using profile_dir."""
     chrome_options = Options()
-    if headless:
+    if _headless(headless):
         chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=520,1080")
-    chrome_options.add_argument("--disable-extensions")
+    for arg in CHROME_ARGS:
+        chrome_options.add_argument(arg)
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_options.add_argument("--profile-directory=Default")
     chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    
-    # Initialize driver
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # Return from driver.get() at DOMContentLoaded; each step waits for
+    # its own element
+    chrome_options.page_load_strategy = "eager"
+    return chrome_options
+
+
+def _create_driver(headless: Optional[bool], timeout: int, profile_dir: Path = CHROME_PROFILE_DIR):
+    """Start a new Chrome browser."""
     print("Starting Chrome browser...")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        driver = webdriver.Chrome(
+            service=get_chromedriver_service(),
+            options=_chrome_options(headless, profile_dir),
+        )
+    except SessionNotCreatedException:
+        # Chrome will not open a profile that another browser (e.g. a
+        # login running in another process) is using; fall back to a
+        # throwaway profile, without the persistent profile's caches
+        tmp_profile = tempfile.mkdtemp(prefix="jainam-chrome-")
+        atexit.register(shutil.rmtree, tmp_profile, ignore_errors=True)
+        print(f"  Profile {profile_dir} is in use, using temporary profile {tmp_profile}")
+        driver = webdriver.Chrome(
+            service=get_chromedriver_service(),
+            options=_chrome_options(headless, tmp_profile),
+        )
+    return _prepare_driver(driver, timeout)
+
+
+def _attach_driver(address: str, timeout: int):
+    """Attach to a running Chrome's remote debugging port."""
+    chrome_options = Options()
+    chrome_options.add_experimental_option("debuggerAddress", address)
+    
+    print(f"Attaching to Chrome at {address}...")
+    driver = webdriver.Chrome(service=get_chromedriver_service(), options=chrome_options)
+    return _prepare_driver(driver, timeout)
+
+
+def _prepare_driver(driver, timeout: int):
+    """Block unneeded requests and clear cookies in a new driver's browser."""
     driver.set_page_load_timeout(timeout)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    return driver
+
+
+def _get_shared_driver(headless: Optional[bool], timeout: int):
+    """Get the reusable browser, starting it on first use."""
+    global _DRIVER_SINGLETON
+    
+    if _DRIVER_SINGLETON is None:
+        if _debugger_listening(CHROME_DEBUGGER_ADDRESS):
+            _DRIVER_SINGLETON = _attach_driver(CHROME_DEBUGGER_ADDRESS, timeout)
+        else:
+            _DRIVER_SINGLETON = _create_driver(headless, timeout)
+            # Only quit a browser we launched ourselves
+            atexit.register(_DRIVER_SINGLETON.quit)
+    else:
+        # Start from a clean session instead of a new browser; the HTTP
+        # cache is kept, like the profile's
+        print("Reusing Chrome browser...")
+        _DRIVER_SINGLETON.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    return _DRIVER_SINGLETON
+
+
+# Sets an input's value in one call instead of a send_keys round trip per
+# character. The prototype's setter is used so frameworks that track the
+# value (e.g. React) see the change, and input/change events are fired
+# as if the user had typed it.
+_FILL_SCRIPT = """
+const el = arguments[0];
+Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+def fast_fill(driver, element, value: str):
+    """Replace an input's value, firing input/change events."""
+    driver.execute_script(_FILL_SCRIPT, element, value)
+
+
+def _fresh_totp(totp: pyotp.TOTP, min_validity: float = 5) -> str:
+    """Get the current TOTP code, waiting for the next one if it is about to expire."""
+    remaining = totp.interval - time.time() % totp.interval
+    if remaining < min_validity:
+        print(f"  TOTP about to expire, waiting {remaining:.1f}s for the next one...")
+        time.sleep(remaining + 0.5)
+    return totp.now()
+
+
+def _query_param(url: str, key: str) -> str:
+    """
+    Get the first comma-separated value of a URL query parameter.
+    
+    Scans for the one key instead of building a parse_qs() mapping of
+    every parameter. As with parse_qs(), blank occurrences are skipped,
+    so "?authCode=&authCode=abc" gives "abc".
+    
+    Returns:
+        Decoded value, or "" if the parameter is missing or blank
+    """
+    query = url.partition("?")[2].partition("#")[0]
+    for part in query.split("&"):
+        name, _, value = part.partition("=")
+        if value and unquote_plus(name) == key:
+            return unquote_plus(value.split(",", 1)[0])
+    return ""
+
+
+def _wait_for_step(driver, wait, input_id: str, button_id: str):
+    """
+    Wait for a login step's input, then get it and its Continue button.
+    
+    The button is fetched in the same script call as the input rather than
+    with a wait of its own. Waiting on the button first would not work:
+    it may stay disabled until the input is filled in.
     
+    Raises:
+        TimeoutException: If either element does not appear in time
+    """
+    wait.until(EC.visibility_of_element_located((By.ID, input_id)))
+    field, button = driver.execute_script(
+        "return [document.getElementById(arguments[0]), document.getElementById(arguments[1])];",
+        input_id,
+        button_id,
+    )
+    if field is None or button is None:
+        raise TimeoutException(f"#{input_id} / #{button_id} not found")
+    return field, button
+
+
+def _login_in_browser(
+    driver,
+    user_id: str,
+    password: str,
+    totp_secret: str,
+    app_code: str,
+    timeout: int
+) -> Tuple[str, str]:
+    """Run the SSO login steps in an open browser and return (auth_code, user_id)."""
     try:
         # Navigate to SSO login
         login_url = f"https://protrade.jainam.in/?appcode={app_code}"
         print(f"Navigating to: {login_url}")
         driver.get(login_url)
         
-        wait = WebDriverWait(driver, timeout)
-        
-        # Wait for page to fully load
-        time.sleep(3)
+        # Steps wait for their own elements instead of fixed sleeps,
+        # polling well below the default 500ms
+        wait = WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        )
         
         # Step 1: Enter User ID
         print("Step 1: Entering User ID...")
         try:
-            user_input = wait.until(EC.presence_of_element_located((By.ID, "user")))
-            user_input.clear()
-            user_input.send_keys(user_id)
+            user_input, continue_btn = _wait_for_step(driver, wait, "user", "user_con_btn")
+            fast_fill(driver, user_input, user_id)
             print(f"  Entered: {user_id}")
             
             # Click Continue
-            continue_btn = wait.until(EC.element_to_be_clickable((By.ID, "user_con_btn")))
             continue_btn.click()
             print("  Clicked Continue")
         except TimeoutException:
@@ -99,18 +311,14 @@ def get_auth_code_via_browser(
             user_input.send_keys(user_id)
             driver.find_element(By.CSS_SELECTOR, "button").click()
         
-        time.sleep(2)
-        
         # Step 2: Enter Password
         print("Step 2: Entering Password...")
         try:
-            password_input = wait.until(EC.presence_of_element_located((By.ID, "passcode")))
-            password_input.clear()
-            password_input.send_keys(password)
+            password_input, pass_continue_btn = _wait_for_step(driver, wait, "passcode", "pass_con_btn")
+            fast_fill(driver, password_input, password)
             print("  Entered password")
             
             # Click Continue
-            pass_continue_btn = wait.until(EC.element_to_be_clickable((By.ID, "pass_con_btn")))
             pass_continue_btn.click()
             print("  Clicked Continue")
         except TimeoutException:
@@ -119,54 +327,45 @@ def get_auth_code_via_browser(
             password_input.send_keys(password)
             driver.find_element(By.CSS_SELECTOR, "button").click()
         
-        time.sleep(2)
-        
         # Step 3: Enter TOTP
         print("Step 3: Entering TOTP...")
         
-        # Generate TOTP
+        # Generated once the field is ready, so the earlier steps do not
+        # use up the code's validity window
         totp = pyotp.TOTP(totp_secret)
-        otp_code = totp.now()
-        print(f"  Generated TOTP: {otp_code}")
         
         try:
-            totp_input = wait.until(EC.presence_of_element_located((By.ID, "totp_input")))
-            totp_input.clear()
-            totp_input.send_keys(otp_code)
+            totp_input, totp_continue_btn = _wait_for_step(driver, wait, "totp_input", "totp_con_btn")
+            otp_code = _fresh_totp(totp)
+            print(f"  Generated TOTP: {otp_code}")
+            fast_fill(driver, totp_input, otp_code)
             print("  Entered TOTP")
             
             # Click Continue
-            totp_continue_btn = wait.until(EC.element_to_be_clickable((By.ID, "totp_con_btn")))
             totp_continue_btn.click()
             print("  Clicked Continue")
         except TimeoutException:
             print("  Trying alternate selector...")
             totp_input = driver.find_element(By.CSS_SELECTOR, "input[inputmode='numeric']")
+            otp_code = _fresh_totp(totp)
+            print(f"  Generated TOTP: {otp_code}")
             totp_input.send_keys(otp_code)
             driver.find_element(By.CSS_SELECTOR, "button").click()
         
         # Wait for redirect with authCode in URL
         print("Step 4: Waiting for redirect...")
         
-        def url_contains_authcode(d):
-            return "authCode" in d.current_url
-        
-        wait.until(url_contains_authcode)
+        def authcode_url(d):
+            # Return the URL itself, saving a second current_url call
+            url = d.current_url
+            return url if "authCode" in url else False
         
-        redirect_url = driver.current_url
+        redirect_url = wait.until(authcode_url)
         print(f"  Redirect URL obtained!")
         
         # Parse authCode and userId from URL
-        parsed = urlparse(redirect_url)
-        params = parse_qs(parsed.query)
-        
-        auth_code = params.get('authCode', [''])[0]
-        if ',' in auth_code:
-            auth_code = auth_code.split(',')[0]
-            
-        user_id_from_url = params.get('userId', [''])[0]
-        if ',' in user_id_from_url:
-            user_id_from_url = user_id_from_url.split(',')[0]
+        auth_code = _query_param(redirect_url, 'authCode')
+        user_id_from_url = _query_param(redirect_url, 'userId')
         
         print(f"\n[OK] Login successful!")
         print(f"     authCode: {auth_code}")
@@ -176,20 +375,160 @@ def get_auth_code_via_browser(
         
     except Exception as e:
         print(f"\n[FAIL] Error during login: {e}")
-        # Take screenshot for debugging
-        try:
-            driver.save_screenshot("login_error.png")
-            print("  Screenshot saved to login_error.png")
-        except:
-            pass
+        # Opt-in, since encoding and writing the PNG slows down every
+        # failure; the name is unique so concurrent logins do not
+        # overwrite each other's screenshots
+        if os.getenv("JAINAM_DEBUG_SCREENSHOT"):
+            screenshot = f"login_error_{uuid.uuid4().hex}.png"
+            try:
+                driver.save_screenshot(screenshot)
+                print(f"  Screenshot saved to {screenshot}")
+            except:
+                pass
         raise
+
+
+def get_auth_code_via_browser(
+    user_id: str,
+    password: str,
+    totp_secret: str,
+    app_code: str,
+    headless: Optional[bool] = None,
+    timeout: int = 60,
+    reuse_driver: bool = False
+) -> Tuple[str, str]:
+    """
+    Automate browser login to get authCode and userId.
+    
+    With reuse_driver=True the browser is kept open after login and reused
+    (with cookies cleared) by the next reuse_driver=True call,
+    saving the Chrome startup; it is closed when the process exits. The
+    headless setting of the first such call applies to all of them. If a
+    Chrome is listening on CHROME_DEBUGGER_ADDRESS, it is attached to
+    instead, and left running.
+    
+    Args:
+        user_id: Jainam user ID (e.g., RAI03)
+        password: Jainam account password
+        totp_secret: TOTP secret key for generating OTP
+        app_code: Application code for vendor login
+        headless: Run browser in headless mode (default: headless unless
+            JAINAM_SELENIUM_HEADED=1)
+        timeout: Max wait time in seconds (default: 60)
+        reuse_driver: Keep the browser open for later logins (default: False)
         
+    Returns:
+        Tuple of (auth_code, user_id) extracted from redirect URL
+    """
+    if reuse_driver:
+        driver = _get_shared_driver(headless, timeout)
+    else:
+        driver = _create_driver(headless, timeout)
+    
+    try:
+        return _login_in_browser(driver, user_id, password, totp_secret, app_code, timeout)
     finally:
-        driver.quit()
-        print("Browser closed.")
+        if not reuse_driver:
+            driver.quit()
+            print("Browser closed.")
 
 
-def get_auth_code_from_env(headless: bool = False) -> Tuple[str, str]:
+class BrowserLoginPool:
+    """
+    Pool of open browsers for logging in several accounts concurrently.
+    
+    The browsers are started (in parallel) when the pool is created, and
+    each login takes a free one, so N logins cost roughly one login's time
+    instead of N. Each browser has its own profile under POOL_PROFILES_DIR,
+    and cookies are cleared before every login.
+    
+    Usage:
+        >>> with BrowserLoginPool(size=2) as pool:
+        ...     futures = [pool.login(**creds) for creds in accounts]
+        ...     results = [f.result() for f in futures]  # (auth_code, user_id)
+    """
+    
+    __slots__ = ("timeout", "_drivers", "_idle", "_executor")
+    
+    def __init__(self, size: int = 2, headless: Optional[bool] = None, timeout: int = 60):
+        """
+        Initialize BrowserLoginPool.
+        
+        Args:
+            size: Number of browsers, i.e. concurrent logins
+            headless: Run the browsers in headless mode (default: headless
+                unless JAINAM_SELENIUM_HEADED=1)
+            timeout: Max wait time in seconds per login step (default: 60)
+        """
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="jainam-login")
+        
+        starts = [
+            self._executor.submit(_create_driver, headless, timeout, POOL_PROFILES_DIR / f"slot{i}")
+            for i in range(size)
+        ]
+        self._drivers = []
+        errors = []
+        for start in starts:
+            try:
+                self._drivers.append(start.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            self.close()
+            raise errors[0]
+        
+        self._idle = queue.Queue()
+        for driver in self._drivers:
+            self._idle.put(driver)
+    
+    def login(
+        self,
+        user_id: str,
+        password: str,
+        totp_secret: str,
+        app_code: str
+    ) -> Future:
+        """
+        Log in on the next free browser.
+        
+        Args:
+            user_id: Jainam user ID (e.g., RAI03)
+            password: Jainam account password
+            totp_secret: TOTP secret key for generating OTP
+            app_code: Application code for vendor login
+            
+        Returns:
+            Future resolving to (auth_code, user_id)
+        """
+        return self._executor.submit(self._login, user_id, password, totp_secret, app_code)
+    
+    def _login(self, user_id: str, password: str, totp_secret: str, app_code: str) -> Tuple[str, str]:
+        driver = self._idle.get()
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            return _login_in_browser(driver, user_id, password, totp_secret, app_code, self.timeout)
+        finally:
+            self._idle.put(driver)
+    
+    def __enter__(self) -> "BrowserLoginPool":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Wait for running logins, then close the browsers."""
+        self._executor.shutdown(wait=True)
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers = []
+
+
+def get_auth_code_from_env(headless: Optional[bool] = None) -> Tuple[str, str]:
     """
     Get authCode using credentials from environment variables.
     
@@ -202,8 +541,9 @@ def get_auth_code_from_env(headless: bool = False) -> Tuple[str, str]:
     Returns:
         Tuple of (auth_code, user_id)
     """
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Shared with interactive_login(), so .env is read once per process
+    from jainam_api_client.session import _load_dotenv_once
+    _load_dotenv_once()
     
     user_id = os.getenv("JAINAM_USER_ID")
     password = os.getenv("JAINAM_USER_PASSWORD")
@@ -227,10 +567,15 @@ def get_auth_code_from_env(headless: bool = False) -> Tuple[str, str]:
     )
 
 
-def auto_login_and_cache() -> 'SessionManager':
+def auto_login_and_cache(force_login: bool = False) -> 'SessionManager':
     """
     Automatically login via browser and cache the session.
     
+    The browser is only started if there is no valid cached session.
+    
+    Args:
+        force_login: Log in via browser even if the cached session is valid
+        
     Returns:
         SessionManager with valid session
     """
@@ -240,8 +585,14 @@ def auto_login_and_cache() -> 'SessionManager':
     print("JAINAM AUTO LOGIN (Selenium)")
     print("=" * 60)
     
+    if not force_login:
+        sm = load_valid_session()
+        if sm is not None:
+            print(f"[OK] Using cached session from: {sm.session_file}")
+            return sm
+    
     # Get authCode via browser automation
-    auth_code, user_id = get_auth_code_from_env(headless=False)
+    auth_code, user_id = get_auth_code_from_env()
     
     # Login with SessionManager
     print("\nCaching session...")
@@ -0,0 +1,87 @@
+"""
+Console + file logger shared by the test scripts.
+
+NOTE: This is for TESTING purposes only - not part of the public SDK.
+"""
+
+import io
+import json
+import shutil
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(obj, out, indent=True):
+    """
+    Write obj as JSON to a text stream, using orjson when installed.
+    
+    Values JSON cannot represent are written as str(value).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        out.write(orjson.dumps(obj, default=str, option=option).decode())
+    else:
+        json.dump(obj, out, indent=2 if indent else None, default=str)
+
+
+class OutputLogger:
+    """
+    Logger that writes to both console and file.
+    
+    With a filepath, lines are streamed to the file (line buffered) as they
+    are logged, so the file is complete up to a crash. Without one, they
+    are kept in memory until save(filepath) - for scripts that may exit
+    before producing any output worth keeping.
+    """
+    
+    __slots__ = ("_fh", "_path", "_buffer")
+    
+    def __init__(self, filepath=None):
+        self._path = filepath
+        self._fh = None
+        self._buffer = None
+        if filepath is not None:
+            self._fh = open(filepath, 'w', encoding='utf-8', buffering=1)
+        else:
+            self._buffer = io.StringIO()
+    
+    def _out(self):
+        return self._fh if self._fh is not None else self._buffer
+    
+    def log(self, message=""):
+        print(message)
+        out = self._out()
+        out.write(message)
+        out.write('\n')
+    
+    def log_json(self, obj):
+        """Log obj as indented JSON."""
+        for out in (sys.stdout, self._out()):
+            write_json(obj, out)
+            out.write('\n')
+    
+    def save(self, filepath=None):
+        """
+        Close the output file, or write buffered lines to filepath.
+        
+        Raises:
+            ValueError: If lines are buffered and no filepath is given
+        """
+        if self._fh is not None:
+            if not self._fh.closed:
+                self._fh.close()
+            return
+        
+        if filepath is None:
+            raise ValueError("OutputLogger was created without a filepath; pass one to save()")
+        
+        # Copied in 1MB chunks rather than as one getvalue() string
+        self._buffer.seek(0)
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            shutil.copyfileobj(self._buffer, f, 1 << 20)
@@ -0,0 +1,36 @@
+"""
+Saved session lookup shared by the test scripts.
+
+NOTE: This is for TESTING purposes only - not part of the public SDK.
+"""
+
+from typing import Callable, Optional
+
+
+def load_valid_session(log: Callable[[str], None] = print) -> Optional['SessionManager']:
+    """
+    Load the cached session if it has not expired and the API accepts it.
+    
+    Args:
+        log: Called with a message when the cached session is rejected
+        
+    Returns:
+        SessionManager with the cached session, or None
+    """
+    from jainam_api_client import SessionManager
+    from jainam_api_client.session import SESSION_MAX_AGE_HOURS
+    
+    sm = SessionManager()
+    if not sm.load_session(max_age_hours=SESSION_MAX_AGE_HOURS) or not sm.is_session_valid():
+        return None
+    
+    # A cheap call to catch tokens revoked before their expiry
+    try:
+        response = sm.get_api_client().profile()
+    except Exception as e:
+        log(f"Cached session rejected: {e}")
+        return None
+    if response.get("status") != "Ok":
+        log(f"Cached session rejected: {response.get('message')}")
+        return None
+    return sm